@@ -0,0 +1,133 @@
+# Persisted MowingDevice snapshots for a warm start after a plugin restart.
+#
+# After a restart it takes tens of seconds (login, MQTT bind, report priming, area
+# names) before live data arrives. The plugin saves a compact copy of each mower's
+# model (report data, location, work, firmware, area names and plans; no map
+# geometry) whenever it refreshes, and at deviceStartComm publishes the saved copy,
+# marked stale, until live data replaces it.
+#
+# One JSON file per Indigo device id. Writes are atomic (temp file + rename), skipped
+# when nothing changed, and at most one per `min_interval` seconds per device. The
+# interval and the dirty flag (mark_dirty, set when the model is updated) are checked
+# before the model is compacted and serialized, so most refreshes cost nothing here.
+
+import hashlib
+import logging
+import os
+import time
+
+import orjson
+
+from pymammotion.data.model.device import MowingDevice
+
+SNAPSHOT_VERSION = 1
+SAVE_MIN_INTERVAL_SEC = 60.0
+
+
+class Snapshot:
+    __slots__ = ("mower_name", "device", "saved_at")
+
+    def __init__(self, mower_name, device, saved_at):
+        self.mower_name = mower_name
+        self.device = device  # MowingDevice rebuilt from the file
+        self.saved_at = saved_at  # wall time
+
+
+def compact(mowing_device):
+    """The parts of a MowingDevice worth restoring, as a dict MowingDevice.from_dict accepts."""
+    map_obj = mowing_device.map
+    return {
+        "name": mowing_device.name,
+        "mower_state": mowing_device.mower_state.to_dict(),
+        "location": mowing_device.location.to_dict(),
+        "report_data": mowing_device.report_data.to_dict(),
+        "work": mowing_device.work.to_dict(),
+        "device_firmwares": mowing_device.device_firmwares.to_dict(),
+        "map": {
+            "area_name": [area.to_dict() for area in map_obj.area_name],
+            "plan": {plan_id: plan.to_dict() for plan_id, plan in map_obj.plan.items()},
+        },
+    }
+
+
+class SnapshotStore:
+    def __init__(self, directory, logger=None, min_interval=SAVE_MIN_INTERVAL_SEC, clock=time.monotonic):
+        self.directory = directory
+        self.logger = logger or logging.getLogger("Plugin.SnapshotStore")
+        self.min_interval = min_interval
+        self._clock = clock
+        self._saved = {}  # dev_id -> (digest, monotonic time of the write)
+        self._dirty = set()  # dev_ids whose model changed since the last save
+        self.writes = 0
+        self.skipped = 0
+
+    def _path(self, dev_id):
+        return os.path.join(self.directory, f"{int(dev_id)}.json")
+
+    def mark_dirty(self, dev_id):
+        """Note that the device's model changed, so the next save() may write."""
+        self._dirty.add(dev_id)
+
+    def save(self, dev_id, mower_name, mowing_device, force=False):
+        """Write the device's snapshot if it changed and the last write is old enough."""
+        previous = self._saved.get(dev_id)
+        now = self._clock()
+        if previous is not None and not force and (
+            dev_id not in self._dirty or now - previous[1] < self.min_interval
+        ):
+            self.skipped += 1
+            return False
+        try:
+            body = orjson.dumps(compact(mowing_device), option=orjson.OPT_NON_STR_KEYS)
+        except Exception as ex:
+            self.logger.debug(f"Snapshot of dev {dev_id} not serializable: {ex}")
+            return False
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if previous is not None and previous[0] == digest:
+            self._dirty.discard(dev_id)
+            self.skipped += 1
+            return False
+        document = b'{"version":%d,"mower_name":%s,"saved_at":%f,"device":%s}' % (
+            SNAPSHOT_VERSION, orjson.dumps(mower_name), time.time(), body
+        )
+        path = self._path(dev_id)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(document)
+            os.replace(tmp, path)
+        except OSError as ex:
+            self.logger.debug(f"Snapshot write for dev {dev_id} failed: {ex}")
+            return False
+        self._saved[dev_id] = (digest, now)
+        self._dirty.discard(dev_id)
+        self.writes += 1
+        return True
+
+    def load(self, dev_id):
+        """Return the saved Snapshot for dev_id, or None if there is none (or it is unreadable)."""
+        try:
+            with open(self._path(dev_id), "rb") as fh:
+                document = orjson.loads(fh.read())
+            if document.get("version") != SNAPSHOT_VERSION:
+                return None
+            return Snapshot(
+                document.get("mower_name"),
+                MowingDevice.from_dict(document["device"]),
+                float(document.get("saved_at", 0.0)),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            # A snapshot from an older model layout is just ignored
+            self.logger.debug(f"Snapshot for dev {dev_id} not loaded: {ex}")
+            return None
+
+    def delete(self, dev_id):
+        self._saved.pop(dev_id, None)
+        self._dirty.discard(dev_id)
+        try:
+            os.remove(self._path(dev_id))
+        except OSError:
+            pass
@@ -0,0 +1,158 @@
+# Logging handler that forwards plugin records to the Indigo Event Log.
+#
+# indigo.server.log is an IPC round trip to the Indigo server. Calling it from the
+# thread that logs (the asyncio loop, LinkKit and paho MQTT threads) stalls that
+# thread for every line, which is worst exactly when debug logging is turned on to
+# chase a problem. IndigoLogHandler.emit only queues the record; a daemon worker
+# thread formats it and talks to Indigo. DebugRateLimitFilter thins out debug
+# lines from call sites that fire many times a second.
+#
+# Benchmark: tools/log_handler_benchmark.py at the repository root.
+
+try:
+    import indigo
+except ImportError:
+    indigo = None
+
+import copy
+import logging
+import queue
+import threading
+import time
+import traceback
+from os import path
+
+DEBUG_BURST = 20  # debug lines let through per call site ...
+DEBUG_INTERVAL = 10.0  # ... per this many seconds
+QUEUE_SIZE = 10000  # records waiting for the worker before new ones are dropped
+
+
+class DebugRateLimitFilter(logging.Filter):
+    """
+    Let at most `burst` DEBUG (and lower) records per `interval` seconds through for each
+    call site (file + line). The first record after a throttled window carries
+    record.suppressed = <number dropped>, so the log shows that lines were skipped.
+    INFO and above always pass.
+    """
+
+    def __init__(self, burst=DEBUG_BURST, interval=DEBUG_INTERVAL, clock=time.monotonic):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._clock = clock
+        self._sites = {}  # (pathname, lineno) -> [window_start, passed, suppressed]
+        # Records are filtered on whichever thread logs them (loop, LinkKit, paho)
+        self._lock = threading.Lock()
+        self.suppressed_total = 0
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            now = self._clock()
+            site = self._sites.get(key)
+            if site is None:
+                self._sites[key] = [now, 1, 0]
+                return True
+            if now - site[0] >= self.interval:
+                if site[2]:
+                    record.suppressed = site[2]
+                site[0], site[1], site[2] = now, 1, 0
+                return True
+            if site[1] < self.burst:
+                site[1] += 1
+                return True
+            site[2] += 1
+            self.suppressed_total += 1
+            return False
+
+
+class IndigoLogHandler(logging.Handler):
+    def __init__(self, display_name, level=logging.NOTSET, server_log=None, queue_size=QUEUE_SIZE):
+        super().__init__(level)
+        self.displayName = display_name
+        self._server_log = server_log
+        self._queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._worker = threading.Thread(target=self._drain, name="IndigoLogHandler", daemon=True)
+        self._worker.start()
+
+    def emit(self, record):
+        # Runs on the logging thread: snapshot the message and hand off, never block
+        try:
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def _drain(self):
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            self.write(record)
+
+    def flush(self, timeout=2.0):
+        """Wait (bounded) until every queued record has been written."""
+        deadline = time.monotonic() + timeout
+        while not self._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self):
+        if self._worker.is_alive():
+            try:
+                self._queue.put(None, timeout=1.0)
+                self._worker.join(timeout=2.0)
+            except Exception:
+                pass
+        super().close()
+
+    def _log(self, message, is_error, levelno):
+        server_log = self._server_log or indigo.server.log
+        server_log(message=message, type=self.displayName, isError=is_error, level=levelno)
+
+    def write(self, record):
+        """Format one record and send it to the Indigo Event Log (worker thread)."""
+        logmessage = ""
+        is_error = False
+        levelno = getattr(record, "levelno", logging.INFO)
+        try:
+            if self.level <= levelno:
+                is_exception = record.exc_info is not None
+                if levelno == 5 or levelno == logging.DEBUG:
+                    logmessage = "({}:{}:{}): {}".format(path.basename(record.pathname), record.funcName, record.lineno, record.getMessage())
+                elif levelno == logging.INFO:
+                    logmessage = record.getMessage()
+                elif levelno == logging.WARNING:
+                    logmessage = record.getMessage()
+                elif levelno == logging.ERROR:
+                    logmessage = "({}: Function: {}  line: {}):    Error :  Message : {}".format(path.basename(record.pathname), record.funcName, record.lineno, record.getMessage())
+                    is_error = True
+                suppressed = getattr(record, "suppressed", 0)
+                if suppressed:
+                    logmessage = f"{logmessage}  [{suppressed} similar debug lines suppressed]"
+
+                if is_exception:
+                    logmessage = "({}: Function: {}  line: {}):    Exception :  Message : {}".format(path.basename(record.pathname), record.funcName, record.lineno, record.getMessage())
+                    self._log(logmessage, is_error, levelno)
+                    etype, value, tb = record.exc_info
+                    tb_string = "".join(traceback.format_tb(tb))
+                    self._log(f"Traceback:\n{tb_string}", is_error, levelno)
+                    # Formatted from the record: the worker thread has no "current" exception
+                    exc_string = "".join(traceback.format_exception(etype, value, tb, limit=30))
+                    self._log(f"Error in plugin execution:\n\n{exc_string}", is_error, levelno)
+                    self._log(f"\nExc_info: {record.exc_info} \nExc_Text: {record.exc_text} \nStack_info: {record.stack_info}", is_error, levelno)
+                    return
+
+                self._log(logmessage, is_error, levelno)
+        except Exception as ex:
+            try:
+                self._log(f"Error in Logging: {ex}", True, logging.ERROR)
+            except Exception:
+                pass
+
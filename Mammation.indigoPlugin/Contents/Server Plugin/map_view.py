@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from typing import Any, Dict
 
 import indigo
@@ -14,11 +15,26 @@ def setup_map_routes(app: web.Application, plugin: "Plugin") -> None:
       - GET /map/{dev_id}         -> HTML page with Leaflet viewer
       - GET /map/{dev_id}/geojson -> GeoJSON for mower map (areas/paths/obstacles)
       - GET /map/{dev_id}/mowpath -> GeoJSON for current/last mowing path (if available)
+      - GET /map/{dev_id}/track   -> LineString of recorded positions (?since=<epoch s>|?hours=<n>, default today)
+      - GET /metrics              -> Prometheus text (see plugin_metrics)
     """
 
+    from pymammotion.utility.compressed_json import EncodedBodyCache, negotiate_encoding
+
+    # Serialized and gzip/brotli-compressed GeoJSON bodies, per map revision
+    map_bodies = EncodedBodyCache(maxsize=16)
+
     async def _json_error(msg: str, status: int = 400) -> web.Response:
         return web.json_response({"ok": False, "error": msg}, status=status)
 
+    async def _json_body_response(request: web.Request, key, build) -> web.Response:
+        encoding = negotiate_encoding(request.headers.get("Accept-Encoding"))
+        body = await map_bodies.aget(key, encoding, build)
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
     async def _get_device_and_mgr(dev_id: int):
         dev = indigo.devices.get(dev_id)
         mgr = plugin._mgr.get(dev_id)
@@ -158,8 +174,9 @@ def setup_map_routes(app: web.Application, plugin: "Plugin") -> None:
                 # Fallback: build a state manager view from device.state if needed
                 state_mgr = MowerStateManager(device)
 
-            geo = state_mgr.generate_geojson(rtk, dock)
-            return web.json_response(geo)
+            key = ("geojson", dev_id, mowing_device.map.revision, rtk.latitude, rtk.longitude,
+                   dock.latitude, dock.longitude, dock.rotation)
+            return await _json_body_response(request, key, lambda: state_mgr.cached_geojson(rtk, dock))
         except Exception as ex:
             plugin.logger.debug(f"map_geojson failed for dev_id={dev_id}: {ex}")
             return await _json_error(str(ex), 500)
@@ -188,12 +205,44 @@ def setup_map_routes(app: web.Application, plugin: "Plugin") -> None:
             if not isinstance(state_mgr, MowerStateManager):
                 state_mgr = MowerStateManager(device)
 
-            geo = state_mgr.generate_mowing_geojson(rtk)
-            return web.json_response(geo)
+            key = ("mowpath", dev_id, mowing_device.map.revision, rtk.latitude, rtk.longitude)
+            return await _json_body_response(request, key, lambda: state_mgr.cached_mowing_geojson(rtk))
         except Exception as ex:
             plugin.logger.debug(f"map_mowpath failed for dev_id={dev_id}: {ex}")
             return await _json_error(str(ex), 500)
 
+    async def map_track(request: web.Request) -> web.Response:
+        """Positions recorded since ?since=<epoch s>, the last ?hours=<n>, or local midnight."""
+        try:
+            dev_id = int(request.match_info["dev_id"])
+            if "since" in request.query:
+                since = float(request.query["since"])
+            elif "hours" in request.query:
+                since = time.time() - float(request.query["hours"]) * 3600
+            else:
+                now = time.localtime()
+                since = time.mktime((now.tm_year, now.tm_mon, now.tm_mday, 0, 0, 0, 0, 0, -1))
+        except ValueError:
+            return await _json_error("invalid dev_id or since/hours", 400)
+
+        dev, mgr, device = await _get_device_and_mgr(dev_id)
+        if not dev or not mgr or not device:
+            return await _json_error("device not ready", 404)
+
+        history = getattr(getattr(device, "state_manager", None), "position_history", None)
+        rtk = getattr(getattr(mgr.mower(device.name), "location", None), "RTK", None)
+        if history is None or not rtk:
+            return await _json_error("position history not available yet", 503)
+        return web.json_response(history.geojson(rtk.latitude, rtk.longitude, since=since))
+
+    async def metrics(request: web.Request) -> web.Response:
+        import plugin_metrics
+
+        text = plugin_metrics.render(plugin)
+        return web.Response(body=text.encode("utf-8"), headers={"Content-Type": plugin_metrics.CONTENT_TYPE})
+
     app.router.add_get("/map/{dev_id}", map_page)
     app.router.add_get("/map/{dev_id}/geojson", map_geojson)
-    app.router.add_get("/map/{dev_id}/mowpath", map_mowpath)
\ No newline at end of file
+    app.router.add_get("/map/{dev_id}/mowpath", map_mowpath)
+    app.router.add_get("/map/{dev_id}/track", map_track)
+    app.router.add_get("/metrics", metrics)
\ No newline at end of file
@@ -16,12 +16,16 @@ import logging.handlers
 import os
 import platform
 import sys
-import traceback
-from os import path
 
 # PyMammotion imports (Cloud + MQTT orchestrated via Mammotion manager)
 
 from pymammotion.mammotion.devices.mammotion import Mammotion
+from task_supervisor import TaskSupervisor
+from indigo_log_handler import DebugRateLimitFilter, IndigoLogHandler
+from waypoint_frames import WaypointFrames
+from device_snapshot import SnapshotStore
+from plugin_metrics import REFRESH_SECONDS
+from pymammotion.utility.metrics import timed
 try:
     # HA uses this path
     from pymammotion.utility.constant.device_constant import WorkMode
@@ -32,42 +36,6 @@ except Exception:
 STATUS_INTERVAL_SEC = 15.0
 AREA_REQ_COOLDOWN_SEC = 600  # 10 minutes between explicit area-name fetch attempts
 
-class IndigoLogHandler(logging.Handler):
-    def __init__(self, display_name, level=logging.NOTSET):
-        super().__init__(level)
-        self.displayName = display_name
-
-    def emit(self, record):
-        logmessage = ""
-        is_error = False
-        levelno = getattr(record, "levelno", logging.INFO)
-        try:
-            if self.level <= levelno:
-                is_exception = record.exc_info is not None
-                if levelno == 5 or levelno == logging.DEBUG:
-                    logmessage = "({}:{}:{}): {}".format(path.basename(record.pathname), record.funcName, record.lineno, record.getMessage())
-                elif levelno == logging.INFO:
-                    logmessage = record.getMessage()
-                elif levelno == logging.WARNING:
-                    logmessage = record.getMessage()
-                elif levelno == logging.ERROR:
-                    logmessage = "({}: Function: {}  line: {}):    Error :  Message : {}".format(path.basename(record.pathname), record.funcName, record.lineno, record.getMessage())
-                    is_error = True
-
-                if is_exception:
-                    logmessage = "({}: Function: {}  line: {}):    Exception :  Message : {}".format(path.basename(record.pathname), record.funcName, record.lineno, record.getMessage())
-                    indigo.server.log(message=logmessage, type=self.displayName, isError=is_error, level=levelno)
-                    etype, value, tb = record.exc_info
-                    tb_string = "".join(traceback.format_tb(tb))
-                    indigo.server.log(f"Traceback:\n{tb_string}", type=self.displayName, isError=is_error, level=levelno)
-                    indigo.server.log(f"Error in plugin execution:\n\n{traceback.format_exc(30)}", type=self.displayName, isError=is_error, level=levelno)
-                    indigo.server.log(f"\nExc_info: {record.exc_info} \nExc_Text: {record.exc_text} \nStack_info: {record.stack_info}", type=self.displayName, isError=is_error, level=levelno)
-                    return
-
-                indigo.server.log(message=logmessage, type=self.displayName, isError=is_error, level=levelno)
-        except Exception as ex:
-            indigo.server.log(f"Error in Logging: {ex}", type=self.displayName, isError=True, level=logging.ERROR)
-
 class Plugin(indigo.PluginBase):
     ########################################
     def __init__(self, plugin_id, plugin_display_name, plugin_version, plugin_prefs):
@@ -76,6 +44,7 @@ class Plugin(indigo.PluginBase):
         # Async scaffolding
         self._event_loop = None
         self._async_thread = None
+        self._task_supervisor = None  # TaskSupervisor for every (dev_id, purpose) background job
 
         # Per-device tasks and selected mower names
         self._manager_tasks = {}  # dev.id -> asyncio.Task
@@ -109,7 +78,16 @@ class Plugin(indigo.PluginBase):
         if hasattr(self, "indigo_log_handler") and self.indigo_log_handler:
             self.logger.removeHandler(self.indigo_log_handler)
         self._last_plan_read = {}  # dev_id -> monotonic timestamp
-        self._waypoint_frames = {}  # dev_id -> {transaction_id: {frames: [], total: N}}
+        self._waypoint_frames = WaypointFrames()  # partial cover_path_upload transactions per device
+        # Warm start: last saved MowingDevice per device, published as stale until live data arrives
+        try:
+            snapshot_dir = os.path.join(
+                indigo.server.getInstallFolderPath(), "Preferences", "Plugins", plugin_id, "snapshots"
+            )
+        except Exception:
+            snapshot_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+        self._snapshots = SnapshotStore(snapshot_dir, self.logger)
+        self._stale_snapshots = {}  # dev_id -> device_snapshot.Snapshot
 
         self.logger.setLevel(logging.DEBUG)
         try:
@@ -125,6 +103,8 @@ class Plugin(indigo.PluginBase):
             self.indigo_log_handler = IndigoLogHandler(plugin_display_name, self.logLevel)
             self.indigo_log_handler.setLevel(self.logLevel)
             self.indigo_log_handler.setFormatter(logging.Formatter("%(message)s"))
+            # Chatty debug call sites (MQTT notifications) are thinned out in the Event Log only
+            self.indigo_log_handler.addFilter(DebugRateLimitFilter())
             self.logger.addHandler(self.indigo_log_handler)
         except Exception as exc:
             indigo.server.log(f"Failed to create IndigoLogHandler: {exc}", isError=True)
@@ -134,6 +114,8 @@ class Plugin(indigo.PluginBase):
             self.logger.addHandler(self.plugin_file_handler)
         except Exception as exc:
             self.logger.exception(exc)
+        # Logger level follows the most verbose handler so disabled debug lines cost nothing
+        self.logger.setLevel(min(self.logLevel, self.fileloglevel))
 
         self.logger.info("")
         self.logger.info("{0:=^120}".format(" 🌱 Initializing Mammotion Mower 🚜 "))
@@ -219,7 +201,7 @@ class Plugin(indigo.PluginBase):
             if not cache:
                 # Kick off async fetch and return a placeholder (non-empty ID)
                 if getattr(self, "_event_loop", None):
-                    self._event_loop.call_soon_threadsafe(asyncio.create_task, self._fetch_areas(dev_id))
+                    self._task_supervisor.submit(dev_id, "fetch_areas", lambda: self._fetch_areas(dev_id))
                 return [("fetching", "Fetching areas...")]
             # Build sorted list with safe, non-empty IDs
             items = []
@@ -452,6 +434,7 @@ class Plugin(indigo.PluginBase):
             self.logger.error("PyMammotion not found. Install with: pip install pymammotion")
         self._event_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._event_loop)
+        self._task_supervisor = TaskSupervisor(self._event_loop, self.logger)
         self._async_thread = threading.Thread(target=self._run_async_thread)
         self._async_thread.start()
 
@@ -608,6 +591,9 @@ class Plugin(indigo.PluginBase):
                         except (asyncio.CancelledError, asyncio.TimeoutError):
                             pass
 
+                # Cancel supervised refreshes / commands still queued or running
+                await self._task_supervisor.cancel_all()
+
                 self.logger.info("✅ Async cleanup complete")
                 break
 
@@ -630,6 +616,17 @@ class Plugin(indigo.PluginBase):
         if self._async_thread and self._async_thread.is_alive():
             self.logger.warning("⚠️ Async thread still running after {:.1f}s, forcing shutdown".format(max_wait))
 
+        # Close the MQTT capture file all clients share (only open when recording is enabled)
+        try:
+            from pymammotion.mqtt.recorder import close_shared_recorder
+            close_shared_recorder()
+        except Exception as ex:
+            self.logger.debug(f"MQTT recorder close failed: {ex}")
+
+        # Let the log worker write out what shutdown just logged
+        if getattr(self, "indigo_log_handler", None):
+            self.indigo_log_handler.flush()
+
 
     def _force_refresh_states(self, dev_id: int, delay: float = 0.3, min_interval: float = 0.8):
         """
@@ -663,7 +660,7 @@ class Plugin(indigo.PluginBase):
                 self.logger.exception("force refresh failed")
 
         try:
-            loop.call_soon_threadsafe(asyncio.create_task, _do())
+            self._task_supervisor.submit(dev_id, "forced_refresh", _do)
         except Exception:
             self.logger.exception("schedule force refresh failed")
     ########################################
@@ -711,6 +708,7 @@ class Plugin(indigo.PluginBase):
             self.fileloglevel = int(values_dict.get("showDebugFileLevel", _l.DEBUG))
             self.indigo_log_handler.setLevel(self.logLevel)
             self.plugin_file_handler.setLevel(self.fileloglevel)
+            self.logger.setLevel(min(self.logLevel, self.fileloglevel))
 
             # PyMammotion logger levels + handlers
             try:
@@ -756,6 +754,12 @@ class Plugin(indigo.PluginBase):
             pass
         self._set_basic(dev.id, connected=False, status="Initializing...")
 
+        # Publish what we knew at the last stop while the session logs in and primes reporting
+        snapshot = self._snapshots.load(dev.id)
+        if snapshot is not None and self._event_loop:
+            self._stale_snapshots[dev.id] = snapshot
+            self._task_supervisor.submit(dev.id, "refresh", lambda: self._refresh_states(dev.id))
+
         if self._event_loop:
             def _ensure():
                 if dev.id in self._manager_tasks and not self._manager_tasks[dev.id].done():
@@ -777,10 +781,21 @@ class Plugin(indigo.PluginBase):
                 mt = self._manager_tasks.pop(dev.id, None)
                 if mt and not mt.done():
                     mt.cancel()
+                self._task_supervisor.cancel_device(dev.id)
+                self._waypoint_frames.clear_device(dev.id)
 
             self._event_loop.call_soon_threadsafe(_cancel)
 
-        # Drop the connected manager for this device
+        # Keep the latest model for the next start, then drop the connected manager
+        try:
+            mgr = self._mgr.get(dev.id)
+            name = self._mower_name.get(dev.id)
+            mowing_device = mgr.mower(name) if mgr and name else None
+            if mowing_device is not None:
+                self._snapshots.save(dev.id, name, mowing_device, force=True)
+        except Exception as ex:
+            self.logger.debug(f"Snapshot on stop failed for '{dev.name}': {ex}")
+        self._stale_snapshots.pop(dev.id, None)
         try:
             self._mgr.pop(dev.id, None)
         except Exception:
@@ -789,6 +804,10 @@ class Plugin(indigo.PluginBase):
         self._set_connected(dev.id, False)
         self._set_auth(dev.id, False)
 
+    def deviceDeleted(self, dev):
+        super().deviceDeleted(dev)
+        self._snapshots.delete(dev.id)
+
     ########################################
     # Relay-like control mapping (On = Start; Off = Dock; Toggle)
     def actionControlDevice(self, action, dev):
@@ -823,7 +842,7 @@ class Plugin(indigo.PluginBase):
         if not self._event_loop:
             self.logger.error("Async loop not running.")
             return
-        self._event_loop.call_soon_threadsafe(asyncio.create_task, coro)
+        self._task_supervisor.submit_coro(dev_id, coro)
 
     # ... existing imports and class scaffolding ...
 
@@ -967,24 +986,18 @@ class Plugin(indigo.PluginBase):
         try:
             await mgr.send_command(name, "get_report_cfg")
             try:
-                from pymammotion.proto import RptAct, RptInfoType
-                await self._send_command(
-                    dev_id,
-                    "request_iot_sys",
-                    rpt_act=RptAct.RPT_START,
-                    rpt_info_type=[
-                        RptInfoType.RIT_DEV_STA,
-                        RptInfoType.RIT_DEV_LOCAL,
-                        RptInfoType.RIT_WORK,
-                        RptInfoType.RIT_MAINTAIN,
-                        RptInfoType.RIT_BASESTATION_INFO,
-                        RptInfoType.RIT_VIO,
-                    ],
-                    timeout=10000,
-                    period=3000,
-                    no_change_period=4000,
-                    count=0,
-                )
+                # Stream what the mower's current state needs (full and fast only while working)
+                from pymammotion.utility.report_cadence import ACTIVE, profile_for
+                cadence = self._report_cadence(dev_id)
+                devs = getattr(getattr(mgr.mower(name), "report_data", None), "dev", None)
+                profile = profile_for(
+                    getattr(devs, "sys_status", None), getattr(devs, "charge_state", 0)
+                ) or ACTIVE
+                if cadence is not None:
+                    cadence.invalidate()
+                await self._send_command(dev_id, "request_iot_sys", **profile.command_kwargs())
+                if cadence is not None:
+                    cadence.record_sent(profile)
             except Exception as ex:
                 self.logger.debug(f"request_iot_sys enums failed, trying minimal start: {ex}")
                 await self._send_command(
@@ -995,8 +1008,10 @@ class Plugin(indigo.PluginBase):
                     no_change_period=4000,
                     count=0,
                 )
-            # Give MQTT a tick then refresh so HA-style report_data.* fields populate
-            await asyncio.sleep(1.0)
+            # Refresh once the first report lands so HA-style report_data.* fields are populated
+            sm = self._state_manager(dev_id)
+            if sm is not None:
+                await sm.wait_next_report(timeout=2.0)
             await self._refresh_states(dev_id)
             self._set_status(dev_id, "Telemetry primed")
             self.logger.debug(f"Telemetry primed for '{name}' via get_report_cfg + request_iot_sys")
@@ -1009,68 +1024,22 @@ class Plugin(indigo.PluginBase):
         Avoids racing get_area_name_list so 'work_area' can resolve to a name.
         """
         try:
-            for _ in range(20):
-                await asyncio.sleep(1.0)
-                mowing_device = mgr.mower(mower_name)
-                if not mowing_device:
-                    continue
-                m = getattr(mowing_device, "map", None)
-                names = getattr(m, "area_name", []) if m else []
-                if names and len(names) > 0:
-                    self._schedule_state_refresh(dev_id)
-                    return
-            # No names yet; still refresh once so at least hash shows
-            self._schedule_state_refresh(dev_id)
+            sm = mgr.get_device_by_name(mower_name).state_manager
+            await sm.wait_area_names(timeout=20.0)
         except Exception:
             pass
+        # Names or not (then at least the hash shows), refresh once
+        self._schedule_state_refresh(dev_id)
 
     def _process_waypoint_frames(self, dev_id: int, transaction_id: str, mgr, mower_name: str):
         """
-        Process accumulated waypoint frames into mowing path data.
+        All frames of a waypoint transaction arrived: release it from the accumulator.
+        MowerStateManager keeps the decoded path itself (map.current_mow_path).
         """
         try:
-            if dev_id not in self._waypoint_frames:
-                return
-            if transaction_id not in self._waypoint_frames[dev_id]:
-                return
-
-            trans_data = self._waypoint_frames[dev_id][transaction_id]
-            frames = trans_data['frames']
-
-            # Combine all path packets
-            all_points = []
-            for frame_num in sorted(frames.keys()):
-                frame_data = frames[frame_num]
-                path_packets = frame_data.get('path_packets', [])
-                for packet in path_packets:
-                    # Each packet should have position data
-                    if hasattr(packet, 'x') and hasattr(packet, 'y'):
-                        all_points.append({
-                            'x': getattr(packet, 'x', 0),
-                            'y': getattr(packet, 'y', 0),
-                            'type': getattr(packet, 'type', 0)
-                        })
-
-            if all_points:
-                # Store in the mowing device map
-                md = mgr.mower(mower_name)
-                if md:
-                    if not hasattr(md, 'map'):
-                        md.map = type('obj', (object,), {})()
-
-                    # Store as current_mow_path for the state manager to pick up
-                    if not hasattr(md.map, 'current_mow_path'):
-                        md.map.current_mow_path = []
-
-                    md.map.current_mow_path = all_points
-                    md.map.current_mow_path_index = 0
-                    md.map.current_mow_path_finish = False
-
-                    self.logger.info(f"Processed {len(all_points)} waypoints into mow path")
-
-            # Clean up processed transaction
-            del self._waypoint_frames[dev_id][transaction_id]
-
+            points = self._waypoint_frames.pop(dev_id, transaction_id)
+            if points:
+                self.logger.info(f"Processed {points} waypoints into mow path")
         except Exception as ex:
             self.logger.debug(f"_process_waypoint_frames error: {ex}")
 
@@ -1109,9 +1078,6 @@ class Plugin(indigo.PluginBase):
         except Exception as ex:
             self.logger.debug(f"Enable cloud failed for '{mower_name}': {ex}")
         await asyncio.sleep(1)
-        # Waypoint accumulator
-        if not hasattr(self, "_waypoint_frames"):
-            self._waypoint_frames = {}
         # Bind state_manager.cloud_on_notification_callback so we see ALL LubaMsg notifications
         # Bind state_manager.cloud_on_notification_callback – primary LubaMsg stream
         try:
@@ -1130,9 +1096,11 @@ class Plugin(indigo.PluginBase):
                         self.logger.debug(f"[SM-NOTIFY] unexpected res={res!r}")
                         return
 
-                    self.logger.debug(
-                        f"[SM-NOTIFY] topic={topic}, payload_type={type(payload).__name__}"
-                    )
+                    debug = self._debug_to_indigo()
+                    if debug:
+                        self.logger.debug(
+                            f"[SM-NOTIFY] topic={topic}, payload_type={type(payload).__name__}"
+                        )
 
                     # --- nav → cover_path_upload / waypoints / mow_path ---
                     try:
@@ -1143,10 +1111,11 @@ class Plugin(indigo.PluginBase):
                             current_frame = getattr(cover_path, "current_frame", 0)
                             total_frame = getattr(cover_path, "total_frame", 0)
 
-                            self.logger.debug(
-                                f"📍 cover_path_upload frame {current_frame}/{total_frame}, "
-                                f"transaction_id={transaction_id}"
-                            )
+                            if debug:
+                                self.logger.debug(
+                                    f"📍 cover_path_upload frame {current_frame}/{total_frame}, "
+                                    f"transaction_id={transaction_id}"
+                                )
 
                             path_packets = getattr(cover_path, "path_packets", []) or []
                             if not transaction_id or not total_frame:
@@ -1156,34 +1125,14 @@ class Plugin(indigo.PluginBase):
                                     f"path_packets={len(path_packets)}"
                                 )
                             else:
-                                # Multi-frame accumulation (unchanged from your earlier _cloud_notify)
-                                if dev_id not in self._waypoint_frames:
-                                    self._waypoint_frames[dev_id] = {}
-                                if transaction_id not in self._waypoint_frames[dev_id]:
-                                    self._waypoint_frames[dev_id][transaction_id] = {
-                                        "frames": {},
-                                        "total": total_frame,
-                                        "area": getattr(cover_path, "area", None),
-                                        "data_hash": getattr(cover_path, "data_hash", None),
-                                    }
-
-                                self._waypoint_frames[dev_id][transaction_id]["frames"][
-                                    current_frame
-                                ] = {
-                                    "path_packets": path_packets,
-                                    "time": getattr(cover_path, "time", None),
-                                    "valid_paths": getattr(
-                                        cover_path, "vaild_path_num", 0
-                                    ),
-                                }
+                                complete = self._waypoint_frames.add(dev_id, cover_path)
 
                                 self.logger.info(
                                     f"🌾 Waypoint frame {current_frame}/{total_frame} "
                                     f"for transaction {transaction_id}, packets={len(path_packets)}"
                                 )
 
-                                frames_dict = self._waypoint_frames[dev_id][transaction_id]["frames"]
-                                if len(frames_dict) == total_frame:
+                                if complete:
                                     self.logger.info(
                                         f"✅ All {total_frame} waypoint frames received "
                                         f"for transaction {transaction_id}"
@@ -1252,11 +1201,8 @@ class Plugin(indigo.PluginBase):
                                 )
 
                     def _cloud_error_wrapper(exc):
-                        if self._event_loop and not self._event_loop.is_closed():
-                            asyncio.run_coroutine_threadsafe(
-                                _cloud_error(exc),
-                                self._event_loop,
-                            )
+                        # One relogin attempt at a time; errors arriving meanwhile are coalesced
+                        self._task_supervisor.submit(dev_id, "cloud_error", lambda: _cloud_error(exc))
 
                     cloud.set_error_callback(_cloud_error_wrapper)
             else:
@@ -1288,8 +1234,8 @@ class Plugin(indigo.PluginBase):
                 )
                 if callable(add_sub):
                     try:
-                        add_sub(lambda p: asyncio.run_coroutine_threadsafe(
-                            self._sm_update_properties(dev_id, p), self._event_loop
+                        add_sub(lambda p: self._task_supervisor.submit(
+                            dev_id, "sm_properties", lambda: self._sm_update_properties(dev_id, p)
                         ))
                         self.logger.debug("[SM-bind] properties_callback subscriber attached")
                     except Exception as ex:
@@ -1302,8 +1248,8 @@ class Plugin(indigo.PluginBase):
                 )
                 if callable(add_sub):
                     try:
-                        add_sub(lambda s: asyncio.run_coroutine_threadsafe(
-                            self._sm_update_status(dev_id, s), self._event_loop
+                        add_sub(lambda s: self._task_supervisor.submit(
+                            dev_id, "sm_status", lambda: self._sm_update_status(dev_id, s)
                         ))
                         self.logger.debug("[SM-bind] status_callback subscriber attached")
                     except Exception as ex:
@@ -1316,8 +1262,8 @@ class Plugin(indigo.PluginBase):
                 )
                 if callable(add_sub):
                     try:
-                        add_sub(lambda e: asyncio.run_coroutine_threadsafe(
-                            self._sm_update_event(dev_id, e), self._event_loop
+                        add_sub(lambda e: self._task_supervisor.submit(
+                            dev_id, "sm_event", lambda: self._sm_update_event(dev_id, e)
                         ))
                         self.logger.debug("[SM-bind] device_event_callback subscriber attached")
                     except Exception as ex:
@@ -1368,59 +1314,102 @@ class Plugin(indigo.PluginBase):
             self.logger.debug(f"Area-name request scheduling failed: {ex}")
 
 ###
+    def _debug_to_indigo(self):
+        # The log file defaults to DEBUG, so logger.isEnabledFor(DEBUG) is nearly always true.
+        # Per-notification debug lines are only built when the Event Log itself shows debug.
+        return getattr(self, "logLevel", logging.INFO) <= logging.DEBUG
+
     async def _sm_update_properties(self, dev_id: int, properties):
         """HA-style state_manager properties callback."""
-        try:
-            self.logger.debug(
-                f"[SM] properties_callback fired for dev_id={dev_id}, type={type(properties).__name__}"
-            )
-        except Exception:
-            pass
+        if self._debug_to_indigo():
+            self.logger.debug(f"[SM] properties_callback fired for dev_id={dev_id}, type={type(properties).__name__}")
         self._schedule_state_refresh(dev_id)
 
     async def _sm_update_status(self, dev_id: int, status):
         """HA-style state_manager status callback."""
-        try:
-            self.logger.debug(
-                f"[SM] status_callback fired for dev_id={dev_id}, type={type(status).__name__}"
-            )
-        except Exception:
-            pass
+        if self._debug_to_indigo():
+            self.logger.debug(f"[SM] status_callback fired for dev_id={dev_id}, type={type(status).__name__}")
         self._schedule_state_refresh(dev_id)
 
     async def _sm_update_event(self, dev_id: int, event):
         """HA-style state_manager device_event callback."""
-        try:
-            self.logger.debug(
-                f"[SM] device_event_callback fired for dev_id={dev_id}, type={type(event).__name__}"
-            )
-        except Exception:
-            pass
+        if self._debug_to_indigo():
+            self.logger.debug(f"[SM] device_event_callback fired for dev_id={dev_id}, type={type(event).__name__}")
         self._schedule_state_refresh(dev_id)
 
     # ========== Schedule a safe refresh from callbacks ==========
     def _schedule_state_refresh(self, dev_id: int):
+        # A burst of callbacks collapses into at most one running and one follow-up refresh
         if not self._event_loop:
             return
-        self._event_loop.call_soon_threadsafe(asyncio.create_task, self._refresh_states(dev_id))
+        # Callbacks mean the model changed: the next refresh may save a new snapshot
+        self._snapshots.mark_dirty(dev_id)
+        self._task_supervisor.submit(dev_id, "refresh", lambda: self._refresh_states(dev_id))
 
     # ========== Lightweight periodic: refresh + keep report stream warm ==========
+    def _state_manager(self, dev_id: int):
+        """Return the library MowerStateManager for this device's mower, or None."""
+        try:
+            mgr = self._mgr.get(dev_id)
+            name = self._mower_name.get(dev_id)
+            if mgr and name:
+                return mgr.get_device_by_name(name).state_manager
+        except Exception:
+            pass
+        return None
+
+    def _poll_scheduler(self, dev_id: int):
+        """Return the library PollScheduler for this device's mower, or None."""
+        sm = self._state_manager(dev_id)
+        return sm.poll_scheduler if sm is not None else None
+
+    def _report_cadence(self, dev_id: int):
+        """Return the library ReportCadence for this device's mower, or None."""
+        sm = self._state_manager(dev_id)
+        return sm.report_cadence if sm is not None else None
+
+    def _update_report_cadence(self, dev_id: int, dev_status):
+        """Re-issue request_iot_sys when the mower starts/stops working (see ReportCadence)."""
+        cadence = self._report_cadence(dev_id)
+        if cadence is None or dev_status is None:
+            return
+        profile = cadence.due(getattr(dev_status, "sys_status", None), getattr(dev_status, "charge_state", 0))
+        if profile is not None:
+            self._switch_report_profile(dev_id, cadence, profile)
+
+    def _switch_report_profile(self, dev_id: int, cadence, profile):
+        """Send request_iot_sys for profile in the background and record it on success."""
+        async def _switch():
+            try:
+                await self._send_command(dev_id, "request_iot_sys", **profile.command_kwargs())
+                cadence.record_sent(profile)
+                self.logger.debug(f"Report cadence for dev {dev_id} -> {profile.name} ({profile.period} ms)")
+            except Exception as ex:
+                self.logger.debug(f"Report cadence switch to {profile.name} failed: {ex}")
+
+        self._task_supervisor.submit(dev_id, "report_cadence", _switch)
+
     async def _periodic_status(self, dev_id: int):
-        # Shorter interval while working; otherwise slower. Keep get_report_cfg warm every ~60s.
-        keepalive_counter = 0
+        # Shorter interval while working; otherwise slower. get_report_cfg is only sent when
+        # no report/rapid-state push arrived within ~6 cycles, and everything backs off
+        # exponentially while the mower is offline or not answering.
+        from pymammotion.utility.poll_scheduler import RAPID_STATE, REPORT_DATA
+        sleep_s = 30
         try:
             while not self.stopThread:
-                await self._refresh_states(dev_id)
+                sched = self._poll_scheduler(dev_id)
 
-                keepalive_counter = (keepalive_counter + 1) % 6  # every ~6 cycles
-                if keepalive_counter == 0:
-                    try:
-                        mgr = self._mgr.get(dev_id)
-                        name = self._mower_name.get(dev_id)
-                        if mgr and name:
-                            await self._send_command(dev_id, "get_report_cfg")
-                    except Exception:
-                        pass
+                # Pushes already trigger a refresh; only refresh here if nothing arrived this cycle
+                push_age = sched.last_push(REPORT_DATA, RAPID_STATE) if sched is not None else None
+                if push_age is None or push_age >= sleep_s:
+                    await self._refresh_states(dev_id)
+
+                try:
+                    if sched is not None and sched.should_poll("get_report_cfg", sleep_s * 6, REPORT_DATA, RAPID_STATE):
+                        sched.record_poll("get_report_cfg")
+                        await self._send_command(dev_id, "get_report_cfg")
+                except Exception:
+                    pass
                 # --- NEW: plan sync parity with HA.update() ---
                 try:
                     mgr = self._mgr.get(dev_id)
@@ -1459,12 +1448,15 @@ class Plugin(indigo.PluginBase):
                 # If working, poll faster (like HA WORKING_INTERVAL); otherwise default
                 try:
                     dev = indigo.devices.get(dev_id)
-                    wm = (dev.states.get("state_raw") or "").strip()
                     # crude: treat 'MODE_WORKING' or '19/13' combos as active
                     sleep_s = 5 if ("WORKING" in dev.states.get("work_mode", "")) else 30
                 except Exception:
                     sleep_s = 30
-                await asyncio.sleep(sleep_s)
+                # A backed-off sleep ends early once the mower is heard from again
+                if sched is not None:
+                    await sched.sleep(sleep_s)
+                else:
+                    await asyncio.sleep(sleep_s)
         except asyncio.CancelledError:
             return
 
@@ -1524,6 +1516,7 @@ class Plugin(indigo.PluginBase):
             return None
         return None
 ##
+    @timed(REFRESH_SECONDS)
     async def _refresh_states(self, dev_id: int):
         """
         Update Indigo states and a combined, human-readable status line, e.g.:
@@ -1540,11 +1533,16 @@ class Plugin(indigo.PluginBase):
             return
         name = self._mower_name.get(dev_id)
         mgr = self._mgr.get(dev_id)
+        stale = None
         if not name or not mgr:
-            return
+            # Not connected yet: publish the snapshot saved by the previous run, if any
+            stale = self._stale_snapshots.get(dev_id)
+            if stale is None:
+                return
+            name = stale.mower_name
 
         try:
-            mowing_device = mgr.mower(name)
+            mowing_device = stale.device if stale is not None else mgr.mower(name)
             if mowing_device is None:
                 self._set_status(dev_id, "Waiting for mower data...")
                 self._set_connected(dev_id, True)
@@ -1562,6 +1560,7 @@ class Plugin(indigo.PluginBase):
             mower_state = getattr(mowing_device, "mower_state", None)
             location = getattr(mowing_device, "location", None)
             map_obj = getattr(mowing_device, "map", None)
+            self._update_report_cadence(dev_id, dev_status)
 
             # Presence snapshot
             try:
@@ -1576,7 +1575,7 @@ class Plugin(indigo.PluginBase):
 
             # Connected flag
             try:
-                self._set_connected(dev_id, bool(getattr(mowing_device, "online", True)))
+                self._set_connected(dev_id, stale is None and bool(getattr(mowing_device, "online", True)))
             except Exception:
                 self._set_connected(dev_id, True)
 
@@ -1584,8 +1583,14 @@ class Plugin(indigo.PluginBase):
 
             kv = []
             from datetime import datetime as _dt
-            kv.append({"key": "last_update", "value": _dt.now().strftime("%Y-%m-%d %H:%M:%S")})
-            kv.append({"key": "status_text", "value": "OK"})
+            if stale is None:
+                kv.append({"key": "last_update", "value": _dt.now().strftime("%Y-%m-%d %H:%M:%S")})
+                kv.append({"key": "status_text", "value": "OK"})
+            else:
+                saved = _dt.fromtimestamp(stale.saved_at).strftime("%Y-%m-%d %H:%M:%S")
+                kv.append({"key": "last_update", "value": saved})
+                kv.append({"key": "status_text", "value": f"Stale (saved {saved}), connecting..."})
+            kv.append({"key": "data_stale", "value": stale is not None})
 
             # Work mode / raw
             sys_status = getattr(dev_status, "sys_status", None)
@@ -1852,6 +1857,17 @@ class Plugin(indigo.PluginBase):
             except Exception:
                 self.logger.exception("work area resolution failed")
 
+            # Signed distance to the nearest area edge (positive inside an area), from the
+            # library's zone index; works whether or not the mower is mowing
+            try:
+                if "boundary_distance" in allowed and stale is None:
+                    state_mgr = mgr.get_device_by_name(name).state_manager
+                    _zone, dist = state_mgr.locate_mower()
+                    if dist is not None:
+                        kv.append({"key": "boundary_distance", "value": round(dist, 2)})
+            except Exception as ex:
+                self.logger.debug(f"boundary distance lookup failed: {ex}")
+
             # Summary toggles (basic flags)
             try:
                 if "state_summary" in allowed:
@@ -1974,6 +1990,8 @@ class Plugin(indigo.PluginBase):
                     else:
                         combined = f"Idle, Not Charging (battery {batt_text})"
 
+                if combined and stale is not None:
+                    combined = f"{combined} (stale)"
                 if combined and "status_combined" in allowed:
                     kv.append({"key": "status_combined", "value": combined})
             except Exception:
@@ -1990,6 +2008,11 @@ class Plugin(indigo.PluginBase):
             except Exception:
                 self.logger.exception("updateStatesOnServer failed")
 
+            # Live data replaces the warm-start snapshot and is saved for the next start
+            if stale is None:
+                self._stale_snapshots.pop(dev_id, None)
+                self._snapshots.save(dev_id, name, mowing_device)
+
         except Exception:
             self._set_status(dev_id, "Poll error")
             self.logger.exception("_refresh_states top-level failure")
@@ -2183,6 +2206,13 @@ class Plugin(indigo.PluginBase):
 
             await _do_send()
 
+            # Start/leave-dock/return: full reporting now rather than on the next status report
+            cadence = self._report_cadence(dev_id)
+            if cadence is not None:
+                profile = cadence.command_sent(key)
+                if profile is not None:
+                    self._switch_report_profile(dev_id, cadence, profile)
+
       #      if key not in nosync:
       #          with contextlib.suppress(Exception):
       ##              await mgr.start_sync(name, retry=1)
@@ -2409,7 +2439,7 @@ class Plugin(indigo.PluginBase):
                     except Exception:
                         self.logger.debug("areas_menu: _fetch_areas raised", exc_info=True)
 
-                self._event_loop.call_soon_threadsafe(asyncio.create_task, _do_fetch())
+                self._task_supervisor.submit(dev_id, "fetch_areas", _do_fetch)
         except Exception:
             self.logger.debug("areas_menu: scheduling fetch failed", exc_info=True)
 
@@ -2520,7 +2550,7 @@ class Plugin(indigo.PluginBase):
 
             # Schedule on your loop if present
             if getattr(self, "_event_loop", None):
-                self._event_loop.call_soon_threadsafe(asyncio.create_task, _do())
+                self._task_supervisor.submit(dev.id, "refresh_area_names", _do)
             else:
                 # Fallback: run synchronously if your mgr supports sync (most don’t)
                 self.logger.debug("Async loop not running; area refresh queued but may not execute immediately")
@@ -2889,7 +2919,9 @@ class Plugin(indigo.PluginBase):
                 self.logger.info(f"'{dev.name}' is charging; sending release_from_dock")
                 try:
                     await self._send_command(dev.id, "release_from_dock")
-                    await asyncio.sleep(1.2)
+                    sm = self._state_manager(dev.id)
+                    if sm is not None:
+                        await sm.wait_until(lambda d: not d.report_data.dev.charge_state, timeout=1.2)
                 except Exception:
                     pass
 
@@ -2957,18 +2989,12 @@ class Plugin(indigo.PluginBase):
                 return
 
             # Optional: short wait to observe transition, then quick sync
-            for _ in range(8):
-                await asyncio.sleep(1.0)
-                try:
-                    md = mgr.mower(name)
-                    rd = getattr(md, "report_data", None)
-                    devs = getattr(rd, "dev", None) if rd else None
-                    mode_now = int(getattr(devs, "sys_status", 0)) if devs else 0
-                    if _WM and mode_now == int(_WM.MODE_WORKING):
-                        self.logger.info(f"'{dev.name}' transitioned to WORKING")
-                        break
-                except Exception:
-                    pass
+            try:
+                sm = self._state_manager(dev.id)
+                if _WM and sm is not None and await sm.wait_work_state(int(_WM.MODE_WORKING), timeout=8.0):
+                    self.logger.info(f"'{dev.name}' transitioned to WORKING")
+            except Exception:
+                pass
 
             try:
                 await self._request_quick_sync(dev.id)
@@ -3256,24 +3282,19 @@ class Plugin(indigo.PluginBase):
 
             async def _do():
                 try:
-                    from pymammotion.proto import RptAct, RptInfoType
-                    await self._send_command(
-                        dev.id,
-                        "request_iot_sys",
-                        rpt_act=(RptAct.RPT_STOP if stop else RptAct.RPT_START),
-                        rpt_info_type=[
-                            RptInfoType.RIT_DEV_STA,
-                            RptInfoType.RIT_DEV_LOCAL,
-                            RptInfoType.RIT_WORK,
-                            RptInfoType.RIT_MAINTAIN,
-                            RptInfoType.RIT_BASESTATION_INFO,
-                            RptInfoType.RIT_VIO,
-                        ],
-                        timeout=10000,
-                        period=3000,
-                        no_change_period=4000,
-                        count=0,
-                    )
+                    from pymammotion.proto import RptAct
+                    from pymammotion.utility.report_cadence import ACTIVE
+                    kwargs = ACTIVE.command_kwargs()
+                    if stop:
+                        kwargs["rpt_act"] = RptAct.RPT_STOP
+                    await self._send_command(dev.id, "request_iot_sys", **kwargs)
+                    # Full reporting until the cadence policy next sees the mower idle
+                    cadence = self._report_cadence(dev.id)
+                    if cadence is not None:
+                        if stop:
+                            cadence.suspend()
+                        else:
+                            cadence.record_sent(ACTIVE)
                 except Exception:
                     # Minimal fallback – act only
                     await self._send_command(
@@ -3351,6 +3372,9 @@ class Plugin(indigo.PluginBase):
             self.logger.debug(f"mower_state: {summarize(mower_state)}")
             self.logger.debug(f"mowing_state: {summarize(mowing_state)}")
             self.logger.debug(f"mow_info: {summarize(mow_info)}")
+            limiter = getattr(getattr(mgr.get_device_by_name(name), "cloud_client", None), "invoke_limiter", None)
+            if limiter is not None:
+                self.logger.debug(f"invoke_limiter: {limiter.state}")
         except Exception as ex:
             self.logger.error(f"Summarized dump failed for '{dev.name}': {ex}")
 
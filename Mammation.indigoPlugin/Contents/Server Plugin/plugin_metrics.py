@@ -0,0 +1,178 @@
+# Prometheus text for the /metrics route of the plugin's aiohttp server.
+#
+# The library counts MQTT messages, cloud commands (latency, outcome, 429s), token
+# refreshes and map-sync steps as they happen, on pymammotion's metrics REGISTRY.
+# The plugin adds the duration of _refresh_states (REFRESH_SECONDS) and, only when
+# /metrics is scraped, turns the `state` snapshots it already keeps into samples:
+#   - plugin wide: task supervisor, waypoint frames, map body cache, log handler,
+#     device snapshots
+#   - per mower: poll scheduler, report cadence, map sync progress, position history,
+#     age of the data
+#   - per cloud account: invoke rate limiter and token refreshers
+# Nothing is collected between scrapes.
+
+import time
+from datetime import UTC, datetime
+
+from pymammotion.utility.metrics import CONTENT_TYPE, REGISTRY, format_family
+
+REFRESH_SECONDS = REGISTRY.histogram(
+    "mammotion_refresh_states_seconds",
+    "Duration of one Plugin._refresh_states (Indigo state publish)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# state key -> metric kind, per `state` source
+_SUPERVISOR = {"running": "gauge", "waiting": "gauge", "rerun_pending": "gauge", "submitted": "counter",
+               "coalesced": "counter", "completed": "counter", "failed": "counter"}
+_WAYPOINTS = {"pending_transactions": "gauge", "pending_points": "gauge", "pending_bytes": "gauge",
+              "completed": "counter", "evicted_expired": "counter", "evicted_capacity": "counter"}
+_BODY_CACHE = {"entries": "gauge", "bytes": "gauge", "hits": "counter", "misses": "counter"}
+_POLL = {"available": "gauge", "backoff": "gauge", "polls_sent": "counter", "polls_skipped": "counter"}
+_LIMITER = {"tokens": "gauge", "rate": "gauge", "max_rate": "gauge", "observed_limit": "gauge",
+            "waiting": "gauge", "acquired": "counter"}
+
+
+class _Families:
+    """Samples grouped by metric name, so one family can collect from several mowers."""
+
+    def __init__(self):
+        self._families = {}  # name -> (kind, help, [(labels, value)])
+
+    def add(self, name, kind, documentation, labels, value):
+        if value is None:
+            return
+        if kind == "counter":
+            name = f"{name}_total"
+        self._families.setdefault(name, (kind, documentation, []))[2].append((labels, value))
+
+    def add_state(self, prefix, source, state, spec, labels=None):
+        for key, kind in spec.items():
+            self.add(f"{prefix}_{key}", kind, f"{source} {key}", labels or {}, state.get(key))
+
+    def lines(self):
+        out = []
+        for name, (kind, documentation, samples) in self._families.items():
+            out.extend(format_family(name, kind, documentation, samples))
+        return out
+
+
+def _collect_plugin(plugin, families):
+    supervisor = getattr(plugin, "_task_supervisor", None)
+    if supervisor is not None:
+        families.add_state("mammotion_tasks", "TaskSupervisor", supervisor.state, _SUPERVISOR)
+    waypoints = getattr(plugin, "_waypoint_frames", None)
+    if waypoints is not None:
+        families.add_state("mammotion_waypoint", "WaypointFrames", waypoints.state, _WAYPOINTS)
+    body_cache = getattr(plugin, "_map_body_cache", None)
+    if body_cache is not None:
+        families.add_state("mammotion_map_body_cache", "map GeoJSON body cache", body_cache.state, _BODY_CACHE)
+
+    handler = getattr(plugin, "indigo_log_handler", None)
+    if handler is not None:
+        families.add("mammotion_log_dropped", "counter", "Event Log records dropped on a full queue", {},
+                     getattr(handler, "dropped", None))
+        for log_filter in handler.filters:
+            if hasattr(log_filter, "suppressed_total"):
+                families.add("mammotion_log_suppressed", "counter", "Debug lines suppressed by the rate limit", {},
+                             log_filter.suppressed_total)
+
+    snapshots = getattr(plugin, "_snapshots", None)
+    if snapshots is not None:
+        families.add("mammotion_snapshot_writes", "counter", "Device snapshots written", {}, snapshots.writes)
+        families.add("mammotion_snapshot_skipped", "counter", "Device snapshot saves skipped (unchanged or too soon)",
+                     {}, snapshots.skipped)
+    families.add("mammotion_snapshots_stale", "gauge", "Devices showing a saved snapshot until live data arrives",
+                 {}, len(getattr(plugin, "_stale_snapshots", {})))
+
+
+def _collect_mower(families, dev_id, name, device):
+    labels = {"dev_id": str(dev_id), "mower": name}
+    sm = device.state_manager
+
+    families.add_state("mammotion_poll", "PollScheduler", sm.poll_scheduler.state, _POLL, labels)
+    for topic, age in sm.poll_scheduler.state.get("push_age", {}).items():
+        families.add("mammotion_push_age_seconds", "gauge", "Seconds since the mower last pushed this report topic",
+                     {**labels, "topic": topic}, age)
+
+    cadence = sm.report_cadence.state
+    families.add("mammotion_report_suspended", "gauge", "Report stream stopped on purpose", labels,
+                 cadence.get("suspended"))
+    families.add("mammotion_report_profile_switches", "counter", "request_iot_sys profile switches", labels,
+                 cadence.get("switches"))
+    if cadence.get("profile"):
+        families.add("mammotion_report_profile", "gauge", "Report profile the mower is streaming (1 = current)",
+                     {**labels, "profile": cadence["profile"]}, 1)
+
+    map_obj = sm.get_device().map
+    families.add("mammotion_map_hashes", "gauge", "Map items listed by the mower (root hash lists)", labels,
+                 len(map_obj.hashlist))
+    families.add("mammotion_map_hashes_missing", "gauge", "Map items not synced yet", labels,
+                 len(map_obj.missing_hashlist()))
+    families.add("mammotion_map_area_names", "gauge", "Area names received", labels, len(map_obj.area_name))
+
+    history = getattr(sm, "position_history", None)
+    if history is not None:
+        track = history.state
+        families.add("mammotion_track_positions", "counter", "Positions added to the position history", labels,
+                     track["recorded"])
+        families.add("mammotion_track_samples", "gauge", "Samples held in the position history", labels,
+                     sum(tier["samples"] for tier in track["tiers"]))
+
+    updated = getattr(sm, "last_updated_at", None)
+    if updated is not None:
+        families.add("mammotion_state_age_seconds", "gauge", "Seconds since the last update from the mower", labels,
+                     round((datetime.now(UTC) - updated).total_seconds(), 1))
+
+
+def _collect_account(families, account, cloud_client):
+    labels = {"account": account}
+    limiter = getattr(cloud_client, "invoke_limiter", None)
+    if limiter is not None:
+        families.add_state("mammotion_invoke_limiter", "invoke TokenBucket", limiter.state, _LIMITER, labels)
+    refreshers = (
+        getattr(cloud_client, "session_refresher", None),
+        getattr(getattr(cloud_client, "mammotion_http", None), "token_refresher", None),
+    )
+    for refresher in refreshers:
+        if refresher is None:
+            continue
+        try:
+            state = refresher.state
+        except Exception:
+            continue  # not logged in yet: no expiry to report
+        token_labels = {**labels, "token": refresher.name}
+        families.add("mammotion_token_due_in_seconds", "gauge", "Seconds until the token is refreshed",
+                     token_labels, state.get("due_in"))
+        families.add("mammotion_token_refresh_running", "gauge", "Background token refresh task alive",
+                     token_labels, state.get("running"))
+
+
+def render(plugin):
+    """Return the Prometheus text for the library registry plus the plugin's state snapshots."""
+    families = _Families()
+    started = time.perf_counter()
+    try:
+        _collect_plugin(plugin, families)
+    except Exception as ex:
+        plugin.logger.debug(f"/metrics: plugin counters failed: {ex}")
+
+    accounts = {}  # id(cloud_client) -> label; mowers on one account share a limiter
+    for dev_id, mgr in list(getattr(plugin, "_mgr", {}).items()):
+        name = plugin._mower_name.get(dev_id)
+        if not mgr or not name:
+            continue
+        try:
+            device = mgr.get_device_by_name(name)
+            _collect_mower(families, dev_id, name, device)
+            cloud_client = getattr(device, "cloud_client", None)
+            if cloud_client is not None and id(cloud_client) not in accounts:
+                accounts[id(cloud_client)] = str(len(accounts))
+                _collect_account(families, accounts[id(cloud_client)], cloud_client)
+        except Exception as ex:
+            plugin.logger.debug(f"/metrics: counters for dev {dev_id} failed: {ex}")
+
+    families.add("mammotion_metrics_collect_seconds", "gauge", "Time spent collecting plugin samples for this scrape",
+                 {}, round(time.perf_counter() - started, 6))
+    return REGISTRY.render() + "\n".join(families.lines()) + "\n"
+
@@ -5,28 +5,58 @@
 __version__ = "0.0.5"
 
 import asyncio
+import importlib
 import logging
 import os
+from typing import TYPE_CHECKING, Any
 
-from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
+if TYPE_CHECKING:
+    from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
 
-# works outside HA on its own
-from pymammotion.bluetooth.ble import MammotionBLE
-from pymammotion.http.http import MammotionHTTP
+    # works outside HA on its own
+    from pymammotion.bluetooth.ble import MammotionBLE
+    from pymammotion.http.http import MammotionHTTP
 
-# TODO make a working device that will work outside HA too.
-from pymammotion.mqtt import AliyunMQTT, MammotionMQTT
+    # TODO make a working device that will work outside HA too.
+    from pymammotion.mqtt import AliyunMQTT, MammotionMQTT
 
 logger = logging.getLogger(__name__)
 
 
-__all__ = ["MammotionBLE", "MammotionHTTP", "AliyunMQTT", "MammotionMQTT", "logger"]
+__all__ = ["CloudIOTGateway", "MammotionBLE", "MammotionHTTP", "AliyunMQTT", "MammotionMQTT", "logger"]
+
+# Exported names are resolved on first access so importing the package does not
+# drag in LinkKit, the BLE stack or the HTTP client until something needs them.
+_LAZY_IMPORTS = {
+    "CloudIOTGateway": "pymammotion.aliyun.cloud_gateway",
+    "MammotionBLE": "pymammotion.bluetooth.ble",
+    "MammotionHTTP": "pymammotion.http.http",
+    "AliyunMQTT": "pymammotion.mqtt.aliyun_mqtt",
+    "MammotionMQTT": "pymammotion.mqtt.mammotion_mqtt",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 # TODO provide interface to pick between mqtt/cloud/bluetooth
 
 if __name__ == "__main__":
     """Values are generated from calls to aliyun APIs, can find what order is required in the login_test.py."""
+    from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
+    from pymammotion.http.http import MammotionHTTP
+    from pymammotion.mqtt import AliyunMQTT
+
     logging.basicConfig(level=logging.DEBUG)
     logger.getChild("paho").setLevel(logging.WARNING)
     PRODUCT_KEY = os.environ.get("PRODUCT_KEY")
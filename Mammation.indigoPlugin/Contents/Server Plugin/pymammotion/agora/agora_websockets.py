@@ -31,6 +31,11 @@ from .coordinator import StreamSubscriptionResponse
 
 _LOGGER = logging.getLogger(__name__)
 
+# Edge-service lookups are reused for the same token bundle while still fresh,
+# so a quick stop/start of the stream skips the transpond round trip.
+EDGE_SERVICES_TTL = 120.0
+_edge_services_cache: dict[tuple[str, str, str, int], tuple[float, "ResponseInfo"]] = {}
+
 
 def _create_ws_ssl_context() -> ssl.SSLContext:
     """Create SSL context for WebSocket connections."""
@@ -179,6 +184,7 @@ class AgoraWebSocketHandler:
 
         # If we get here, all connection attempts failed
         _LOGGER.error("Failed to connect to any Agora edge servers")
+        _edge_services_cache.pop(self._edge_cache_key(agora_data), None)
         self._connection_state = "DISCONNECTED"
         return None
 
@@ -1057,8 +1063,30 @@ class AgoraWebSocketHandler:
 
         return minimal_sdp
 
+    @staticmethod
+    def _edge_cache_key(agora_data: StreamSubscriptionResponse) -> tuple[str, str, str, int]:
+        return agora_data.appid, agora_data.channelName, agora_data.token, int(agora_data.uid)
+
     async def _get_agora_edge_services(self, agora_data: StreamSubscriptionResponse) -> ResponseInfo | None:
-        """Get Agora edge services information."""
+        """Get Agora edge services information, reusing a fresh lookup for the same token."""
+        cache_key = self._edge_cache_key(agora_data)
+        cached = _edge_services_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < EDGE_SERVICES_TTL:
+            _LOGGER.debug("Using cached Agora edge services")
+            return cached[1]
+
+        edge_info = await self._fetch_agora_edge_services(agora_data)
+        if edge_info is not None:
+            now = time.monotonic()
+            # Tokens rotate, so entries for old ones would otherwise stay forever
+            expired = [key for key, (fetched_at, _) in _edge_services_cache.items() if now - fetched_at >= EDGE_SERVICES_TTL]
+            for key in expired:
+                del _edge_services_cache[key]
+            _edge_services_cache[cache_key] = (now, edge_info)
+        return edge_info
+
+    async def _fetch_agora_edge_services(self, agora_data: StreamSubscriptionResponse) -> ResponseInfo | None:
+        """Request Agora edge services information."""
         app_id = agora_data.appid
         channel_name = agora_data.channelName
         token = agora_data.token
@@ -135,7 +135,7 @@ class Client:
                 raise e
         raise UnretryableException(_last_request, _last_exception)
 
-    async def async_do_request(self, pathname, protocol, method, header, body, runtime):
+    async def async_do_request(self, pathname, protocol, method, header, body, runtime, session=None):
         """Send request
 
         @type pathname: str
@@ -156,6 +156,9 @@ class Client:
         @type runtime: util_models.RuntimeOptions
         @param runtime: which controls some details of call api, such as retry times
 
+        @type session: aiohttp.ClientSession
+        @param session: optional pooled session (see TeaCore.pooled_session) to send on
+
         @rtype: TeaResponse
         @return: the response
         """
@@ -216,7 +219,7 @@ class Client:
                     _request.body = UtilClient.to_jsonstring(TeaCore.to_map(body))
                 _request.headers["x-ca-signature"] = APIGatewayUtilClient.get_signature(_request, self._app_secret)
                 _last_request = _request
-                _response = await TeaCore.async_do_action(_request, _runtime)
+                _response = await TeaCore.async_do_action(_request, _runtime, session)
                 return _response
             except Exception as e:
                 if TeaCore.is_retryable(e):
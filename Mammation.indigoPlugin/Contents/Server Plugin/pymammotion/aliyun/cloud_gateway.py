@@ -27,10 +27,14 @@ from pymammotion.aliyun.model.login_by_oauth_response import LoginByOAuthRespons
 from pymammotion.aliyun.model.regions_response import RegionResponse
 from pymammotion.aliyun.model.session_by_authcode_response import SessionByAuthCodeResponse
 from pymammotion.aliyun.model.thing_response import ThingPropertiesResponse
+from pymammotion.aliyun.rate_limiter import TokenBucket
 from pymammotion.aliyun.regions import region_mappings
+from pymammotion.aliyun.tea.core import TeaCore
 from pymammotion.const import ALIYUN_DOMAIN, APP_KEY, APP_SECRET, APP_VERSION
 from pymammotion.http.http import MammotionHTTP
 from pymammotion.utility.datatype_converter import DatatypeConverter
+from pymammotion.utility.metrics import REGISTRY, timed
+from pymammotion.utility.token_refresher import TokenRefresher
 
 logger = getLogger(__name__)
 
@@ -46,6 +50,34 @@ MOVE_HEADERS = (
     "user-agent",
 )
 
+# /thing/service/invoke budget shared by every device on an account. These are fixed,
+# conservative starting values, not measured ones: the gateway does not publish its
+# limit, so invoke_limiter learns it at runtime by halving on each 429 and capping
+# the recovery below the rate that was rejected (see TokenBucket). Checked by
+# tools/invoke_pacing_check.py at the repository root.
+INVOKE_RATE = 2.0
+INVOKE_BURST = 5
+INVOKE_MAX_ATTEMPTS = 4
+
+# Refresh the iotToken at 80% of its lifetime, and never later than 5 hours before expiry
+IOT_TOKEN_REFRESH_FRACTION = 0.8
+IOT_TOKEN_REFRESH_MARGIN = 5 * 3600
+
+# Concurrent /thing/properties/get requests in one get_devices_properties batch
+PROPERTIES_CONCURRENCY = 4
+
+CLOUD_COMMAND_SECONDS = REGISTRY.histogram(
+    "pymammotion_cloud_command_seconds",
+    "send_cloud_command duration, including rate-limit waits and 429 retries",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+CLOUD_COMMANDS = REGISTRY.counter(
+    "pymammotion_cloud_commands_total", "send_cloud_command calls by outcome (ok or exception name)", ("outcome",)
+)
+CLOUD_COMMAND_THROTTLED = REGISTRY.counter(
+    "pymammotion_cloud_command_throttled_total", "HTTP 429 responses from /thing/service/invoke"
+)
+
 
 class SetupException(Exception):
     """Raise when mqtt expires token or token is invalid."""
@@ -130,7 +162,7 @@ class CloudIOTGateway:
         self._app_key = APP_KEY
         self._app_secret = APP_SECRET
         self.domain = ALIYUN_DOMAIN
-        self.message_delay = 1
+        self.invoke_limiter = TokenBucket(INVOKE_RATE, INVOKE_BURST)
         self._client_id = self.generate_hardware_string(8)  # 8 characters
         self._device_sn = self.generate_hardware_string(32)  # 32 characters
         self._utdid = self.generate_hardware_string(32)  # 32 characters
@@ -147,6 +179,23 @@ class CloudIOTGateway:
                 if self._session_by_authcode_response.token_issued_at is not None
                 else int(time.time())
             )
+        self._gateway_client: tuple[str, Client] | None = None
+        self.session_refresher = TokenRefresher(
+            "iot",
+            self._refresh_iot_session,
+            issued_at=lambda: self._iot_token_issued_at,
+            expires_at=lambda: self._iot_token_issued_at + self._session_by_authcode_response.data.iotTokenExpire,
+            fraction=IOT_TOKEN_REFRESH_FRACTION,
+            margin=IOT_TOKEN_REFRESH_MARGIN,
+        )
+
+    def _api_gateway_client(self) -> Client:
+        """Return the API gateway client for the current region, created once per endpoint."""
+        endpoint = self._region_response.data.apiGatewayEndpoint
+        if self._gateway_client is None or self._gateway_client[0] != endpoint:
+            config = Config(app_key=self._app_key, app_secret=self._app_secret, domain=endpoint)
+            self._gateway_client = (endpoint, Client(config))
+        return self._gateway_client[1]
 
     @staticmethod
     def generate_random_string(length: int) -> str:
@@ -454,12 +503,7 @@ class CloudIOTGateway:
 
     async def session_by_auth_code(self) -> SessionByAuthCodeResponse:
         """Create a session by auth code."""
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-        client = Client(config)
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(api_ver="1.0.4", language="en-US")
@@ -510,12 +554,7 @@ class CloudIOTGateway:
         return response.body
 
     async def sign_out(self) -> dict:
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-        client = Client(config)
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(api_ver="1.0.4", language="en-US")
@@ -553,15 +592,16 @@ class CloudIOTGateway:
         response_body_dict = self.parse_json_response(response_body_str)
         return response_body_dict
 
+    async def _refresh_iot_session(self) -> None:
+        """Refresh the iotToken while the refreshToken is still valid."""
+        if self._iot_token_issued_at + self._session_by_authcode_response.data.refreshTokenExpire <= int(time.time()):
+            raise AuthRefreshException("Refresh token expired. Please re-login")
+        await self.check_or_refresh_session()
+
     async def check_or_refresh_session(self):
         """Check or refresh the session."""
         logger.debug("Trying to refresh token")
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-        client = Client(config)
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(api_ver="1.0.4", language="en-US")
@@ -625,13 +665,7 @@ class CloudIOTGateway:
 
     async def list_binding_by_account(self) -> ListingDevAccountResponse:
         """List bindings by account."""
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-
-        client = Client(config)
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(
@@ -668,13 +702,7 @@ class CloudIOTGateway:
         return self._devices_by_account_response
 
     async def list_binding_by_dev(self, iot_id: str):
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-
-        client = Client(config)
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(
@@ -709,13 +737,7 @@ class CloudIOTGateway:
         return self._devices_by_account_response
 
     async def confirm_share(self, record_list: list[str]) -> bool:
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-
-        client = Client(config)
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(
@@ -750,13 +772,7 @@ class CloudIOTGateway:
 
     async def get_shared_notice_list(self):
         ### status 0 accepted status -1 ready to be accepted 3 expired
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-
-        client = Client(config)
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(
@@ -792,14 +808,18 @@ class CloudIOTGateway:
         self._devices_by_account_response = ListingDevAccountResponse.from_dict(response_body_dict)
         return self._devices_by_account_response
 
+    @timed(CLOUD_COMMAND_SECONDS, CLOUD_COMMANDS)
     async def send_cloud_command(self, iot_id: str, command: bytes) -> str:
         """Sends a cloud command to a specified IoT device.
 
-        This function checks if the IoT token is expired and attempts to refresh it if
-        possible. It then constructs a request using the provided command and sends it
+        The IoT token is normally renewed ahead of expiry by ``session_refresher``; if
+        it is due anyway it is refreshed first, sharing one refresh with any concurrent
+        callers. It then constructs a request using the provided command and sends it
         to the IoT device via an asynchronous HTTP POST request. The function handles
         various error codes and exceptions based on the response from the cloud
-        service.
+        service. Requests are paced by ``invoke_limiter``, which is shared by every
+        device on the account; a 429 slows the bucket down and the request is retried
+        up to ``INVOKE_MAX_ATTEMPTS`` times before TooManyRequestsException is raised.
 
         Args:
             iot_id (str): The unique identifier of the IoT device.
@@ -812,25 +832,10 @@ class CloudIOTGateway:
         if command is None:
             raise Exception("Command is missing / None")
 
-        """Check if iotToken is expired"""
-        if self._iot_token_issued_at + self._session_by_authcode_response.data.iotTokenExpire <= (
-            int(time.time()) + (5 * 3600)
-        ):
-            """Token expired - Try to refresh - Check if refreshToken is not expired"""
-            if self._iot_token_issued_at + self._session_by_authcode_response.data.refreshTokenExpire > (
-                int(time.time())
-            ):
-                await self.check_or_refresh_session()
-            else:
-                raise AuthRefreshException("Refresh token expired. Please re-login")
+        # Normally already refreshed in the background; concurrent callers share one refresh
+        await self.session_refresher.ensure_fresh()
 
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-
-        client = Client(config)
+        client = self._api_gateway_client()
         # build request
         request = CommonParams(
             api_ver="1.0.5",
@@ -853,24 +858,27 @@ class CloudIOTGateway:
             version="1.0",
         )
         logger.debug(self.converter.printBase64Binary(command))
-        # send request
+        # send request, paced by the account-wide token bucket
         runtime_options = RuntimeOptions(autoretry=True, backoff_policy="yes")
-        response = await client.async_do_request("/thing/service/invoke", "https", "POST", None, body, runtime_options)
-        logger.debug(response.status_message)
-        logger.debug(response.headers)
-        logger.debug(response.status_code)
-        logger.debug(response.body)
-        logger.debug(iot_id)
-
-        if response.status_code == 429:
-            logger.debug("too many requests.")
-            if self.message_delay > 8:
-                raise TooManyRequestsException(response.status_message, iot_id)
-            asyncio.get_event_loop().call_later(
-                self.message_delay, lambda: asyncio.ensure_future(self.send_cloud_command(iot_id, command))
+        for _ in range(INVOKE_MAX_ATTEMPTS):
+            await self.invoke_limiter.acquire()
+            response = await client.async_do_request(
+                "/thing/service/invoke", "https", "POST", None, body, runtime_options
             )
-            self.message_delay = self.message_delay * 2
-            return message_id
+            logger.debug(response.status_message)
+            logger.debug(response.headers)
+            logger.debug(response.status_code)
+            logger.debug(response.body)
+            logger.debug(iot_id)
+            if response.status_code != 429:
+                break
+            logger.debug("too many requests.")
+            CLOUD_COMMAND_THROTTLED.inc()
+            self.invoke_limiter.throttled()
+        else:
+            raise TooManyRequestsException(response.status_message, iot_id)
+
+        self.invoke_limiter.succeeded()
 
         response_body_str = response.body.decode("utf-8")
         response_body_dict = self.parse_json_response(response_body_str)
@@ -899,20 +907,46 @@ class CloudIOTGateway:
                 logger.debug("iotToken expired, must re-login.")
                 raise CheckSessionException(response_body_dict.get("message"))
 
-        if self.message_delay != 1:
-            self.message_delay = 1
-
         return message_id
 
     async def get_device_properties(self, iot_id: str) -> ThingPropertiesResponse:
-        """List bindings by account."""
-        config = Config(
-            app_key=self._app_key,
-            app_secret=self._app_secret,
-            domain=self._region_response.data.apiGatewayEndpoint,
-        )
-
-        client = Client(config)
+        """Get the cloud-side properties (firmware, network, coordinates) of one device."""
+        return await self._get_device_properties(iot_id)
+
+    async def get_devices_properties(
+        self, iot_ids: list[str], max_concurrency: int = PROPERTIES_CONCURRENCY
+    ) -> dict[str, ThingPropertiesResponse | Exception]:
+        """Get the properties of many devices concurrently.
+
+        Requests run at most ``max_concurrency`` at a time over one pooled HTTPS
+        session, so an account with several mowers and RTK bases pays for one TLS
+        handshake instead of one per device. A failing device does not affect the
+        others: its entry holds the exception the single-device call would have raised.
+        """
+        results: dict[str, ThingPropertiesResponse | Exception] = {}
+        iot_ids = list(dict.fromkeys(iot_ids))
+        if not iot_ids:
+            return results
+        await self.session_refresher.ensure_fresh()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with await TeaCore.pooled_session(limit=max_concurrency) as session:
+
+            async def fetch(iot_id: str) -> None:
+                async with semaphore:
+                    try:
+                        results[iot_id] = await self._get_device_properties(iot_id, session)
+                    except Exception as ex:
+                        logger.debug("Getting properties for %s failed: %s", iot_id, ex)
+                        results[iot_id] = ex
+
+            await asyncio.gather(*(fetch(iot_id) for iot_id in iot_ids))
+        return results
+
+    async def _get_device_properties(
+        self, iot_id: str, session: ClientSession | None = None
+    ) -> ThingPropertiesResponse:
+        client = self._api_gateway_client()
 
         # build request
         request = CommonParams(
@@ -930,7 +964,9 @@ class CloudIOTGateway:
         )
 
         # send request
-        response = await client.async_do_request("/thing/properties/get", "https", "POST", None, body, RuntimeOptions())
+        response = await client.async_do_request(
+            "/thing/properties/get", "https", "POST", None, body, RuntimeOptions(), session
+        )
         logger.debug(response.status_message)
         logger.debug(response.headers)
         logger.debug(response.status_code)
@@ -0,0 +1,119 @@
+"""Client-side token bucket for Aliyun gateway calls."""
+
+import asyncio
+from collections.abc import Callable
+from logging import getLogger
+import time
+from typing import Any
+
+logger = getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket shared by every caller of a rate-limited endpoint.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Callers
+    await :meth:`acquire` and are released in FIFO order, so bursts are smoothed
+    into a steady stream instead of tripping the gateway's 429 limit.
+
+    The refill rate adapts to what the gateway actually allows: a 429 reported via
+    :meth:`throttled` halves the rate and records the rate it happened at as the
+    observed limit, and each :meth:`succeeded` call climbs back additively, but no
+    higher than 90% of that observed limit until ``ceiling_ttl`` seconds pass
+    without another 429.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        min_rate: float = 0.1,
+        ceiling_ttl: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the bucket full, running at its maximum rate."""
+        self.max_rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.ceiling_ttl = ceiling_ttl
+        self._clock = clock
+        self._rate = rate
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._observed_limit: float | None = None
+        self._throttled_at = 0.0
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self._acquired = 0
+        self._throttled = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def _ceiling(self) -> float:
+        if self._observed_limit is None:
+            return self.max_rate
+        if self._clock() - self._throttled_at >= self.ceiling_ttl:
+            self._observed_limit = None
+            return self.max_rate
+        return max(self.min_rate, min(self.max_rate, self._observed_limit * 0.9))
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting, returning False if none is available."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self._acquired += 1
+            return True
+        return False
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        self._waiting += 1
+        try:
+            async with self._lock:
+                while not self.try_acquire():
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+        finally:
+            self._waiting -= 1
+
+    def throttled(self) -> None:
+        """Record a 429 from the gateway and slow the bucket down."""
+        self._refill()
+        self._throttled += 1
+        self._observed_limit = self._rate
+        self._throttled_at = self._clock()
+        self._rate = max(self.min_rate, self._rate / 2)
+        self._tokens = 0
+        logger.debug("Rate limited by gateway, invoke rate lowered to %.2f/s", self._rate)
+
+    def succeeded(self) -> None:
+        """Record an accepted request and let the rate recover towards its ceiling."""
+        ceiling = self._ceiling()
+        if self._rate < ceiling:
+            self._refill()
+            self._rate = min(ceiling, self._rate + self.max_rate / 20)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Snapshot of the bucket for diagnostics."""
+        self._refill()
+        return {
+            "tokens": round(self._tokens, 3),
+            "capacity": self.capacity,
+            "rate": round(self._rate, 3),
+            "max_rate": self.max_rate,
+            "observed_limit": self._observed_limit,
+            "waiting": self._waiting,
+            "acquired": self._acquired,
+            "throttled": self._throttled,
+        }
@@ -29,6 +29,28 @@ logger.addHandler(ch)
 class TeaCore:
     http_adapter = adapters.HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE * 4)
     https_adapter = adapters.HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE * 4)
+    _ssl_context: ssl.SSLContext | None = None
+
+    @staticmethod
+    async def ssl_context() -> ssl.SSLContext:
+        """Return the certifi-backed SSL context, loading the CA bundle only once."""
+        if TeaCore._ssl_context is None:
+            loop = asyncio.get_running_loop()
+            ssl_context = await loop.run_in_executor(None, ssl.create_default_context, ssl.Purpose.SERVER_AUTH)
+            await loop.run_in_executor(None, ssl_context.load_verify_locations, certifi.where())
+            TeaCore._ssl_context = ssl_context
+        return TeaCore._ssl_context
+
+    @staticmethod
+    async def pooled_session(limit: int = DEFAULT_POOL_SIZE) -> aiohttp.ClientSession:
+        """Return a session whose HTTPS connections are reused across requests.
+
+        Pass it to :meth:`async_do_action` to share one connection pool between many
+        requests instead of opening a session and TLS connection per call. The caller
+        owns the session and must close it.
+        """
+        connector = aiohttp.TCPConnector(ssl=await TeaCore.ssl_context(), family=socket.AF_INET, limit=limit)
+        return aiohttp.ClientSession(connector=connector)
 
     @staticmethod
     def get_adapter(prefix):
@@ -93,7 +115,9 @@ class TeaCore:
         return url.rstrip("?&")
 
     @staticmethod
-    async def async_do_action(request: TeaRequest, runtime_option=None) -> TeaResponse:
+    async def async_do_action(
+        request: TeaRequest, runtime_option=None, session: aiohttp.ClientSession | None = None
+    ) -> TeaResponse:
         runtime_option = runtime_option or {}
 
         url = TeaCore.compose_url(request)
@@ -118,39 +142,44 @@ class TeaCore:
         connector = None
         ca_cert = certifi.where()
         if ca_cert and request.protocol.upper() == "HTTPS":
-            loop = asyncio.get_event_loop()
-
-            ssl_context = await loop.run_in_executor(None, ssl.create_default_context, ssl.Purpose.SERVER_AUTH)
-            await loop.run_in_executor(None, ssl_context.load_verify_locations, ca_cert)
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
-                family=socket.AF_INET,
-            )
+            if session is None:
+                connector = aiohttp.TCPConnector(
+                    ssl=await TeaCore.ssl_context(),
+                    family=socket.AF_INET,
+                )
         else:
             verify = False
 
         timeout = aiohttp.ClientTimeout(sock_read=read_timeout, sock_connect=connect_timeout)
+        body = b""
+        if isinstance(request.body, BaseStream):
+            for content in request.body:
+                body += content
+        elif isinstance(request.body, str):
+            body = request.body.encode("utf-8")
+        else:
+            body = request.body
+        if session is not None:
+            return await TeaCore._async_send(session, request, url, body, verify, proxy, timeout)
         async with aiohttp.ClientSession(connector=connector) as s:
-            body = b""
-            if isinstance(request.body, BaseStream):
-                for content in request.body:
-                    body += content
-            elif isinstance(request.body, str):
-                body = request.body.encode("utf-8")
-            else:
-                body = request.body
-            try:
-                async with s.request(
-                    request.method, url, data=body, headers=request.headers, ssl=verify, proxy=proxy, timeout=timeout
-                ) as response:
-                    tea_resp = TeaResponse()
-                    tea_resp.body = await response.read()
-                    tea_resp.headers = {k.lower(): v for k, v in response.headers.items()}
-                    tea_resp.status_code = response.status
-                    tea_resp.status_message = response.reason
-                    tea_resp.response = response
-            except OSError as e:
-                raise RetryError(str(e))
+            return await TeaCore._async_send(s, request, url, body, verify, proxy, timeout)
+
+    @staticmethod
+    async def _async_send(
+        s: aiohttp.ClientSession, request: TeaRequest, url: str, body, verify, proxy, timeout
+    ) -> TeaResponse:
+        try:
+            async with s.request(
+                request.method, url, data=body, headers=request.headers, ssl=verify, proxy=proxy, timeout=timeout
+            ) as response:
+                tea_resp = TeaResponse()
+                tea_resp.body = await response.read()
+                tea_resp.headers = {k.lower(): v for k, v in response.headers.items()}
+                tea_resp.status_code = response.status
+                tea_resp.status_message = response.reason
+                tea_resp.response = response
+        except OSError as e:
+            raise RetryError(str(e))
         return tea_resp
 
     @staticmethod
@@ -1 +1,16 @@
-from .ble_message import BleMessage
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ble_message import BleMessage
+
+__all__ = ["BleMessage"]
+
+
+def __getattr__(name: str) -> Any:
+    # BleMessage pulls in bleak; keep it out of imports of pymammotion.bluetooth.model/const
+    if name != "BleMessage":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(".ble_message", __name__).BleMessage
+    globals()[name] = value
+    return value
@@ -3,7 +3,8 @@ import logging
 import math
 from typing import Any
 
-from shapely.geometry import Point
+from shapely import affinity
+from shapely.geometry import Point, mapping, shape
 
 from pymammotion.data.model.hash_list import (
     AreaHashNameList,
@@ -90,6 +91,13 @@ TYPE_MOW_PATH: int = 4
 
 # Coordinate conversion constants
 METERS_PER_DEGREE: int = 111320
+# Web-mercator ground resolution at zoom 0 on the equator, in metres per pixel
+METERS_PER_PIXEL_ZOOM_0: float = 156543.03392
+
+# Geometry types that can be reduced by simplification
+SIMPLIFIABLE_TYPES: frozenset[str] = frozenset(
+    {"LineString", "MultiLineString", "Polygon", "MultiPolygon", "LinearRing"}
+)
 
 # Type aliases
 Coordinate = tuple[float, float]
@@ -149,6 +157,55 @@ class GeojsonGenerator:
         total_frames = GeojsonGenerator._process_mow_map_objects(hash_list, rtk_location, geo_json)
         return geo_json
 
+    @staticmethod
+    def tolerance_for_zoom(zoom: float, latitude: float, pixels: float = 1.0) -> float:
+        """Return the ground distance in metres covered by ``pixels`` at a web-map zoom level.
+
+        Args:
+            zoom: Leaflet/slippy-map zoom level
+            latitude: Latitude in degrees the map is centred on
+            pixels: How many screen pixels of error are acceptable
+
+        """
+        return pixels * METERS_PER_PIXEL_ZOOM_0 * math.cos(math.radians(latitude)) / (2**zoom)
+
+    @staticmethod
+    def simplify_geojson(geo_json: GeoJSONCollection, tolerance_m: float) -> GeoJSONCollection:
+        """Return a copy of ``geo_json`` with line and polygon vertices thinned out.
+
+        Uses Douglas-Peucker with topology preservation, so polygons stay valid and
+        rings do not cross. Points and all feature properties are left untouched.
+        Each geometry is simplified with its longitudes scaled by the cosine of its
+        mid latitude, so the tolerance is metres along both axes rather than only
+        north-south (a degree of longitude is shorter away from the equator).
+
+        Args:
+            geo_json: GeoJSON collection in lon/lat degrees
+            tolerance_m: Maximum deviation from the original geometry in metres
+
+        """
+        if tolerance_m <= 0:
+            return geo_json
+
+        tolerance = tolerance_m / METERS_PER_DEGREE
+        features = []
+        for feature in geo_json.get("features", []):
+            geometry = feature.get("geometry") or {}
+            if geometry.get("type") in SIMPLIFIABLE_TYPES:
+                try:
+                    geom = shape(geometry)
+                    min_lat, max_lat = geom.bounds[1], geom.bounds[3]
+                    lon_scale = max(math.cos(math.radians((min_lat + max_lat) / 2)), 0.01)
+                    simplified = affinity.scale(geom, xfact=lon_scale, yfact=1.0, origin=(0, 0))
+                    simplified = simplified.simplify(tolerance, preserve_topology=True)
+                    simplified = affinity.scale(simplified, xfact=1 / lon_scale, yfact=1.0, origin=(0, 0))
+                    if not simplified.is_empty:
+                        feature = {**feature, "geometry": mapping(simplified)}
+                except Exception as ex:
+                    logger.debug("Could not simplify %s: %s", geometry.get("type"), ex)
+            features.append(feature)
+        return {**geo_json, "features": features}
+
     @staticmethod
     def _add_rtk_and_dock(
         rtk_location: Point, dock_location: Point, dock_rotation: int, geo_json: GeoJSONCollection
@@ -242,6 +242,33 @@ class HashList(DataClassORJSONMixin):
         # Combine data_couple from all RootHashLists
         return [i for root_list in self.root_hash_lists for obj in root_list.data for i in obj.data_couple]
 
+    @property
+    def revision(self) -> tuple:
+        """Cheap fingerprint of the map content.
+
+        Changes whenever frames are added to or removed from any map layer, area names
+        change or new mow-path frames arrive, so derived data (GeoJSON, spatial indexes)
+        can be cached against it.
+        """
+        layers = (self.area, self.path, self.obstacle, self.dump, self.svg, self.line)
+        return (
+            tuple(tuple((hash_id, len(frames.data)) for hash_id, frames in layer.items()) for layer in layers),
+            tuple((area.hash, area.name) for area in self.area_name),
+            tuple((frame, path.transaction_id, path.data_hash) for frame, path in self.current_mow_path.items()),
+        )
+
+    @property
+    def area_revision(self) -> tuple:
+        """Fingerprint of the area layer and area names only.
+
+        Unlike :attr:`revision` it does not change as mow-path frames arrive, so
+        data derived from the area outlines (the zone index) survives a mowing run.
+        """
+        return (
+            tuple((hash_id, len(frames.data)) for hash_id, frames in self.area.items()),
+            tuple((area.hash, area.name) for area in self.area_name),
+        )
+
     @property
     def area_root_hashlist(self) -> list[int]:
         if not self.root_hash_lists:
@@ -0,0 +1,181 @@
+"""Incrementally converted mow path, with per-zone progress and segment cursors."""
+
+from dataclasses import dataclass
+import math
+import time
+from typing import Any
+
+from pymammotion.data.model.hash_list import MowPath
+
+
+@dataclass
+class ZoneProgress:
+    """How much of one zone's cover path has been received."""
+
+    points: int = 0
+    length: float = 0.0  # metres
+    path_cur: int = 0
+    path_total: int = 0
+
+
+class MowPathTrack:
+    """The cover path of the current mowing transaction as a growing lon/lat buffer.
+
+    ``HashList.current_mow_path`` keeps the raw ``MowPath`` frames; this mirrors
+    them already converted to lon/lat. :meth:`sync` only converts frames it has
+    not seen, so refreshing the path during a long mowing session costs the new
+    points rather than everything mowed so far. Every path packet becomes one
+    numbered segment, which lets clients fetch just what was added since their
+    last cursor (:meth:`since`).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty track."""
+        self.reset()
+
+    def reset(self, origin: tuple[float, float] | None = None) -> None:
+        """Forget every point; ``origin`` is the RTK (lat, lon) new points are relative to."""
+        self.origin = origin
+        self.transaction_id: int | None = None
+        self.first_frame: MowPath | None = None
+        self.coords: list[list[float]] = []  # [lon, lat] in arrival order
+        self.length = 0.0
+        self.zones: dict[int, ZoneProgress] = {}
+        # (zone_hash, start, end) into coords, one per path packet
+        self.segments: list[tuple[int, int, int]] = []
+        self._frames: dict[int, MowPath] = {}
+        self._last_xy: tuple[float, float] | None = None
+        self.generation = time.time_ns()  # invalidates cursors handed out so far
+
+    def sync(self, frames: dict[int, MowPath], rtk_location: Any) -> int:
+        """Bring the track up to date with ``frames`` and return the number of new segments.
+
+        Args:
+            frames: ``HashList.current_mow_path``, in arrival order
+            rtk_location: shapely Point of the RTK base as (lat, lon), as used by GeojsonGenerator
+
+        """
+        origin = (rtk_location.x, rtk_location.y)
+        first = next(iter(frames.values()), None)
+        if (
+            origin != self.origin
+            or len(frames) < len(self._frames)
+            or (first is not None and first.transaction_id != self.transaction_id)
+            or any(frames.get(frame) is not path for frame, path in self._frames.items())
+        ):
+            # New transaction, RTK moved, or frames replaced / dropped: start over
+            self.reset(origin)
+        added = 0
+        for frame, path in frames.items():
+            if frame in self._frames:
+                continue
+            if self.first_frame is None:
+                self.first_frame = path
+                self.transaction_id = path.transaction_id
+            self._frames[frame] = path
+            for packet in path.path_packets:
+                self._append_packet(packet, rtk_location)
+                added += 1
+        return added
+
+    def _append_packet(self, packet: Any, rtk_location: Any) -> None:
+        from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
+        zone = self.zones.setdefault(packet.zone_hash, ZoneProgress())
+        zone.path_cur = max(zone.path_cur, packet.path_cur)
+        zone.path_total = max(zone.path_total, packet.path_total)
+        start = len(self.coords)
+        for couple in packet.data_couple:
+            xy = (couple.x, couple.y)
+            if self._last_xy is not None:
+                step = math.sqrt((xy[0] - self._last_xy[0]) ** 2 + (xy[1] - self._last_xy[1]) ** 2)
+                self.length += step
+                zone.length += step
+            self._last_xy = xy
+            self.coords.append(list(GeojsonGenerator.lon_lat_delta(rtk_location, couple.x, couple.y)))
+        zone.points += len(self.coords) - start
+        self.segments.append((packet.zone_hash, start, len(self.coords)))
+
+    @property
+    def complete(self) -> bool:
+        """Whether every frame of the transaction has been received."""
+        return self.first_frame is not None and len(self._frames) == self.first_frame.total_frame
+
+    @property
+    def cursor(self) -> str:
+        """Opaque position after the last segment, for :meth:`since`."""
+        return f"{self.generation}.{len(self.segments)}"
+
+    def since(self, cursor: str | None) -> tuple[list[dict[str, Any]], bool]:
+        """Return ``(segment features added after cursor, reset)``.
+
+        ``reset`` is True when the cursor belongs to an earlier track (new
+        transaction or RTK move) or cannot be parsed; the features then cover the
+        whole track and the client should drop what it drew before.
+        """
+        start, reset = 0, True
+        try:
+            generation, count = (int(part) for part in (cursor or "").split("."))
+            if generation == self.generation and 0 <= count <= len(self.segments):
+                start, reset = count, False
+        except ValueError:
+            pass
+        features = []
+        for index in range(start, len(self.segments)):
+            zone_hash, begin, end = self.segments[index]
+            # Include the previous point so consecutive segments join up
+            coords = self.coords[max(begin - 1, 0) : end]
+            if len(coords) < 2:
+                continue
+            features.append(
+                {
+                    "type": "Feature",
+                    "properties": {
+                        "type_name": "mow_path_segment",
+                        "segment": index,
+                        "zone_hash": zone_hash,
+                        "color": "green",
+                    },
+                    "geometry": {"type": "LineString", "coordinates": coords},
+                }
+            )
+        return features, reset
+
+    def zone_progress(self) -> dict[int, dict[str, Any]]:
+        """Per-zone points, metres and cover-path progress received so far."""
+        return {
+            zone_hash: {
+                "points": zone.points,
+                "length": round(zone.length, 2),
+                "path_cur": zone.path_cur,
+                "path_total": zone.path_total,
+            }
+            for zone_hash, zone in self.zones.items()
+        }
+
+    def geojson(self) -> dict[str, Any]:
+        """Return the same collection as ``GeojsonGenerator.generate_mow_path_geojson``.
+
+        The single mow-path feature is only present once all frames have arrived.
+        """
+        geo_json: dict[str, Any] = {"type": "FeatureCollection", "name": "Mowing Lawn Areas", "features": []}
+        if not self.complete or len(self.coords) < 2:
+            return geo_json
+        first = self.first_frame
+        geo_json["features"].append(
+            {
+                "type": "Feature",
+                "properties": {
+                    "transaction_id": first.transaction_id,
+                    "type_name": "mow_path",
+                    "total_path_num": first.total_path_num,
+                    "length": self.length,
+                    "area": first.area,
+                    "time": first.time,
+                    "color": "green",
+                },
+                # GeojsonGenerator lists coordinates last point first
+                "geometry": {"type": "LineString", "coordinates": self.coords[::-1]},
+            }
+        )
+        return geo_json
@@ -0,0 +1,192 @@
+"""Fixed-memory history of mower positions, thinned out into coarser tiers as it ages."""
+
+from array import array
+from collections.abc import Callable, Iterator
+import math
+import time
+from typing import Any
+
+from pymammotion.utility.map import CoordinateConverter
+
+# (seconds between samples, samples kept): every second for an hour, every 10 s for
+# 6 hours, every minute for a day and every 5 minutes for a week
+DEFAULT_TIERS = ((1.0, 3600), (10.0, 2160), (60.0, 1440), (300.0, 2016))
+
+# One sample: (wall time, x, y, heading, rtk_status); x/y in metres from the RTK base,
+# heading in degrees, rtk_status an RTKStatus value
+Sample = tuple[float, float, float, float, int]
+
+
+class _Ring:
+    """Preallocated circular buffer of samples for one tier."""
+
+    __slots__ = ("resolution", "capacity", "t", "x", "y", "heading", "rtk", "start", "size")
+
+    def __init__(self, resolution: float, capacity: int) -> None:
+        self.resolution = resolution
+        self.capacity = capacity
+        self.t = array("d", bytes(8 * capacity))
+        self.x = array("f", bytes(4 * capacity))
+        self.y = array("f", bytes(4 * capacity))
+        self.heading = array("f", bytes(4 * capacity))
+        self.rtk = array("b", bytes(capacity))
+        self.start = 0
+        self.size = 0
+
+    def append(self, sample: Sample) -> None:
+        index = (self.start + self.size) % self.capacity
+        self.t[index], self.x[index], self.y[index], self.heading[index], self.rtk[index] = sample
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    @property
+    def first_t(self) -> float:
+        return self.t[self.start]
+
+    @property
+    def last_t(self) -> float:
+        return self.t[(self.start + self.size - 1) % self.capacity]
+
+    def samples(self, since: float, until: float) -> Iterator[Sample]:
+        for offset in range(self.size):
+            index = (self.start + offset) % self.capacity
+            t = self.t[index]
+            if since <= t < until:
+                yield t, self.x[index], self.y[index], self.heading[index], self.rtk[index]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buf.itemsize * len(buf) for buf in (self.t, self.x, self.y, self.heading, self.rtk))
+
+
+class PositionHistory:
+    """Where the mower has been, at full rate for the last hour and coarser further back.
+
+    Every accepted position goes into each tier whose interval has passed since
+    that tier's previous sample, so the finest tier holds the recent track and
+    the coarser ones keep thinned copies that reach further back. Memory is
+    fixed by the tier sizes. A position that repeats the previous one (within
+    ``min_move`` metres, same heading and RTK status) is skipped unless
+    ``keepalive`` seconds have passed, so a parked mower does not fill the
+    buffers.
+    """
+
+    def __init__(
+        self,
+        tiers: tuple[tuple[float, int], ...] = DEFAULT_TIERS,
+        min_move: float = 0.05,
+        keepalive: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize empty tiers, finest first."""
+        self._rings = [_Ring(resolution, capacity) for resolution, capacity in sorted(tiers)]
+        self.min_move = min_move
+        self.keepalive = keepalive
+        self._clock = clock
+        self._last: Sample | None = None
+        self.recorded = 0
+        self.skipped = 0
+
+    def record(self, x: float, y: float, heading: float, rtk_status: int, t: float | None = None) -> bool:
+        """Add a position; return False when it was skipped as a repeat."""
+        t = self._clock() if t is None else t
+        last = self._last
+        if (
+            last is not None
+            and t - last[0] < self.keepalive
+            and math.hypot(x - last[1], y - last[2]) < self.min_move
+            and heading == last[3]
+            and rtk_status == last[4]
+        ):
+            self.skipped += 1
+            return False
+        sample = (t, x, y, heading, rtk_status)
+        for ring in self._rings:
+            if ring.size == 0 or t - ring.last_t >= ring.resolution:
+                ring.append(sample)
+        self._last = sample
+        self.recorded += 1
+        return True
+
+    def track(self, since: float | None = None, until: float | None = None) -> list[Sample]:
+        """Return samples between ``since`` and ``until`` (wall time), oldest first.
+
+        Each stretch of time comes from the finest tier that still covers it.
+        """
+        since = -math.inf if since is None else since
+        boundary = math.inf if until is None else until
+        parts: list[list[Sample]] = []
+        for ring in self._rings:
+            if ring.size == 0 or boundary <= since:
+                continue
+            parts.append(list(ring.samples(since, boundary)))
+            boundary = min(boundary, ring.first_t)
+        return [sample for part in reversed(parts) for sample in part]
+
+    def clear(self) -> None:
+        """Forget every position."""
+        for ring in self._rings:
+            ring.start = ring.size = 0
+        self._last = None
+
+    def geojson(
+        self,
+        rtk_latitude: float,
+        rtk_longitude: float,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> dict[str, Any]:
+        """Return the track as a FeatureCollection with one LineString feature.
+
+        Args:
+            rtk_latitude: RTK base latitude in radians (``location.RTK.latitude``)
+            rtk_longitude: RTK base longitude in radians
+            since: wall time of the first sample to include
+            until: wall time after the last sample to include
+
+        The feature's ``times`` and ``rtk`` properties run parallel to its
+        coordinates. There is no feature until the range holds two samples.
+
+        """
+        geo_json: dict[str, Any] = {"type": "FeatureCollection", "name": "Position Track", "features": []}
+        samples = self.track(since, until)
+        if len(samples) < 2:
+            return geo_json
+        converter = CoordinateConverter(rtk_latitude, rtk_longitude)
+        coordinates = []
+        for _, x, y, _, _ in samples:
+            # Same axis order as MowingDevice.update_report_data
+            point = converter.enu_to_lla(y, x)
+            coordinates.append([round(point.longitude, 7), round(point.latitude, 7)])
+        geo_json["features"].append(
+            {
+                "type": "Feature",
+                "properties": {
+                    "type_name": "position_track",
+                    "start": samples[0][0],
+                    "end": samples[-1][0],
+                    "points": len(samples),
+                    "times": [round(sample[0], 1) for sample in samples],
+                    "rtk": [sample[4] for sample in samples],
+                    "color": "orange",
+                },
+                "geometry": {"type": "LineString", "coordinates": coordinates},
+            }
+        )
+        return geo_json
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Snapshot of the history for diagnostics."""
+        return {
+            "tiers": [
+                {"resolution": ring.resolution, "samples": ring.size, "capacity": ring.capacity}
+                for ring in self._rings
+            ],
+            "oldest": min((ring.first_t for ring in self._rings if ring.size), default=None),
+            "recorded": self.recorded,
+            "skipped": self.skipped,
+            "bytes": sum(ring.nbytes for ring in self._rings),
+        }
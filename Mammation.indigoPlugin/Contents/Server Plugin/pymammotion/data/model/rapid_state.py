@@ -11,6 +11,11 @@ class RTKStatus(Enum):
     BAD = 1
     FINE = 4
 
+    @classmethod
+    def from_code(cls, code: int) -> "RTKStatus":
+        """Map the raw RTK status reported by the mower (4 fixed, 1/5 float)."""
+        return cls.FINE if code == 4 else cls.BAD if code in (1, 5) else cls.NONE
+
 
 @dataclass
 class RapidState(DataClassORJSONMixin):
@@ -30,7 +35,7 @@ class RapidState(DataClassORJSONMixin):
     @classmethod
     def from_raw(cls, raw: list[int]) -> "RapidState":
         return RapidState(
-            rtk_status=RTKStatus.FINE if raw[0] == 4 else RTKStatus.BAD if raw[0] in (1, 5) else RTKStatus.NONE,
+            rtk_status=RTKStatus.from_code(raw[0]),
             pos_level=raw[1],
             satellites_total=raw[2],
             rtk_age=parse_double(raw[3], 4.0),
@@ -0,0 +1,92 @@
+"""Spatial index over the mowing areas of a map, in local map metres."""
+
+from typing import Any
+
+from pymammotion.data.model.hash_list import HashList, NavGetCommData
+
+
+class ZoneIndex:
+    """Answer "which area is this point in" and "how far is the boundary" quickly.
+
+    Built once per map revision: every complete area becomes a prepared shapely
+    polygon, and an STRtree over their bounding boxes narrows each lookup to the
+    few areas that can contain the point, so queries stay cheap however many
+    areas and vertices the map has. Coordinates are the local map frame used by
+    ``data_couple`` (metres from the RTK base station).
+    """
+
+    def __init__(self, hash_list: HashList) -> None:
+        """Build polygons, prepared geometries and the tree from the map's areas."""
+        from shapely import Polygon, STRtree, prepare
+
+        self.hashes: list[int] = []
+        self.stats: dict[int, tuple[float, float]] = {}  # hash -> (perimeter m, area m²)
+        self._zones: list[Any] = []
+        self._boundaries: list[Any] = []
+
+        for hash_id, frame_list in hash_list.area.items():
+            if not frame_list.data or len(frame_list.data) != frame_list.total_frame:
+                continue
+            coords = [
+                (couple.x, couple.y)
+                for frame in frame_list.data
+                if isinstance(frame, NavGetCommData)
+                for couple in frame.data_couple
+            ]
+            if len(coords) < 3:
+                continue
+            zone = Polygon(coords)
+            if not zone.is_valid:
+                zone = zone.buffer(0)  # self-intersecting outlines
+            if zone.is_empty:
+                continue
+            prepare(zone)
+            self.hashes.append(hash_id)
+            self.stats[hash_id] = (zone.length, zone.area)
+            self._zones.append(zone)
+            self._boundaries.append(zone.boundary)
+
+        self._tree = STRtree(self._zones)
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def _containing(self, x: float, y: float) -> int | None:
+        """Index of the smallest area containing the point, or None."""
+        from shapely import Point, contains_xy
+
+        best: int | None = None
+        for i in self._tree.query(Point(x, y)):
+            if contains_xy(self._zones[i], x, y) and (best is None or self._zones[i].area < self._zones[best].area):
+                best = int(i)
+        return best
+
+    def zone_at(self, x: float, y: float) -> int | None:
+        """Return the hash of the area containing the point, or None if it is outside every area.
+
+        Where areas overlap the smallest one wins, matching how the mower reports the
+        area it is working in.
+        """
+        index = self._containing(x, y)
+        return None if index is None else self.hashes[index]
+
+    def distance_to_boundary(self, x: float, y: float) -> float | None:
+        """Return the signed distance in metres from the point to the nearest area edge.
+
+        Positive while inside an area (distance to that area's edge), negative while
+        outside every area (distance to the nearest one), None if the map has no areas.
+        """
+        return self.locate(x, y)[1]
+
+    def locate(self, x: float, y: float) -> tuple[int | None, float | None]:
+        """Return ``(zone_hash, signed_distance)`` for the point with a single tree lookup."""
+        from shapely import Point
+
+        if not self._zones:
+            return None, None
+        point = Point(x, y)
+        index = self._containing(x, y)
+        if index is not None:
+            return self.hashes[index], float(self._boundaries[index].distance(point))
+        nearest = self._tree.nearest(point)
+        return None, -float(self._zones[int(nearest)].distance(point))
@@ -1,16 +1,15 @@
 """Manage state from notifications into MowingDevice."""
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 import logging
 from typing import Any
 
 import betterproto2
-from shapely import Point
 
 from pymammotion.data.model.device import MowingDevice
 from pymammotion.data.model.device_info import SideLight
-from pymammotion.data.model.generate_geojson import GeojsonGenerator
 from pymammotion.data.model.hash_list import (
     AreaHashNameList,
     MowPath,
@@ -20,10 +19,14 @@ from pymammotion.data.model.hash_list import (
     SvgMessage,
 )
 from pymammotion.data.model.location import Dock, LocationPoint
+from pymammotion.data.model.rapid_state import RTKStatus
+from pymammotion.data.model.mow_path_track import MowPathTrack
+from pymammotion.data.model.position_history import PositionHistory
+from pymammotion.data.model.zone_index import ZoneIndex
 from pymammotion.data.model.work import CurrentTaskSettings
 from pymammotion.data.mqtt.event import ThingEventMessage
 from pymammotion.data.mqtt.properties import ThingPropertiesMessage
-from pymammotion.data.mqtt.status import ThingStatusMessage
+from pymammotion.data.mqtt.status import StatusType, ThingStatusMessage
 from pymammotion.event.event import DataEvent
 from pymammotion.proto import (
     AppGetAllAreaHashName,
@@ -37,6 +40,8 @@ from pymammotion.proto import (
     Getlamprsp,
     GetNetworkInfoRsp,
     LubaMsg,
+    MulSetVideoAck,
+    MulVideoErrorCode,
     NavGetCommDataAck,
     NavGetHashListAck,
     NavPlanJobSet,
@@ -47,10 +52,16 @@ from pymammotion.proto import (
     TimeCtrlLight,
     WifiIotStatusReport,
 )
+from pymammotion.utility.conversions import parse_double
 from pymammotion.utility.map import CoordinateConverter
+from pymammotion.utility.poll_scheduler import PROPERTIES, RAPID_STATE, REPORT_DATA, STATUS, PollScheduler
+from pymammotion.utility.report_cadence import ReportCadence
 
 logger = logging.getLogger(__name__)
 
+# Simplified GeoJSON variants kept per map revision, besides the full-resolution one
+GEOMETRY_CACHE_VARIANTS = 8
+
 
 class MowerStateManager:
     """Manage state."""
@@ -59,6 +70,8 @@ class MowerStateManager:
         """Initialize state manager with a device."""
         self._device: MowingDevice = device
         self.last_updated_at = datetime.now(UTC)
+        self.poll_scheduler = PollScheduler()
+        self.report_cadence = ReportCadence()
         self.cloud_gethash_ack_callback: Callable[[NavGetHashListAck], Awaitable[None]] | None = None
         self.cloud_get_commondata_ack_callback: (
             Callable[[NavGetCommDataAck | SvgMessageAckT], Awaitable[None]] | None
@@ -78,6 +91,23 @@ class MowerStateManager:
         self.properties_callback = DataEvent()
         self.status_callback = DataEvent()
         self.device_event_callback = DataEvent()
+        # Set whenever position, heading or work zone changes; each live-map client owns one
+        self._position_listeners: set[asyncio.Event] = set()
+        # (predicate, future) pairs resolved by the first update that makes predicate(device) true
+        self._waiters: list[tuple[Callable[[MowingDevice], bool], asyncio.Future[bool]]] = []
+        # {"map" | "mow_path": (source_key, {tolerance_m: geojson})}
+        self._geometry_cache: dict[str, tuple[tuple, dict[float, Any]]] = {}
+        # Last mower position in local map metres, and the zone index / lookup derived from it
+        self.local_position: tuple[float, float] | None = None
+        self._zone_index: tuple[tuple, ZoneIndex] | None = None
+        self._located: tuple[tuple, tuple[int | None, float | None]] | None = None
+        # Cover path of the current task, converted to lon/lat as frames arrive
+        self.mow_path_track = MowPathTrack()
+        # Where the mower has been: local x/y, heading and RTK status, thinned out with age
+        self.position_history = PositionHistory()
+        # SocMul.set_video_ack replies to video join/leave commands: how many, and the last result
+        self.video_acks = 0
+        self.video_ack_error: MulVideoErrorCode | None = None
 
     def get_device(self) -> MowingDevice:
         """Get device."""
@@ -91,6 +121,8 @@ class MowerStateManager:
         """Update device properties and invoke callback."""
         # TODO update device based off thing properties
         self._device.mqtt_properties = thing_properties
+        self.poll_scheduler.record_push(PROPERTIES)
+        self._check_waiters()
         await self.on_properties_callback(thing_properties)
 
     async def status(self, thing_status: ThingStatusMessage) -> None:
@@ -98,8 +130,13 @@ class MowerStateManager:
         if not self._device.online:
             self._device.online = True
         self._device.status_properties = thing_status
+        connected = thing_status.params.status.value == StatusType.CONNECTED
+        self.poll_scheduler.set_available(connected)
+        if connected:
+            self.poll_scheduler.record_push(STATUS)
         if self._device.mower_state.product_key == "":
             self._device.mower_state.product_key = thing_status.params.product_key
+        self._check_waiters()
         await self.on_status_callback(thing_status)
 
     async def device_event(self, device_event: ThingEventMessage) -> None:
@@ -107,6 +144,101 @@ class MowerStateManager:
         self._device.mqtt_device_event = device_event
         await self.on_device_event_callback(device_event)
 
+    def add_position_listener(self) -> asyncio.Event:
+        """Return an event that is set each time the mower position, heading or work zone changes."""
+        listener = asyncio.Event()
+        self._position_listeners.add(listener)
+        return listener
+
+    def remove_position_listener(self, listener: asyncio.Event) -> None:
+        """Stop notifying a listener returned by add_position_listener."""
+        self._position_listeners.discard(listener)
+
+    def _position_key(self) -> tuple:
+        location = self._device.location
+        return (
+            location.device.latitude,
+            location.device.longitude,
+            location.orientation,
+            location.work_zone,
+            location.position_type,
+        )
+
+    async def wait_until(self, predicate: Callable[[MowingDevice], bool], timeout: float) -> bool:
+        """Wait until ``predicate(device)`` holds, re-checking after every device update.
+
+        Returns True as soon as it holds (immediately if it already does), or False
+        once ``timeout`` seconds pass without it.
+        """
+        if self._holds(predicate):
+            return True
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        waiter = (predicate, future)
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            return False
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    async def wait_area_names(self, timeout: float = 20.0) -> bool:
+        """Wait until the area name list has been received."""
+        return await self.wait_until(lambda device: bool(device.map.area_name), timeout)
+
+    async def wait_rtk_and_dock(self, timeout: float = 20.0) -> bool:
+        """Wait until both the RTK base and the dock position are known."""
+        return await self.wait_until(
+            lambda device: device.location.RTK.latitude != 0 and device.location.dock.latitude != 0, timeout
+        )
+
+    async def wait_next_report(self, timeout: float = 10.0) -> bool:
+        """Wait for a report (``toapp_report_data`` or rapid state) newer than the call."""
+        seen = self.poll_scheduler.pushed_at(REPORT_DATA, RAPID_STATE)
+
+        def _reported(_device: MowingDevice) -> bool:
+            pushed_at = self.poll_scheduler.pushed_at(REPORT_DATA, RAPID_STATE)
+            return pushed_at is not None and (seen is None or pushed_at > seen)
+
+        return await self.wait_until(_reported, timeout)
+
+    async def wait_work_state(self, *modes: int, timeout: float = 10.0) -> bool:
+        """Wait until ``report_data.dev.sys_status`` is one of ``modes`` (see ``WorkMode``)."""
+        return await self.wait_until(lambda device: device.report_data.dev.sys_status in modes, timeout)
+
+    async def wait_video_ack(self, seen: int, timeout: float = 3.0) -> MulVideoErrorCode | None:
+        """Wait for a video join/leave acknowledgement after the first ``seen`` (a ``video_acks`` value).
+
+        Take ``seen`` before sending the command, so an ack that arrives before
+        the wait starts still counts. Returns the ack's error code (``SUCCESS``
+        when the mower joined), or None if none arrived within ``timeout``.
+        """
+        if await self.wait_until(lambda _device: self.video_acks > seen, timeout):
+            return self.video_ack_error
+        return None
+
+    def _holds(self, predicate: Callable[[MowingDevice], bool]) -> bool:
+        try:
+            return bool(predicate(self._device))
+        except Exception:  # a half-populated model just means "not yet"
+            return False
+
+    def _check_waiters(self) -> None:
+        """Resolve every waiter whose predicate the last update satisfied."""
+        for predicate, future in list(self._waiters):
+            if future.done() or not self._holds(predicate):
+                continue
+            loop = future.get_loop()
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                future.set_result(True)
+            else:
+                loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(True))
+
     @property
     def online(self) -> bool:
         """Return online status."""
@@ -174,6 +306,7 @@ class MowerStateManager:
         # additional catch all if we don't get a status update
         if not self._device.online:
             self._device.online = True
+        self.poll_scheduler.record_push(res[0])
 
         match res[0]:
             case "nav":
@@ -189,6 +322,7 @@ class MowerStateManager:
             case "ota":
                 self._update_ota_data(message)
 
+        self._check_waiters()
         await self.on_notification_callback(res)
 
     async def _update_nav_data(self, message: LubaMsg) -> None:
@@ -214,6 +348,7 @@ class MowerStateManager:
             case "cover_path_upload":
                 mow_path: CoverPathUploadT = nav_msg[1]
                 self._device.map.update_mow_path(MowPath.from_dict(mow_path.to_dict(casing=betterproto2.Casing.SNAKE)))
+                self.sync_mow_path(self._device.location.RTK)
                 if len(self._device.map.find_missing_mow_path_frames()) == 0:
                     self.generate_mowing_geojson(self._device.location.RTK)
 
@@ -266,15 +401,41 @@ class MowerStateManager:
     def _update_sys_data(self, message) -> None:
         """Update system."""
         sys_msg = betterproto2.which_one_of(message.sys, "SubSysMsg")
+        self.poll_scheduler.record_push(sys_msg[0])
         match sys_msg[0]:
             case "system_update_buf":
                 self._device.buffer(sys_msg[1])
             case "toapp_report_data":
+                before = self._position_key()
                 self._device.update_report_data(sys_msg[1])
+                locations = sys_msg[1].locations
+                if locations and locations[0].real_pos_y != 0:
+                    self.local_position = (
+                        parse_double(locations[0].real_pos_x, 4.0),
+                        parse_double(locations[0].real_pos_y, 4.0),
+                    )
+                    rtk = sys_msg[1].rtk
+                    rtk_status = (
+                        RTKStatus.from_code(rtk.status) if rtk is not None else self._device.mowing_state.rtk_status
+                    )
+                    self.position_history.record(
+                        *self.local_position, locations[0].real_toward / 10000, rtk_status.value
+                    )
+                self._notify_position(before)
             case "mow_to_app_info":
                 self._device.mow_info(sys_msg[1])
             case "system_tard_state_tunnel":
+                before = self._position_key()
                 self._device.run_state_update(sys_msg[1])
+                mowing_state = self._device.mowing_state
+                # RapidState.pos_x/y and toward are still x 10^4 after from_raw (run_state_update
+                # scales them again before converting), so bring them to metres and degrees like
+                # the report path above
+                self.local_position = (parse_double(mowing_state.pos_x, 4.0), parse_double(mowing_state.pos_y, 4.0))
+                self.position_history.record(
+                    *self.local_position, mowing_state.toward / 10000, mowing_state.rtk_status.value
+                )
+                self._notify_position(before)
             case "todev_time_ctrl_light":
                 ctrl_light: TimeCtrlLight = sys_msg[1]
                 side_led: SideLight = SideLight.from_dict(ctrl_light.to_dict(casing=betterproto2.Casing.SNAKE))
@@ -289,6 +450,12 @@ class MowerStateManager:
                 self._device.device_firmwares.device_version = device_fw_info.version
                 self._device.mower_state.swversion = device_fw_info.version
 
+    def _notify_position(self, before: tuple) -> None:
+        """Wake position listeners if the last update moved the mower."""
+        if self._position_listeners and self._position_key() != before:
+            for listener in self._position_listeners:
+                listener.set()
+
     def _update_driver_data(self, message) -> None:
         """Update driver data."""
         driver_msg = betterproto2.which_one_of(message.driver, "SubDrvMsg")
@@ -322,6 +489,10 @@ class MowerStateManager:
         """Media and video states."""
         mul_msg = betterproto2.which_one_of(message.mul, "SubMul")
         match mul_msg[0]:
+            case "set_video_ack":
+                video_ack: MulSetVideoAck = mul_msg[1]
+                self.video_ack_error = video_ack.error_code
+                self.video_acks += 1
             case "get_lamp_rsp":
                 lamp_resp: Getlamprsp = mul_msg[1]
                 self._device.mower_state.lamp_info.lamp_bright = lamp_resp.lamp_bright
@@ -341,6 +512,11 @@ class MowerStateManager:
 
     def generate_geojson(self, rtk: LocationPoint, dock: Dock) -> Any:
         """Generate geojson from frames."""
+        # shapely is only needed once a map is rendered, keep it off the import path
+        from shapely import Point
+
+        from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
         coordinator_converter = CoordinateConverter(rtk.latitude, rtk.longitude)
         RTK_real_loc = coordinator_converter.enu_to_lla(0, 0)
 
@@ -357,13 +533,84 @@ class MowerStateManager:
         return self._device.map.generated_geojson
 
     def generate_mowing_geojson(self, rtk: LocationPoint) -> Any:
-        """Generate geojson from frames."""
+        """Generate geojson from frames.
+
+        Only frames received since the previous call are converted, see MowPathTrack.
+        """
+        self._device.map.generated_mow_path_geojson = self.sync_mow_path(rtk).geojson()
+        return self._device.map.generated_mow_path_geojson
+
+    def sync_mow_path(self, rtk: LocationPoint) -> MowPathTrack:
+        """Append mow-path frames that arrived since the last sync to ``mow_path_track``."""
+        from shapely import Point
+
         coordinator_converter = CoordinateConverter(rtk.latitude, rtk.longitude)
         RTK_real_loc = coordinator_converter.enu_to_lla(0, 0)
-
-        self._device.map.generated_mow_path_geojson = GeojsonGenerator.generate_mow_path_geojson(
-            self._device.map,
-            Point(RTK_real_loc.latitude, RTK_real_loc.longitude),
+        self.mow_path_track.sync(
+            self._device.map.current_mow_path, Point(RTK_real_loc.latitude, RTK_real_loc.longitude)
+        )
+        return self.mow_path_track
+
+    def cached_geojson(self, rtk: LocationPoint, dock: Dock, tolerance_m: float = 0.0) -> dict[str, Any]:
+        """Return the map GeoJSON, simplified to ``tolerance_m`` metres.
+
+        Generated once per map revision and RTK/dock position, then simplified and
+        cached per tolerance. The result is a shallow copy callers may append to.
+        """
+        source_key = (
+            self._device.map.revision,
+            rtk.latitude,
+            rtk.longitude,
+            dock.latitude,
+            dock.longitude,
+            dock.rotation,
         )
+        geo = self._cached_geometry("map", source_key, tolerance_m, lambda: self.generate_geojson(rtk, dock))
+        return {**geo, "features": list(geo.get("features", []))}
 
-        return self._device.map.generated_mow_path_geojson
+    def cached_mowing_geojson(self, rtk: LocationPoint, tolerance_m: float = 0.0) -> dict[str, Any]:
+        """Return the mow-path GeoJSON, simplified to ``tolerance_m`` metres (see cached_geojson)."""
+        source_key = (self._device.map.revision, rtk.latitude, rtk.longitude)
+        geo = self._cached_geometry("mow_path", source_key, tolerance_m, lambda: self.generate_mowing_geojson(rtk))
+        return {**geo, "features": list(geo.get("features", []))}
+
+    @property
+    def zone_index(self) -> ZoneIndex:
+        """Spatial index of the map's areas, rebuilt only when the areas or their names change."""
+        revision = self._device.map.area_revision
+        if self._zone_index is None or self._zone_index[0] != revision:
+            self._zone_index = (revision, ZoneIndex(self._device.map))
+        return self._zone_index[1]
+
+    def locate_mower(self) -> tuple[int | None, float | None]:
+        """Return ``(zone_hash, signed distance to boundary in metres)`` for the mower.
+
+        Unlike ``location.work_zone`` this also works while the mower is not mowing.
+        The result is reused until the mower moves or the map changes, so callers on
+        every state refresh or position update pay for at most one index lookup.
+        """
+        if self.local_position is None:
+            return None, None
+        index = self.zone_index
+        key = (self._zone_index[0], self.local_position)
+        if self._located is None or self._located[0] != key:
+            self._located = (key, index.locate(*self.local_position))
+        return self._located[1]
+
+    def _cached_geometry(
+        self, kind: str, source_key: tuple, tolerance_m: float, build: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
+        tolerance_m = round(max(tolerance_m, 0.0), 2)
+        cached = self._geometry_cache.get(kind)
+        if cached is None or cached[0] != source_key:
+            cached = (source_key, {0.0: build()})
+            self._geometry_cache[kind] = cached
+        variants = cached[1]
+        if tolerance_m not in variants:
+            if len(variants) > GEOMETRY_CACHE_VARIANTS:
+                # Drop the oldest simplified variant, never the full-resolution source
+                variants.pop(next(tol for tol in variants if tol != 0.0))
+            variants[tolerance_m] = GeojsonGenerator.simplify_geojson(variants[0.0], tolerance_m)
+        return variants[tolerance_m]
@@ -1,38 +1,66 @@
 import asyncio
 from collections.abc import Callable
+from inspect import isawaitable
 from types import MethodType
 from typing import Any
 import weakref
 
 
 class Event:
+    """Weakly referenced handlers, called in subscription order.
+
+    Handlers may be plain functions or coroutine functions. Plain ones are called
+    directly; coroutines are awaited, concurrently when there are several. The
+    handler tuple is only rebuilt on subscribe/unsubscribe or after a handler has
+    been garbage collected (a weakref callback flags it), not on every fire.
+    """
+
     def __init__(self) -> None:
-        self.__eventhandlers: list[weakref.ReferenceType] = []
+        self.__eventhandlers: tuple[weakref.ReferenceType, ...] = ()
+        self.__dead = False
+
+    def __mark_dead(self, _ref: weakref.ReferenceType) -> None:
+        self.__dead = True
 
     def __iadd__(self, handler: Callable) -> "Event":
         if isinstance(handler, MethodType):
             # Instance method, use WeakMethod
-            ref = weakref.WeakMethod(handler)
+            ref = weakref.WeakMethod(handler, self.__mark_dead)
         else:
             # Function or static method, use weakref.ref
-            ref = weakref.ref(handler)
-        self.__eventhandlers.append(ref)
+            ref = weakref.ref(handler, self.__mark_dead)
+        self.__eventhandlers = (*self.__eventhandlers, ref)
         return self
 
     def __isub__(self, handler: Callable) -> "Event":
-        self.__eventhandlers = [ref for ref in self.__eventhandlers if ref() is not handler]
+        # == rather than `is`: every attribute access creates a new bound-method object
+        self.__eventhandlers = tuple(ref for ref in self.__eventhandlers if ref() != handler)
         return self
 
     async def __call__(self, *args: Any, **kwargs: Any) -> None:
-        live_handlers = []
-        for ref in self.__eventhandlers:
+        if self.__dead:
+            # Clean up dead references
+            self.__dead = False
+            self.__eventhandlers = tuple(ref for ref in self.__eventhandlers if ref() is not None)
+        handlers = self.__eventhandlers
+        if len(handlers) == 1:
+            func = handlers[0]()
+            if func is not None:
+                result = func(*args, **kwargs)
+                if result is not None and isawaitable(result):
+                    await result
+            return
+        pending = []
+        for ref in handlers:
             func = ref()
             if func is not None:
-                live_handlers.append(func(*args, **kwargs))
-        await asyncio.gather(*live_handlers)
-
-        # Clean up dead references
-        self.__eventhandlers = [ref for ref in self.__eventhandlers if ref() is not None]
+                result = func(*args, **kwargs)
+                if result is not None and isawaitable(result):
+                    pending.append(result)
+        if len(pending) == 1:
+            await pending[0]
+        elif pending:
+            await asyncio.gather(*pending)
 
     def has_dead_handlers(self) -> bool:
         """Check if any handlers have been garbage collected."""
@@ -76,13 +104,13 @@ class DataEvent:
     def __init__(self) -> None:
         self.on_data_event = Event()
 
-    async def data_event(self, data: Any) -> None:
+    async def data_event(self, data: Any = None, **kwargs: Any) -> None:
         """Execute the data event callback."""
         # This function will be executed when data is received.
         if data:
-            await self.on_data_event(data)
+            await self.on_data_event(data, **kwargs)
         else:
-            await self.on_data_event()
+            await self.on_data_event(**kwargs)
 
     def add_subscribers(self, obj_method: Callable) -> None:
         """Add subscribers."""
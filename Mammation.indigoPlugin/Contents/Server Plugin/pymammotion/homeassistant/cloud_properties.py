@@ -0,0 +1,66 @@
+"""Batched cloud property and firmware refresh shared by the mower and RTK APIs."""
+
+from collections.abc import Callable, Iterable
+from logging import getLogger
+
+from pymammotion.aliyun.cloud_gateway import (
+    CloudIOTGateway,
+    DeviceOfflineException,
+    GatewayTimeoutException,
+    SetupException,
+)
+from pymammotion.aliyun.model.thing_response import ThingPropertiesResponse
+from pymammotion.mammotion.devices.managers.managers import AbstractDeviceManager
+
+logger = getLogger(__name__)
+
+
+async def refresh_cloud_properties(
+    devices: Iterable[AbstractDeviceManager],
+    apply_properties: Callable[[AbstractDeviceManager, ThingPropertiesResponse], None],
+) -> None:
+    """Refresh properties and OTA info for many devices, one batch per cloud account.
+
+    Devices sharing a cloud client are fetched together with
+    ``get_devices_properties`` and their OTA info with a single
+    ``get_device_ota_firmware`` call. A failure for one device, including a
+    response ``apply_properties`` cannot parse, only affects that device.
+    """
+    by_client: dict[int, tuple[CloudIOTGateway, list[AbstractDeviceManager]]] = {}
+    for device in devices:
+        if device.cloud_client is None:
+            continue
+        by_client.setdefault(id(device.cloud_client), (device.cloud_client, []))[1].append(device)
+
+    for cloud_client, batch in by_client.values():
+        try:
+            responses = await cloud_client.get_devices_properties([device.iot_id for device in batch])
+        except (SetupException, GatewayTimeoutException) as ex:
+            logger.debug("Properties refresh skipped: %s", ex)
+            continue
+        updated: list[AbstractDeviceManager] = []
+        for device in batch:
+            response = responses.get(device.iot_id)
+            if isinstance(response, DeviceOfflineException):
+                device.state.online = False
+            elif isinstance(response, ThingPropertiesResponse):
+                try:
+                    apply_properties(device, response)
+                except Exception as ex:
+                    logger.debug("%s properties could not be applied: %s", device.name, ex)
+                    continue
+                updated.append(device)
+            elif not isinstance(response, SetupException | GatewayTimeoutException):
+                logger.debug("%s properties update failed: %s", device.name, response)
+
+        if not updated:
+            continue
+        try:
+            ota_info = await cloud_client.mammotion_http.get_device_ota_firmware([device.iot_id for device in updated])
+        except Exception as ex:
+            logger.debug("Firmware check failed: %s", ex)
+            continue
+        by_iot_id = {device.iot_id: device for device in updated}
+        for check_version in ota_info.data or []:
+            if device := by_iot_id.get(check_version.device_id):
+                device.state.update_check = check_version
@@ -12,13 +12,17 @@ from pymammotion.aliyun.cloud_gateway import (
     GatewayTimeoutException,
     NoConnectionException,
 )
+from pymammotion.aliyun.model.thing_response import ThingPropertiesResponse
 from pymammotion.data.model import GenerateRouteInformation
 from pymammotion.data.model.device import MowingDevice
 from pymammotion.data.model.device_config import OperationSettings, create_path_order
+from pymammotion.homeassistant.cloud_properties import refresh_cloud_properties
+from pymammotion.http.model.http import CheckDeviceVersion
 from pymammotion.mammotion.devices import MammotionMowerDeviceManager
 from pymammotion.mammotion.devices.mammotion import Mammotion
 from pymammotion.proto import RptAct, RptInfoType
 from pymammotion.utility.device_type import DeviceType
+from pymammotion.utility.poll_scheduler import RAPID_STATE, REPORT_DATA
 
 logger = getLogger(__name__)
 
@@ -108,7 +112,11 @@ class HomeAssistantMowerApi:
             await self.async_send_command(device_name, "get_error_timestamp")
             self._mark_api_called("get_errors")
 
-        if self._should_call_api("get_report_cfg"):
+        # Skip the report poll while the mower is already pushing reports on its own
+        scheduler = device.state_manager.poll_scheduler
+        report_interval = self._call_intervals["get_report_cfg"].total_seconds()
+        if scheduler.should_poll("get_report_cfg", report_interval, REPORT_DATA, RAPID_STATE):
+            scheduler.record_poll("get_report_cfg")
             await self.async_send_command(device_name, "get_report_cfg")
             self._mark_api_called("get_report_cfg")
 
@@ -117,10 +125,23 @@ class HomeAssistantMowerApi:
             self._mark_api_called("get_maintenance")
 
         if self._should_call_api("device_version_upgrade"):
+            # Interval is account-wide, so one batch covers every mower
             self._mark_api_called("device_version_upgrade")
+            await self.update_cloud_properties()
 
         return device.state
 
+    async def update_cloud_properties(self) -> None:
+        """Refresh OTA progress and firmware info for every mower, one batch per account."""
+        await refresh_cloud_properties(self._mammotion.device_manager.devices.values(), self._apply_properties)
+
+    @staticmethod
+    def _apply_properties(device: MammotionMowerDeviceManager, response: ThingPropertiesResponse) -> None:
+        if response.code == 200 and (data := response.data):
+            if ota_progress := data.otaProgress:
+                device.state.update_check = CheckDeviceVersion.from_dict(ota_progress.value)
+        device.state.online = True
+
     async def async_send_command(self, device_name: str, command: str, **kwargs: Any) -> bool | None:
         """Send command."""
         device = self._mammotion.get_device_by_name(device_name)
@@ -1,54 +1,70 @@
+import asyncio
 import json
+from logging import getLogger
+import time
 
-from pymammotion.aliyun.cloud_gateway import DeviceOfflineException, GatewayTimeoutException, SetupException
+from pymammotion.aliyun.model.thing_response import ThingPropertiesResponse
 from pymammotion.data.model.device import RTKDevice
+from pymammotion.homeassistant.cloud_properties import refresh_cloud_properties
 from pymammotion.http.model.http import CheckDeviceVersion
 from pymammotion.mammotion.devices.mammotion import Mammotion
+from pymammotion.mammotion.devices.rtk_manager import MammotionRTKDeviceManager
+
+logger = getLogger(__name__)
+
+# Seconds a finished update_all batch answers update() calls for other bases
+BATCH_REUSE = 10.0
 
 
 class HomeAssistantRTKApi:
     def __init__(self) -> None:
         self._mammotion = Mammotion()
+        self._batch: asyncio.Future | None = None
+        self._batch_at = 0.0
 
     @property
     def mammotion(self) -> Mammotion:
         return self._mammotion
 
     async def update(self, device_name: str) -> RTKDevice:
-        """Update RTK data."""
+        """Update RTK data.
+
+        Bases are refreshed together by :meth:`update_all`; calls for several bases
+        within ``BATCH_REUSE`` seconds share one batch instead of each fetching alone.
+        """
         device = self.mammotion.get_rtk_device_by_name(device_name)
+        if self._batch is None or (self._batch.done() and time.monotonic() - self._batch_at >= BATCH_REUSE):
+            self._batch = asyncio.ensure_future(self.update_all())
+            self._batch_at = time.monotonic()
         try:
-            response = await device.cloud_client.get_device_properties(device.iot_id)
-            if response.code == 200:
-                if data := response.data:
-                    if ota_progress := data.otaProgress:
-                        device.state.update_check = CheckDeviceVersion.from_dict(ota_progress.value)
-                    if network_info := data.networkInfo:
-                        network = json.loads(network_info.value)
-                        device.state.wifi_rssi = network["wifi_rssi"]
-                        device.state.wifi_sta_mac = network["wifi_sta_mac"]
-                        device.state.bt_mac = network["bt_mac"]
-                    if coordinate := data.coordinate:
-                        coord_val = json.loads(coordinate.value)
-                        if device.state.lat == 0:
-                            device.state.lat = coord_val["lat"]
-                        if device.state.lon == 0:
-                            device.state.lon = coord_val["lon"]
-                    if device_version := data.deviceVersion:
-                        device.state.device_version = device_version.value
-            device.state.online = True
-
-            ota_info = await device.cloud_client.mammotion_http.get_device_ota_firmware([device.state.iot_id])
-            if check_versions := ota_info.data:
-                for check_version in check_versions:
-                    if check_version.device_id == device.state.iot_id:
-                        device.state.update_check = check_version
-            return device.state
-        except SetupException:
-            """Cloud IOT Gateway is not setup."""
-            return device.state
-        except DeviceOfflineException:
-            device.state.online = False
-        except GatewayTimeoutException:
-            """Gateway is timing out again."""
+            await asyncio.shield(self._batch)
+        except Exception as ex:
+            logger.debug("RTK update failed: %s", ex)
         return device.state
+
+    async def update_all(self) -> dict[str, RTKDevice]:
+        """Update every RTK base, fetching properties and firmware per account in one batch."""
+        devices = list(self.mammotion.device_manager.rtk_devices.values())
+        await refresh_cloud_properties(devices, self._apply_properties)
+        return {device.name: device.state for device in devices}
+
+    @staticmethod
+    def _apply_properties(device: MammotionRTKDeviceManager, response: ThingPropertiesResponse) -> None:
+        if response.code == 200:
+            if data := response.data:
+                if ota_progress := data.otaProgress:
+                    device.state.update_check = CheckDeviceVersion.from_dict(ota_progress.value)
+                if network_info := data.networkInfo:
+                    network = json.loads(network_info.value)
+                    device.state.wifi_rssi = network["wifi_rssi"]
+                    device.state.wifi_sta_mac = network["wifi_sta_mac"]
+                    device.state.bt_mac = network["bt_mac"]
+                if coordinate := data.coordinate:
+                    coord_val = json.loads(coordinate.value)
+                    if device.state.lat == 0:
+                        device.state.lat = coord_val["lat"]
+                    if device.state.lon == 0:
+                        device.state.lon = coord_val["lon"]
+                if device_version := data.deviceVersion:
+                    device.state.device_version = device_version.value
+        device.state.online = True
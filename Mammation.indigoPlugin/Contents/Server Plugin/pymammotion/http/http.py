@@ -37,6 +37,7 @@ from pymammotion.http.model.http import (
 )
 from pymammotion.http.model.response_factory import response_factory
 from pymammotion.http.model.rtk import RTK
+from pymammotion.utility.token_refresher import TokenRefresher
 
 T = TypeVar("T")
 
@@ -131,6 +132,13 @@ class MammotionHTTP:
         self.jwt_info: JWTTokenInfo = JWTTokenInfo("", "")
         self._headers = {"User-Agent": "okhttp/4.9.3", "App-Version": "Home Assistant,1.15.6.14"}
         self.encryption_utils = EncryptionUtils()
+        # Renews the access token at 80% of its lifetime; decorated calls share one refresh
+        self.token_refresher = TokenRefresher(
+            "mammotion",
+            self.refresh_login,
+            issued_at=lambda: self.expires_in - (self.login_info.expires_in if self.login_info else 0),
+            expires_at=lambda: self.expires_in,
+        )
 
         # Add this method to generate a 10-digit random number
         def get_10_random() -> str:
@@ -169,9 +177,8 @@ class MammotionHTTP:
 
         @wraps(func)
         async def wrapper(self: MammotionHTTP, *args: Any, **kwargs: Any) -> T:
-            # Check if token will expire in the next 5 minutes
-            if self.expires_in < time.time() + 300:  # 300 seconds = 5 minutes
-                await self.refresh_login()
+            # Refresh if the token is due (at the latest 5 minutes before expiry)
+            await self.token_refresher.ensure_fresh()
             return await func(self, *args, **kwargs)
 
         return wrapper
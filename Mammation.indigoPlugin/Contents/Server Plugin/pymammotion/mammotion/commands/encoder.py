@@ -0,0 +1,102 @@
+"""Encode LubaMsg envelopes around pre-serialized sub-messages.
+
+``encode_luba_msg`` produces exactly the bytes ``LubaMsg(...).SerializeToString()``
+would, but only ``seqs`` and ``timestamp`` are encoded per call: the envelope
+head (type, sender, receiver, attributes) and body (version, subtype and the
+length-prefixed sub-message) are cached. Together with ``static_payload``, a
+periodic poll no longer rebuilds or serializes any protobuf tree after its
+first send.
+"""
+
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+
+import betterproto2
+
+# LubaMsg "LubaSubMsg" oneof field numbers
+NET = 8
+SYS = 10
+NAV = 11
+DRIVER = 12
+
+_WIRE_VARINT = 0
+_WIRE_LEN = 2
+
+_static_payloads: dict[Hashable, bytes] = {}
+
+
+def _varint(value: int) -> bytes:
+    """Encode an integer as a protobuf varint (negative int32/int64 use ten bytes)."""
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _varint_field(number: int, value: int) -> bytes:
+    """Encode a proto3 scalar varint field, omitted when it holds the default 0."""
+    if not value:
+        return b""
+    return _varint(number << 3 | _WIRE_VARINT) + _varint(value)
+
+
+@lru_cache(maxsize=256)
+def _envelope_head(msgtype: int, sender: int, rcver: int, msgattr: int) -> bytes:
+    return _varint_field(1, msgtype) + _varint_field(2, sender) + _varint_field(3, rcver) + _varint_field(4, msgattr)
+
+
+@lru_cache(maxsize=1024)
+def _envelope_body(version: int, subtype: int, sub_field: int, payload: bytes) -> bytes:
+    return (
+        _varint_field(6, version)
+        + _varint_field(7, subtype)
+        + _varint(sub_field << 3 | _WIRE_LEN)
+        + _varint(len(payload))
+        + payload
+    )
+
+
+def encode_luba_msg(
+    *,
+    msgtype: int,
+    sender: int,
+    rcver: int,
+    msgattr: int,
+    seqs: int,
+    version: int,
+    subtype: int,
+    sub_field: int,
+    payload: bytes,
+    timestamp: int,
+) -> bytes:
+    """Return the serialized LubaMsg carrying ``payload`` in oneof field ``sub_field``.
+
+    Fields are written in LubaMsg declaration order (1-7, the sub-message, then
+    ``timestamp`` = 15), which is the order betterproto2 serializes them in.
+    """
+    return (
+        _envelope_head(int(msgtype), int(sender), int(rcver), int(msgattr))
+        + _varint_field(5, seqs)
+        + _envelope_body(version, subtype, sub_field, payload)
+        + _varint_field(15, timestamp)
+    )
+
+
+def static_payload(key: Hashable, build: Callable[[], betterproto2.Message]) -> bytes:
+    """Serialize ``build()`` the first time ``key`` is seen and reuse the bytes afterwards.
+
+    ``key`` must capture every argument the message depends on, e.g.
+    ``("get_report_cfg", timeout, period, no_change_period)``.
+    """
+    payload = _static_payloads.get(key)
+    if payload is None:
+        payload = _static_payloads[key] = bytes(build())
+    return payload
+
+
+def as_payload(build: betterproto2.Message | bytes) -> bytes:
+    """Return ``build`` serialized, passing already-serialized payloads through."""
+    return build if isinstance(build, bytes) else bytes(build)
@@ -4,6 +4,7 @@ from logging import getLogger
 import time
 
 from pymammotion.mammotion.commands.abstract_message import AbstractMessage
+from pymammotion.mammotion.commands.encoder import DRIVER, as_payload, encode_luba_msg, static_payload
 from pymammotion.proto import (
     AppGetCutterWorkMode,
     AppSetCutterWorkMode,
@@ -11,7 +12,6 @@ from pymammotion.proto import (
     DrvMotionCtrl,
     DrvMowCtrlByHand,
     DrvSrSpeed,
-    LubaMsg,
     MctlDriver,
     MsgAttr,
     MsgCmdType,
@@ -24,9 +24,9 @@ logger = getLogger(__name__)
 
 
 class MessageDriver(AbstractMessage, ABC):
-    def send_order_msg_driver(self, driver) -> bytes:
+    def send_order_msg_driver(self, driver: MctlDriver | bytes) -> bytes:
         """Build and serialize a driver command message."""
-        return LubaMsg(
+        return encode_luba_msg(
             msgtype=MsgCmdType.EMBED_DRIVER,
             sender=MsgDevice.DEV_MOBILEAPP,
             rcver=self.get_msg_device(MsgCmdType.EMBED_DRIVER, MsgDevice.DEV_MAINCTL),
@@ -35,8 +35,9 @@ class MessageDriver(AbstractMessage, ABC):
             seqs=self.seqs.increment_and_get() & 255,
             version=1,
             subtype=self.user_account,
-            driver=driver,
-        ).SerializeToString()
+            sub_field=DRIVER,
+            payload=as_payload(driver),
+        )
 
     def set_blade_height(self, height: int) -> bytes:
         """Set mower blade height."""
@@ -54,7 +55,7 @@ class MessageDriver(AbstractMessage, ABC):
 
     def get_cutter_mode(self) -> bytes:
         """Request the current cutter mode."""
-        build = MctlDriver(current_cutter_mode=AppGetCutterWorkMode())
+        build = static_payload("get_cutter_mode", lambda: MctlDriver(current_cutter_mode=AppGetCutterWorkMode()))
         return self.send_order_msg_driver(build)
 
     def set_cutter_mode(self, cutter_mode: int) -> bytes:
@@ -84,7 +85,7 @@ class MessageDriver(AbstractMessage, ABC):
 
     def get_speed(self) -> bytes:
         """Request the current speed value."""
-        build = MctlDriver(bidire_speed_read_set=DrvSrSpeed(rw=0))
+        build = static_payload("get_speed", lambda: MctlDriver(bidire_speed_read_set=DrvSrSpeed(rw=0)))
         logger.debug("Send command--Get speed value")
         return self.send_order_msg_driver(build)
 
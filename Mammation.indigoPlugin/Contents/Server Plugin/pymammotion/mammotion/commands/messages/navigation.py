@@ -7,9 +7,9 @@ from pymammotion.data.model import GenerateRouteInformation
 from pymammotion.data.model.hash_list import Plan
 from pymammotion.data.model.region_data import RegionData
 from pymammotion.mammotion.commands.abstract_message import AbstractMessage
+from pymammotion.mammotion.commands.encoder import NAV, as_payload, encode_luba_msg, static_payload
 from pymammotion.proto import (
     AppRequestCoverPathsT,
-    LubaMsg,
     MctlNav,
     MsgAttr,
     MsgCmdType,
@@ -33,8 +33,9 @@ logger = logging.getLogger(__name__)
 
 
 class MessageNavigation(AbstractMessage, ABC):
-    def send_order_msg_nav(self, build: MctlNav) -> bytes:
-        luba_msg = LubaMsg(
+    def send_order_msg_nav(self, build: MctlNav | bytes) -> bytes:
+        """Wrap a navigation sub-message (or its pre-serialized bytes) in a LubaMsg."""
+        return encode_luba_msg(
             msgtype=MsgCmdType.NAV,
             sender=MsgDevice.DEV_MOBILEAPP,
             rcver=self.get_msg_device(MsgCmdType.NAV, MsgDevice.DEV_MAINCTL),
@@ -42,84 +43,107 @@ class MessageNavigation(AbstractMessage, ABC):
             seqs=self.seqs.increment_and_get() & 255,
             version=1,
             subtype=self.user_account,
-            nav=build,
+            sub_field=NAV,
+            payload=as_payload(build),
             timestamp=round(time.time() * 1000),
         )
 
-        return luba_msg.SerializeToString()
-
     def allpowerfull_rw_adapter_x3(self, rw_id: int, context: int, rw: int) -> bytes:
         build = MctlNav(nav_sys_param_cmd=NavSysParamMsg(id=rw_id, context=context, rw=rw))
         logger.debug(f"Send command--x3 general read and write command id={rw_id}, context={context}, rw={rw}")
         return self.send_order_msg_nav(build)
 
     def along_border(self) -> bytes:
-        build = MctlNav(todev_edgecmd=1)
+        build = static_payload("along_border", lambda: MctlNav(todev_edgecmd=1))
         logger.debug("Send command--along the edge command")
         return self.send_order_msg_nav(build)
 
     def start_draw_border(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=0))
+        build = static_payload(
+            "start_draw_border", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=0))
+        )
         logger.debug("Send command--Start drawing boundary command")
         return self.send_order_msg_nav(build)
 
     def enter_dumping_status(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=14, type=12))
+        build = static_payload(
+            "enter_dumping_status", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=14, type=12))
+        )
         logger.debug("Send command--Enter grass collection status")
         return self.send_order_msg_nav(build)
 
     def add_dump_point(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=12))
+        build = static_payload(
+            "add_dump_point", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=12))
+        )
         logger.debug("Send command--Add grass collection point")
         return self.send_order_msg_nav(build)
 
     def revoke_dump_point(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=6, type=12))
+        build = static_payload(
+            "revoke_dump_point", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=6, type=12))
+        )
         logger.debug("Send command--Revoke grass collection point")
         return self.send_order_msg_nav(build)
 
     def exit_dumping_status(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=1, type=12))
+        build = static_payload(
+            "exit_dumping_status", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=1, type=12))
+        )
         logger.debug("Send command--Exit grass collection setting status")
         return self.send_order_msg_nav(build)
 
     def out_drop_dumping_add(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=15, type=12))
+        build = static_payload(
+            "out_drop_dumping_add", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=15, type=12))
+        )
         logger.debug("Send command--Complete external grass collection point marking operation")
         return self.send_order_msg_nav(build)
 
     def recover_dumping(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=12, type=12))
+        build = static_payload(
+            "recover_dumping", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=12, type=12))
+        )
         logger.debug("Send command--Recover grass collection operation")
         return self.send_order_msg_nav(build)
 
     def start_draw_barrier(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=1))
+        build = static_payload(
+            "start_draw_barrier", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=1))
+        )
         logger.debug("Sending command - Draw obstacle command")
         return self.send_order_msg_nav(build)
 
     def start_erase(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=4, type=0))
+        build = static_payload(
+            "start_erase", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=4, type=0))
+        )
         logger.debug("Sending command - Start erase command - Bluetooth")
         return self.send_order_msg_nav(build)
 
     def end_erase(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=5, type=0))
+        build = static_payload(
+            "end_erase", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=5, type=0))
+        )
         logger.debug("Sending command - End erase command")
         return self.send_order_msg_nav(build)
 
     def cancel_erase(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=7, type=0))
+        build = static_payload(
+            "cancel_erase", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=7, type=0))
+        )
         logger.debug("Sending command - Cancel erase command")
         return self.send_order_msg_nav(build)
 
     def start_channel_line(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=2))
+        build = static_payload(
+            "start_channel_line", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=0, type=2))
+        )
         logger.debug("Sending command - Start drawing channel line command")
         return self.send_order_msg_nav(build)
 
     def save_task(self) -> bytes:
-        build = MctlNav(todev_save_task=1)
+        build = static_payload("save_task", lambda: MctlNav(todev_save_task=1))
         logger.debug("Sending command - Save task command")
         return self.send_order_msg_nav(build)
 
@@ -218,7 +242,10 @@ class MessageNavigation(AbstractMessage, ABC):
         return self.send_order_msg_nav(MctlNav(plan_task_execute=NavPlanTaskExecute(sub_cmd=1, id=plan_id)))
 
     def read_plan(self, sub_cmd: int, plan_index: int = 0) -> bytes:
-        build = MctlNav(todev_planjob_set=NavPlanJobSet(sub_cmd=sub_cmd, plan_index=plan_index))
+        build = static_payload(
+            ("read_plan", sub_cmd, plan_index),
+            lambda: MctlNav(todev_planjob_set=NavPlanJobSet(sub_cmd=sub_cmd, plan_index=plan_index)),
+        )
         logger.debug(f"Send read job plan command cmd={sub_cmd} PlanIndex = {plan_index}")
         return self.send_order_msg_nav(build)
 
@@ -270,7 +297,9 @@ class MessageNavigation(AbstractMessage, ABC):
 
     def job_do_not_disturb_del(self) -> bytes:
         """Delete do not disturb settings."""
-        build = MctlNav(todev_unable_time_set=NavUnableTimeSet(sub_cmd=1, trigger=0))
+        build = static_payload(
+            "job_do_not_disturb_del", lambda: MctlNav(todev_unable_time_set=NavUnableTimeSet(sub_cmd=1, trigger=0))
+        )
         logger.debug("Send command - Turn off do not disturb time")
         return self.send_order_msg_nav(build)
 
@@ -281,19 +310,22 @@ class MessageNavigation(AbstractMessage, ABC):
         return self.send_order_msg_nav(MctlNav(todev_work_report_cmd=WorkReportCmdData(sub_cmd=1, get_info_num=num)))
 
     def leave_dock(self) -> bytes:
-        build = MctlNav(todev_one_touch_leave_pile=1)
+        build = static_payload("leave_dock", lambda: MctlNav(todev_one_touch_leave_pile=1))
         logger.debug("Send command--One-click automatic undocking")
         return self.send_order_msg_nav(build)
 
     def get_area_name_list(self, device_id: str) -> bytes:
         # Build the NavMapNameMsg with the specified parameters
-        mctl_nav = MctlNav(
-            toapp_map_name_msg=NavMapNameMsg(
-                hash=0,
-                result=0,
-                device_id=device_id,  # iot_id
-                rw=0,
-            )
+        mctl_nav = static_payload(
+            ("get_area_name_list", device_id),
+            lambda: MctlNav(
+                toapp_map_name_msg=NavMapNameMsg(
+                    hash=0,
+                    result=0,
+                    device_id=device_id,  # iot_id
+                    rw=0,
+                )
+            ),
         )
 
         # Send the message with the specified ID and acknowledge flag
@@ -311,7 +343,10 @@ class MessageNavigation(AbstractMessage, ABC):
         return self.send_order_msg_nav(mctl_nav)
 
     def get_all_boundary_hash_list(self, sub_cmd: int) -> bytes:
-        build = MctlNav(todev_gethash=NavGetHashList(pver=1, sub_cmd=sub_cmd))
+        build = static_payload(
+            ("get_all_boundary_hash_list", sub_cmd),
+            lambda: MctlNav(todev_gethash=NavGetHashList(pver=1, sub_cmd=sub_cmd)),
+        )
         logger.debug(f"Area loading=====================:Get area hash list:{sub_cmd}")
         return self.send_order_msg_nav(build)
 
@@ -330,7 +365,10 @@ class MessageNavigation(AbstractMessage, ABC):
         return self.send_order_msg_nav(build)
 
     def get_area_to_be_transferred(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=8, sub_cmd=1, type=3))
+        build = static_payload(
+            "get_area_to_be_transferred",
+            lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=8, sub_cmd=1, type=3)),
+        )
         logger.debug("Send command--Get transfer area before charging pile")
         return self.send_order_msg_nav(build)
 
@@ -367,7 +405,9 @@ class MessageNavigation(AbstractMessage, ABC):
         return self.send_order_msg_nav(build)
 
     def cancel_current_record(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=7, sub_cmd=0))
+        build = static_payload(
+            "cancel_current_record", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=7, sub_cmd=0))
+        )
         logger.debug("Send command--Cancel current recording (boundary, obstacle)")
         return self.send_order_msg_nav(build)
 
@@ -380,18 +420,24 @@ class MessageNavigation(AbstractMessage, ABC):
 
     def delete_charge_point(self) -> bytes:
         logger.debug("Delete charging pile")
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=6, type=5))
+        build = static_payload(
+            "delete_charge_point", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=6, type=5))
+        )
         logger.debug("Send command--Delete charging pile location and reset")
         return self.send_order_msg_nav(build)
 
     def confirm_base_station(self) -> bytes:
         logger.debug("Reset base station")
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=2, type=7))
+        build = static_payload(
+            "confirm_base_station", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=2, type=7))
+        )
         logger.debug("Send command--Confirm no modification to base station")
         return self.send_order_msg_nav(build)
 
     def delete_all(self) -> bytes:
-        build = MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=6, type=6))
+        build = static_payload(
+            "delete_all", lambda: MctlNav(todev_get_commondata=NavGetCommData(pver=1, action=6, type=6))
+        )
         logger.debug("Send command--Clear job data")
         return self.send_order_msg_nav(build)
 
@@ -473,32 +519,40 @@ class MessageNavigation(AbstractMessage, ABC):
 
     def start_job(self) -> bytes:
         logger.debug("Sending==========Start job command")
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=1, result=0))
+        build = static_payload("start_job", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=1, result=0)))
         logger.debug("Sending command--Start job")
         return self.send_order_msg_nav(build)
 
     def cancel_return_to_dock(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=12, result=0))
+        build = static_payload(
+            "cancel_return_to_dock", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=12, result=0))
+        )
         logger.debug("Send command - Cancel return to charge")
         return self.send_order_msg_nav(build)
 
     def cancel_job(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=4, result=0))
+        build = static_payload("cancel_job", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=4, result=0)))
         logger.debug("Send command - End job")
         return self.send_order_msg_nav(build)
 
     def return_to_dock(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=5, result=0))
+        build = static_payload(
+            "return_to_dock", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=5, result=0))
+        )
         logger.debug("Send command - Return to charge command")
         return self.send_order_msg_nav(build)
 
     def pause_execute_task(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=2, result=0))
+        build = static_payload(
+            "pause_execute_task", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=2, result=0))
+        )
         logger.debug("Send command - Pause command")
         return self.send_order_msg_nav(build)
 
     def re_charge_test(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=10, result=0))
+        build = static_payload(
+            "re_charge_test", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=10, result=0))
+        )
         logger.debug("Send command - Return to charge test command")
         return self.send_order_msg_nav(build)
 
@@ -508,21 +562,29 @@ class MessageNavigation(AbstractMessage, ABC):
         return self.send_order_msg_nav(build)
 
     def resume_execute_task(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=3, result=0))
+        build = static_payload(
+            "resume_execute_task", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=3, result=0))
+        )
         logger.debug("Send command - Cancel pause command")
         return self.send_order_msg_nav(build)
 
     def break_point_continue(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=7, result=0))
+        build = static_payload(
+            "break_point_continue", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=7, result=0))
+        )
         logger.debug("Send command - Continue from breakpoint")
         return self.send_order_msg_nav(build)
 
     def break_point_anywhere_continue(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=9, result=0))
+        build = static_payload(
+            "break_point_anywhere_continue", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=1, action=9, result=0))
+        )
         logger.debug("Send command - Continue from current vehicle position")
         return self.send_order_msg_nav(build)
 
     def reset_base_station(self) -> bytes:
-        build = MctlNav(todev_taskctrl=NavTaskCtrl(type=3, action=1, result=0))
+        build = static_payload(
+            "reset_base_station", lambda: MctlNav(todev_taskctrl=NavTaskCtrl(type=3, action=1, result=0))
+        )
         logger.debug("Send command - Reset charging pile, base station position")
         return self.send_order_msg_nav(build)
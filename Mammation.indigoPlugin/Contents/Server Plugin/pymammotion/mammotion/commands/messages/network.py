@@ -4,6 +4,7 @@ import time
 
 from pymammotion import logger
 from pymammotion.mammotion.commands.abstract_message import AbstractMessage
+from pymammotion.mammotion.commands.encoder import NET, as_payload, encode_luba_msg, static_payload
 from pymammotion.proto import (
     DevNet,
     DrvDebugDdsZmq,
@@ -17,7 +18,6 @@ from pymammotion.proto import (
     DrvWifiUpload,
     GetNetworkInfoReq,
     IotConctrlType,
-    LubaMsg,
     MnetCfg,
     MsgAttr,
     MsgCmdType,
@@ -28,8 +28,8 @@ from pymammotion.proto import (
 
 
 class MessageNetwork(AbstractMessage, ABC):
-    def send_order_msg_net(self, build: DevNet) -> bytes:
-        luba_msg = LubaMsg(
+    def send_order_msg_net(self, build: DevNet | bytes) -> bytes:
+        return encode_luba_msg(
             msgtype=MsgCmdType.ESP,
             sender=MsgDevice.DEV_MOBILEAPP,
             rcver=MsgDevice.DEV_COMM_ESP,
@@ -37,31 +37,34 @@ class MessageNetwork(AbstractMessage, ABC):
             seqs=self.seqs.increment_and_get() & 255,
             version=1,
             subtype=self.user_account,
-            net=build,
+            sub_field=NET,
+            payload=as_payload(build),
             timestamp=round(time.time() * 1000),
         )
 
-        return luba_msg.SerializeToString()
-
     def send_todev_ble_sync(self, sync_type: int) -> bytes:
         comm_esp = DevNet(todev_ble_sync=sync_type)
         return self.send_order_msg_net(comm_esp)
 
     def get_device_version_main(self) -> bytes:
-        net = DevNet(todev_devinfo_req=DrvDevInfoReq())
-        net.todev_devinfo_req.req_ids.append(DrvDevInfoReqId(id=1, type=6))
+        def build() -> DevNet:
+            net = DevNet(todev_devinfo_req=DrvDevInfoReq())
+            net.todev_devinfo_req.req_ids.append(DrvDevInfoReqId(id=1, type=6))
+            return net
 
-        return self.send_order_msg_net(net)
+        return self.send_order_msg_net(static_payload("get_device_version_main", build))
 
     def get_device_base_info(self) -> bytes:
-        net = DevNet(todev_devinfo_req=DrvDevInfoReq())
+        def build() -> DevNet:
+            net = DevNet(todev_devinfo_req=DrvDevInfoReq())
 
-        for i in range(1, 8):
-            if i == 1:
-                net.todev_devinfo_req.req_ids.append(DrvDevInfoReqId(id=i, type=6))
-            net.todev_devinfo_req.req_ids.append(DrvDevInfoReqId(id=i, type=3))
+            for i in range(1, 8):
+                if i == 1:
+                    net.todev_devinfo_req.req_ids.append(DrvDevInfoReqId(id=i, type=6))
+                net.todev_devinfo_req.req_ids.append(DrvDevInfoReqId(id=i, type=3))
+            return net
 
-        return self.send_order_msg_net(net)
+        return self.send_order_msg_net(static_payload("get_device_base_info", build))
 
     def get_4g_module_info(self) -> bytes:
         build = DevNet(todev_get_mnet_cfg_req=DevNet().todev_get_mnet_cfg_req)
@@ -154,7 +157,9 @@ class MessageNetwork(AbstractMessage, ABC):
         return self.send_order_msg_net(DevNet(todev_log_data_cancel=DrvUploadFileCancel(biz_id=biz_id)))
 
     def get_device_network_info(self) -> bytes:
-        build = DevNet(todev_networkinfo_req=GetNetworkInfoReq(req_ids=1))
+        build = static_payload(
+            "get_device_network_info", lambda: DevNet(todev_networkinfo_req=GetNetworkInfoReq(req_ids=1))
+        )
         logger.debug("Send command - get device network information")
         return self.send_order_msg_net(build)
 
@@ -190,7 +195,9 @@ class MessageNetwork(AbstractMessage, ABC):
         return self.send_order_msg_net(build)
 
     def get_record_wifi_list(self) -> bytes:
-        build = DevNet(todev_ble_sync=1, todev_wifi_list_upload=DrvWifiList())
+        build = static_payload(
+            "get_record_wifi_list", lambda: DevNet(todev_ble_sync=1, todev_wifi_list_upload=DrvWifiList())
+        )
         logger.debug("Send command - get memorized WiFi list upload command")
         return self.send_order_msg_net(build)
 
@@ -5,10 +5,10 @@ import time
 
 from pymammotion import logger
 from pymammotion.mammotion.commands.abstract_message import AbstractMessage
+from pymammotion.mammotion.commands.encoder import SYS, as_payload, encode_luba_msg, static_payload
 from pymammotion.proto import (
     DeviceProductTypeInfoT,
     LoraCfgReq,
-    LubaMsg,
     MctlSys,
     MCtrlSimulationCmdData,
     MsgAttr,
@@ -25,38 +25,36 @@ from pymammotion.proto import (
 
 
 class MessageSystem(AbstractMessage, ABC):
-    def send_order_msg_sys(self, sys) -> bytes:
-        luba_msg = LubaMsg(
+    def send_order_msg_sys(self, sys: MctlSys | bytes) -> bytes:
+        return encode_luba_msg(
             msgtype=MsgCmdType.EMBED_SYS,
             msgattr=MsgAttr.REQ,
             sender=MsgDevice.DEV_MOBILEAPP,
             rcver=self.get_msg_device(MsgCmdType.EMBED_SYS, MsgDevice.DEV_MAINCTL),
-            sys=sys,
+            sub_field=SYS,
+            payload=as_payload(sys),
             seqs=self.seqs.increment_and_get() & 255,
             version=1,
             subtype=self.user_account,
             timestamp=round(time.time() * 1000),
         )
 
-        return luba_msg.SerializeToString()
-
-    def send_order_msg_sys_legacy(self, sys) -> bytes:
-        luba_msg = LubaMsg(
+    def send_order_msg_sys_legacy(self, sys: MctlSys | bytes) -> bytes:
+        return encode_luba_msg(
             msgtype=MsgCmdType.EMBED_SYS,
             msgattr=MsgAttr.REQ,
             sender=MsgDevice.DEV_MOBILEAPP,
             rcver=MsgDevice.DEV_MAINCTL,
-            sys=sys,
+            sub_field=SYS,
+            payload=as_payload(sys),
             seqs=self.seqs.increment_and_get() & 255,
             version=1,
             subtype=self.user_account,
             timestamp=round(time.time() * 1000),
         )
 
-        return luba_msg.SerializeToString()
-
     def reset_system(self) -> bytes:
-        build = MctlSys(todev_reset_system=1)
+        build = static_payload("reset_system", lambda: MctlSys(todev_reset_system=1))
         logger.debug("Send command - send factory reset")
         return self.send_order_msg_sys(build)
 
@@ -69,7 +67,12 @@ class MessageSystem(AbstractMessage, ABC):
         return self.send_order_msg_sys(mctlsys)
 
     def get_device_product_model(self) -> bytes:
-        return self.send_order_msg_sys(MctlSys(device_product_type_info=DeviceProductTypeInfoT(result=1)))
+        return self.send_order_msg_sys(
+            static_payload(
+                "get_device_product_model",
+                lambda: MctlSys(device_product_type_info=DeviceProductTypeInfoT(result=1)),
+            )
+        )
 
     def read_and_set_sidelight(self, is_sidelight: bool, operate: int) -> bytes:
         """Read state of sidelight as well as set it."""
@@ -208,7 +211,8 @@ class MessageSystem(AbstractMessage, ABC):
         return self.send_order_msg_sys(build)
 
     def get_device_version_info(self) -> bytes:
-        return self.send_order_msg_sys(MctlSys(todev_get_dev_fw_info=1))
+        build = static_payload("get_device_version_info", lambda: MctlSys(todev_get_dev_fw_info=1))
+        return self.send_order_msg_sys(build)
 
     def read_and_set_rtk_pairing_code(self, op: int, cfg: str) -> bytes:
         return self.send_order_msg_sys(MctlSys(todev_lora_cfg_req=LoraCfgReq(op=op, cfg=cfg)))
@@ -224,17 +228,21 @@ class MessageSystem(AbstractMessage, ABC):
         no_change_period: int,
         count: int,
     ) -> bytes:
-        build = MctlSys(
-            todev_report_cfg=ReportInfoCfg(
-                act=rpt_act,
-                sub=rpt_info_type,
-                timeout=timeout,
-                period=period,
-                no_change_period=no_change_period,
-                count=count,
-            )
+        sub = tuple(rpt_info_type or ())
+        build = static_payload(
+            ("request_iot_sys", rpt_act, sub, timeout, period, no_change_period, count),
+            lambda: MctlSys(
+                todev_report_cfg=ReportInfoCfg(
+                    act=rpt_act,
+                    sub=list(sub),
+                    timeout=timeout,
+                    period=period,
+                    no_change_period=no_change_period,
+                    count=count,
+                )
+            ),
         )
-        logger.debug(f"Send command==== IOT slim data Act {build.todev_report_cfg.act}")
+        logger.debug(f"Send command==== IOT slim data Act {rpt_act}")
         return self.send_order_msg_sys_legacy(build)
 
     def get_maintenance(self) -> bytes:
@@ -252,71 +260,54 @@ class MessageSystem(AbstractMessage, ABC):
         )
 
     def get_report_cfg_stop(self, timeout: int = 10000, period: int = 1000, no_change_period: int = 1000):
-        # TODO use send_order_msg_sys_legacy
-        mctl_sys = MctlSys(
-            todev_report_cfg=ReportInfoCfg(
-                act=RptAct.RPT_STOP,
-                timeout=timeout,
-                period=period,
-                no_change_period=no_change_period,
-                count=1,
+        def build() -> MctlSys:
+            mctl_sys = MctlSys(
+                todev_report_cfg=ReportInfoCfg(
+                    act=RptAct.RPT_STOP,
+                    timeout=timeout,
+                    period=period,
+                    no_change_period=no_change_period,
+                    count=1,
+                )
             )
-        )
 
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_CONNECT)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_RTK)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_LOCAL)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_WORK)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_STA)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_POINT)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VIO)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_STATISTIC)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_CONNECT)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_RTK)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_LOCAL)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_WORK)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_STA)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_POINT)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VIO)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_STATISTIC)
+            return mctl_sys
 
-        luba_msg = LubaMsg(
-            msgtype=MsgCmdType.EMBED_SYS,
-            sender=MsgDevice.DEV_MOBILEAPP,
-            rcver=MsgDevice.DEV_MAINCTL,
-            msgattr=MsgAttr.REQ,
-            seqs=self.seqs.increment_and_get() & 255,
-            version=1,
-            subtype=self.user_account,
-            sys=mctl_sys,
-            timestamp=round(time.time() * 1000),
+        return self.send_order_msg_sys_legacy(
+            static_payload(("get_report_cfg_stop", timeout, period, no_change_period), build)
         )
 
-        return luba_msg.SerializeToString()
-
     def get_report_cfg(self, timeout: int = 10000, period: int = 1000, no_change_period: int = 2000):
-        # TODO use send_order_msg_sys_legacy
-        mctl_sys = MctlSys(
-            todev_report_cfg=ReportInfoCfg(
-                act=RptAct.RPT_START,
-                timeout=timeout,
-                period=period,
-                no_change_period=no_change_period,
-                count=1,
+        def build() -> MctlSys:
+            mctl_sys = MctlSys(
+                todev_report_cfg=ReportInfoCfg(
+                    act=RptAct.RPT_START,
+                    timeout=timeout,
+                    period=period,
+                    no_change_period=no_change_period,
+                    count=1,
+                )
             )
-        )
 
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_CONNECT)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_RTK)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_LOCAL)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_WORK)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_STA)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_POINT)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VIO)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_STATISTIC)
-        mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_BASESTATION_INFO)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_CONNECT)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_RTK)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_LOCAL)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_WORK)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_DEV_STA)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_POINT)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VIO)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_VISION_STATISTIC)
+            mctl_sys.todev_report_cfg.sub.append(RptInfoType.RIT_BASESTATION_INFO)
+            return mctl_sys
 
-        luba_msg = LubaMsg(
-            msgtype=MsgCmdType.EMBED_SYS,
-            sender=MsgDevice.DEV_MOBILEAPP,
-            rcver=MsgDevice.DEV_MAINCTL,
-            msgattr=MsgAttr.REQ,
-            seqs=self.seqs.increment_and_get() & 255,
-            version=1,
-            subtype=self.user_account,
-            sys=mctl_sys,
-            timestamp=round(time.time() * 1000),
+        return self.send_order_msg_sys_legacy(
+            static_payload(("get_report_cfg", timeout, period, no_change_period), build)
         )
-        return luba_msg.SerializeToString()
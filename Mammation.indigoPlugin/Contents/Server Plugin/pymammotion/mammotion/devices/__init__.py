@@ -1,16 +1,20 @@
 """Mammotion devices module."""
 
-from .mammotion import Mammotion, MammotionDeviceManager
-from .mammotion_bluetooth import MammotionBaseBLEDevice
-from .mammotion_cloud import MammotionBaseCloudDevice, MammotionCloud
-from .mammotion_mower_ble import MammotionMowerBLEDevice
-from .mammotion_mower_cloud import MammotionMowerCloudDevice
-from .mower_device import MammotionMowerDevice
-from .mower_manager import MammotionMowerDeviceManager
-from .rtk_ble import MammotionRTKBLEDevice
-from .rtk_cloud import MammotionRTKCloudDevice
-from .rtk_device import MammotionRTKDevice
-from .rtk_manager import MammotionRTKDeviceManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .mammotion import Mammotion, MammotionDeviceManager
+    from .mammotion_bluetooth import MammotionBaseBLEDevice
+    from .mammotion_cloud import MammotionBaseCloudDevice, MammotionCloud
+    from .mammotion_mower_ble import MammotionMowerBLEDevice
+    from .mammotion_mower_cloud import MammotionMowerCloudDevice
+    from .mower_device import MammotionMowerDevice
+    from .mower_manager import MammotionMowerDeviceManager
+    from .rtk_ble import MammotionRTKBLEDevice
+    from .rtk_cloud import MammotionRTKCloudDevice
+    from .rtk_device import MammotionRTKDevice
+    from .rtk_manager import MammotionRTKDeviceManager
 
 __all__ = [
     "Mammotion",
@@ -27,3 +31,28 @@ __all__ = [
     "MammotionRTKDevice",
     "MammotionRTKDeviceManager",
 ]
+
+_LAZY_IMPORTS = {
+    "Mammotion": ".mammotion",
+    "MammotionDeviceManager": ".mammotion",
+    "MammotionBaseBLEDevice": ".mammotion_bluetooth",
+    "MammotionBaseCloudDevice": ".mammotion_cloud",
+    "MammotionCloud": ".mammotion_cloud",
+    "MammotionMowerBLEDevice": ".mammotion_mower_ble",
+    "MammotionMowerCloudDevice": ".mammotion_mower_cloud",
+    "MammotionMowerDevice": ".mower_device",
+    "MammotionMowerDeviceManager": ".mower_manager",
+    "MammotionRTKBLEDevice": ".rtk_ble",
+    "MammotionRTKCloudDevice": ".rtk_cloud",
+    "MammotionRTKDevice": ".rtk_device",
+    "MammotionRTKDeviceManager": ".rtk_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
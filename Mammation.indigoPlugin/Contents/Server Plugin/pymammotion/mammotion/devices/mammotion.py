@@ -6,8 +6,6 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
-from bleak import BLEDevice
-
 from pymammotion import MammotionMQTT
 from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
 from pymammotion.aliyun.model.dev_by_account_response import Device
@@ -17,7 +15,6 @@ from pymammotion.http.http import MammotionHTTP
 from pymammotion.http.model.camera_stream import StreamSubscriptionResponse, VideoResourceResponse
 from pymammotion.http.model.http import DeviceRecord, Response
 from pymammotion.mammotion.devices.mammotion_cloud import MammotionCloud
-from pymammotion.mammotion.devices.mammotion_mower_ble import MammotionMowerBLEDevice
 from pymammotion.mammotion.devices.managers.managers import AbstractDeviceManager
 from pymammotion.mammotion.devices.mower_manager import MammotionMowerDeviceManager
 from pymammotion.mammotion.devices.rtk_manager import MammotionRTKDeviceManager
@@ -26,6 +23,9 @@ from pymammotion.utility.device_type import DeviceType
 
 # RTK imports - imported here for type hints, full import in add_cloud_devices
 if TYPE_CHECKING:
+    from bleak import BLEDevice
+
+    from pymammotion.mammotion.devices.mammotion_mower_ble import MammotionMowerBLEDevice
     from pymammotion.mammotion.devices.rtk_ble import MammotionRTKBLEDevice
 
 TIMEOUT_CLOUD_RESPONSE = 10
@@ -160,6 +160,7 @@ class Mammotion:
     def __init__(self) -> None:
         """Initialize MammotionDevice."""
         self._login_lock = asyncio.Lock()
+        self._refreshing: dict[str, asyncio.Future] = {}
         self.mqtt_list: dict[str, MammotionCloud] = {}
 
     async def login_and_initiate_cloud(self, account, password, force: bool = False) -> None:
@@ -171,7 +172,14 @@ class Mammotion:
                 await self.initiate_cloud_connection(account, cloud_client)
 
     async def refresh_login(self, account: str) -> None:
-        """Refresh login."""
+        """Refresh login. Concurrent callers for the same account share one refresh."""
+        refreshing = self._refreshing.get(account)
+        if refreshing is None:
+            refreshing = self._refreshing[account] = asyncio.ensure_future(self._refresh_login(account))
+            refreshing.add_done_callback(lambda _: self._refreshing.pop(account, None))
+        await asyncio.shield(refreshing)
+
+    async def _refresh_login(self, account: str) -> None:
         async with self._login_lock:
             exists_aliyun: MammotionCloud | None = self.mqtt_list.get(f"{account}_aliyun")
             exists_mammotion: MammotionCloud | None = self.mqtt_list.get(f"{account}_mammotion")
@@ -184,7 +192,7 @@ class Mammotion:
                 else exists_mammotion.cloud_client.mammotion_http
             )
 
-            await mammotion_http.refresh_login()
+            await mammotion_http.token_refresher.refresh()
 
             await self.connect_iot(exists_aliyun.cloud_client)
             if len(mammotion_http.device_records.records) != 0:
@@ -271,6 +279,15 @@ class Mammotion:
             if mqtt.is_connected():
                 await loop.run_in_executor(None, mqtt.disconnect)
 
+        for key in (f"{account}_aliyun", f"{account}_mammotion"):
+            if (mqtt := self.mqtt_list.get(key)) and mqtt.cloud_client is not cloud_client:
+                mqtt.cloud_client.session_refresher.stop()
+                mqtt.cloud_client.mammotion_http.token_refresher.stop()
+        # Renew both tokens ahead of expiry from now on, so commands never wait on a refresh
+        mammotion_http.token_refresher.start()
+        if cloud_client.session_by_authcode_response is not None:
+            cloud_client.session_refresher.start()
+
         if len(cloud_client.devices_by_account_response.data.data) != 0:
             mammotion_cloud = MammotionCloud(
                 AliyunMQTT(
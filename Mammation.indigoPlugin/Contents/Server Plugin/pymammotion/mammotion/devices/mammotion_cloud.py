@@ -7,6 +7,7 @@ import json
 import logging
 import time
 from typing import Any
+import weakref
 
 import betterproto2
 from Tea.exceptions import UnretryableException
@@ -22,9 +23,40 @@ from pymammotion.event.event import DataEvent
 from pymammotion.mammotion.commands.mammotion_command import MammotionCommand
 from pymammotion.mammotion.devices.base import MammotionBaseDevice
 from pymammotion.proto import LubaMsg
+from pymammotion.utility.metrics import REGISTRY, timed
 
 _LOGGER = logging.getLogger(__name__)
 
+MQTT_MESSAGES = REGISTRY.counter(
+    "pymammotion_mqtt_messages_total", "MQTT messages received, by device and topic kind", ("iot_id", "kind")
+)
+MQTT_MESSAGE_SECONDS = REGISTRY.histogram(
+    "pymammotion_mqtt_message_seconds", "Time to decode, parse and dispatch one MQTT message"
+)
+# Topic suffix -> kind label, in the order _parse_mqtt_response tests them
+_TOPIC_KINDS = (
+    ("/app/down/thing/events", "events"),
+    ("/app/down/thing/status", "status"),
+    ("app/down/thing/properties", "properties"),
+    ("/thing/event/device_protobuf_msg_event/post", "protobuf"),
+    ("/thing/event/property/post", "property"),
+)
+_CLOUDS: "weakref.WeakSet[MammotionCloud]" = weakref.WeakSet()
+
+
+def _topic_kind(topic: str) -> str:
+    for suffix, kind in _TOPIC_KINDS:
+        if topic.endswith(suffix):
+            return kind
+    return "other"
+
+
+REGISTRY.gauge_function(
+    "pymammotion_command_queue_depth",
+    "Commands waiting in MammotionCloud.command_queue, all accounts",
+    lambda: sum(cloud.command_queue.qsize() for cloud in list(_CLOUDS)),
+)
+
 
 class MammotionCloud:
     """Per account MQTT cloud."""
@@ -50,6 +82,7 @@ class MammotionCloud:
         self._mqtt_client.on_disconnected = self.on_disconnected
         self._mqtt_client.on_message = self._on_mqtt_message
         self._mqtt_client.on_ready = self.on_ready
+        _CLOUDS.add(self)
 
     async def on_ready(self) -> None:
         """Starts processing the queue and emits the ready event."""
@@ -107,8 +140,10 @@ class MammotionCloud:
         self.command_sent_time = time.time()
         await self._mqtt_client.send_cloud_command(iot_id, command)
 
+    @timed(MQTT_MESSAGE_SECONDS)
     async def _on_mqtt_message(self, topic: str, payload: bytes, iot_id: str) -> None:
         """Handle incoming MQTT messages."""
+        MQTT_MESSAGES.labels(iot_id, _topic_kind(topic)).inc()
         # _LOGGER.debug("MQTT message received on topic %s: %s, iot_id: %s", topic, payload, iot_id)
         json_str = payload.decode("utf-8")
         dict_payload = json.loads(json_str)
@@ -1,14 +1,19 @@
-from abc import ABC, abstractmethod
+from __future__ import annotations
 
-from bleak import BLEDevice
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from pymammotion import CloudIOTGateway
 from pymammotion.aliyun.model.dev_by_account_response import Device
 from pymammotion.data.model.device import MowingDevice, RTKDevice
 from pymammotion.data.model.enums import ConnectionPreference
-from pymammotion.mammotion.devices.mammotion_bluetooth import MammotionBaseBLEDevice
 from pymammotion.mammotion.devices.mammotion_cloud import MammotionBaseCloudDevice, MammotionCloud
 
+if TYPE_CHECKING:
+    from bleak import BLEDevice
+
+    from pymammotion.mammotion.devices.mammotion_bluetooth import MammotionBaseBLEDevice
+
 
 class AbstractDeviceManager(ABC):
     """Abstract base class for device managers."""
@@ -9,9 +9,16 @@ from pymammotion.data.mower_state_manager import MowerStateManager
 from pymammotion.mammotion.devices.base import MammotionBaseDevice
 from pymammotion.proto import NavGetCommDataAck, NavGetHashListAck, NavPlanJobSet, SvgMessageAckT
 from pymammotion.utility.device_type import DeviceType
+from pymammotion.utility.metrics import REGISTRY
 
 _LOGGER = logging.getLogger(__name__)
 
+MAP_SYNC_STEPS = REGISTRY.counter(
+    "pymammotion_map_sync_steps_total",
+    "Map sync requests sent (start, hash_list_frame, hash_data, region_frame) and syncs completed (complete)",
+    ("step",),
+)
+
 
 def find_next_integer(lst: list[int], current_hash: int) -> int | None:
     """Find the next integer in a list after the current hash."""
@@ -40,11 +47,13 @@ class MammotionMowerDevice(MammotionBaseDevice, ABC):
         if len(missing_frames) == 0:
             if len(self.mower.map.missing_hashlist(hash_ack.sub_cmd)) > 0:
                 data_hash = self.mower.map.missing_hashlist(hash_ack.sub_cmd).pop(0)
+                MAP_SYNC_STEPS.labels("hash_data").inc()
                 await self.queue_command("synchronize_hash_data", hash_num=data_hash)
             return
 
         if current_frame != missing_frames[0] - 1:
             current_frame = missing_frames[0] - 1
+        MAP_SYNC_STEPS.labels("hash_list_frame").inc()
         await self.queue_command("get_hash_response", total_frame=hash_ack.total_frame, current_frame=current_frame)
 
     async def commdata_response(self, common_data: NavGetCommDataAck | SvgMessageAckT) -> None:
@@ -61,8 +70,10 @@ class MammotionMowerDevice(MammotionBaseDevice, ABC):
                 else None
             )
             if data_hash is None:
+                MAP_SYNC_STEPS.labels("complete").inc()
                 return
 
+            MAP_SYNC_STEPS.labels("hash_data").inc()
             await self.queue_command("synchronize_hash_data", hash_num=data_hash)
         else:
             if current_frame != missing_frames[0] - 1:
@@ -75,6 +86,7 @@ class MammotionMowerDevice(MammotionBaseDevice, ABC):
             region_data.sub_cmd = common_data.sub_cmd
             region_data.total_frame = total_frame
             region_data.current_frame = current_frame
+            MAP_SYNC_STEPS.labels("region_frame").inc()
             await self.queue_command("get_regional_data", regional_data=region_data)
 
     async def plan_callback(self, plan: NavPlanJobSet) -> None:
@@ -95,6 +107,7 @@ class MammotionMowerDevice(MammotionBaseDevice, ABC):
         if location := next((loc for loc in self.mower.report_data.locations if loc.pos_type == 5), None):
             self.mower.map.update_hash_lists(self.mower.map.hashlist, location.bol_hash)
 
+        MAP_SYNC_STEPS.labels("start").inc()
         await self.queue_command("send_todev_ble_sync", sync_type=3)
 
         # TODO correctly check if area names exist for a zone.
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from bleak import BLEDevice
+from typing import TYPE_CHECKING
 
 from pymammotion import CloudIOTGateway
 from pymammotion.aliyun.model.dev_by_account_response import Device
@@ -8,10 +8,14 @@ from pymammotion.data.model.device import MowingDevice
 from pymammotion.data.model.enums import ConnectionPreference
 from pymammotion.data.mower_state_manager import MowerStateManager
 from pymammotion.mammotion.devices.mammotion_cloud import MammotionCloud
-from pymammotion.mammotion.devices.mammotion_mower_ble import MammotionMowerBLEDevice
 from pymammotion.mammotion.devices.mammotion_mower_cloud import MammotionMowerCloudDevice
 from pymammotion.mammotion.devices.managers.managers import AbstractDeviceManager
 
+if TYPE_CHECKING:
+    from bleak import BLEDevice
+
+    from pymammotion.mammotion.devices.mammotion_mower_ble import MammotionMowerBLEDevice
+
 
 class MammotionMowerDeviceManager(AbstractDeviceManager):
     def __init__(
@@ -63,6 +67,9 @@ class MammotionMowerDeviceManager(AbstractDeviceManager):
         return False
 
     def add_ble(self, ble_device: BLEDevice) -> MammotionMowerBLEDevice:
+        # Imported here so cloud-only setups never load the BLE stack
+        from pymammotion.mammotion.devices.mammotion_mower_ble import MammotionMowerBLEDevice
+
         self._ble_device = MammotionMowerBLEDevice(
             state_manager=self._state_manager, cloud_device=self._device, device=ble_device
         )
@@ -1,6 +1,8 @@
 """RTK Device Manager - manages RTK devices with cloud and BLE connectivity."""
 
-from typing import Any, Callable, TypeVar
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 _T = TypeVar("_T", bound=Callable[..., Any])
 
@@ -14,17 +16,19 @@ except Exception:
         """Compatibility shim for Python < 3.12; runtime no-op."""
         return func
 
-from bleak import BLEDevice
-
 from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
 from pymammotion.aliyun.model.dev_by_account_response import Device
 from pymammotion.data.model.device import RTKDevice
 from pymammotion.data.model.enums import ConnectionPreference
 from pymammotion.mammotion.devices.mammotion_cloud import MammotionCloud
 from pymammotion.mammotion.devices.managers.managers import AbstractDeviceManager
-from pymammotion.mammotion.devices.rtk_ble import MammotionRTKBLEDevice
 from pymammotion.mammotion.devices.rtk_cloud import MammotionRTKCloudDevice
 
+if TYPE_CHECKING:
+    from bleak import BLEDevice
+
+    from pymammotion.mammotion.devices.rtk_ble import MammotionRTKBLEDevice
+
 
 class MammotionRTKDeviceManager(AbstractDeviceManager):
     """Manages an RTK device with both cloud and BLE connectivity options."""
@@ -93,6 +97,8 @@ class MammotionRTKDeviceManager(AbstractDeviceManager):
 
     def add_ble(self, ble_device: BLEDevice) -> MammotionRTKBLEDevice:
         """Add BLE device."""
+        from pymammotion.mammotion.devices.rtk_ble import MammotionRTKBLEDevice
+
         self._ble_device = MammotionRTKBLEDevice(
             cloud_device=self._device, rtk_state=self._rtk_state, device=ble_device
         )
@@ -1,6 +1,24 @@
 """Package for MammotionMQTT."""
 
-from .aliyun_mqtt import AliyunMQTT
-from .mammotion_mqtt import MammotionMQTT
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .aliyun_mqtt import AliyunMQTT
+    from .mammotion_mqtt import MammotionMQTT
 
 __all__ = ["AliyunMQTT", "MammotionMQTT"]
+
+_LAZY_IMPORTS = {
+    "AliyunMQTT": ".aliyun_mqtt",
+    "MammotionMQTT": ".mammotion_mqtt",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
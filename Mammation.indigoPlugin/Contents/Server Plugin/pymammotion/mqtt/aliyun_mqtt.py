@@ -17,6 +17,7 @@ from pymammotion.data.mqtt.event import ThingEventMessage
 from pymammotion.data.mqtt.properties import ThingPropertiesMessage
 from pymammotion.data.mqtt.status import ThingStatusMessage
 from pymammotion.mqtt.linkkit.linkkit import LinkKit
+from pymammotion.mqtt.recorder import MqttRecorder, shared_recorder
 from pymammotion.proto import LubaMsg
 
 logger = getLogger(__name__)
@@ -45,6 +46,8 @@ class AliyunMQTT:
         self.on_error: Callable[[str], Awaitable[None]] | None = None
         self.on_disconnected: Callable[[], Awaitable[None]] | None = None
         self.on_message: Callable[[str, str, str], Awaitable[None]] | None = None
+        # Opt-in capture of received messages for tools/mqtt_replay.py, shared by all clients
+        self.recorder: MqttRecorder | None = shared_recorder()
 
         self._product_key = product_key
         self._device_name = device_name
@@ -174,6 +177,8 @@ class AliyunMQTT:
         )
         json_payload = json.loads(payload)
         iot_id = json_payload.get("params", {}).get("iotId", "")
+        if iot_id != "" and self.recorder is not None:
+            self.recorder.record(topic, json_payload, iot_id)
         if iot_id != "" and self.on_message is not None:
             future = asyncio.run_coroutine_threadsafe(self.on_message(topic, payload, iot_id), self.loop)
             asyncio.wrap_future(future, loop=self.loop)
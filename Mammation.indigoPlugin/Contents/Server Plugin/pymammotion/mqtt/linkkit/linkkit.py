@@ -36,6 +36,8 @@ import urllib.request
 import paho.mqtt.client as mqtt
 from paho.mqtt.enums import CallbackAPIVersion
 
+from .timeout_registry import TimeoutRegistry
+
 REQUIRED_MAJOR_VERSION = 3
 REQUIRED_MINOR_VERSION = 5
 
@@ -635,13 +637,13 @@ UxeCp6
             self.__device_name,
         )
 
-        self.__thing_prop_post_mid = {}
+        self.__thing_prop_post_mid = TimeoutRegistry()
         self.__thing_prop_post_mid_lock = threading.Lock()
-        self.__thing_prop_set_reply_mid = {}
+        self.__thing_prop_set_reply_mid = TimeoutRegistry()
         self.__thing_prop_set_reply_mid_lock = threading.Lock()
-        self.__gateway_add_subdev_topo_mid = {}
+        self.__gateway_add_subdev_topo_mid = TimeoutRegistry()
         self.__gateway_add_subdev_topo_mid_lock = threading.Lock()
-        self.__gateway_delete_subdev_topo_mid = {}
+        self.__gateway_delete_subdev_topo_mid = TimeoutRegistry()
         self.__gateway_delete_subdev_topo_mid_lock = threading.Lock()
         # event:post topic
         self.__thing_topic_event_post = {}
@@ -649,14 +651,14 @@ UxeCp6
         self.__thing_events = set()
         self.__thing_request_id_max = 1000000
         self.__thing_request_value = 0
-        self.__thing_request_id = {}
+        self.__thing_request_id = TimeoutRegistry()
         self.__thing_request_id_lock = threading.Lock()
-        self.__thing_event_post_mid = {}
+        self.__thing_event_post_mid = TimeoutRegistry()
         self.__thing_event_post_mid_lock = threading.Lock()
 
         self.__thing_topic_shadow_get = "/shadow/get/%s/%s" % (self.__product_key, self.__device_name)
         self.__thing_topic_shadow_update = "/shadow/update/%s/%s" % (self.__product_key, self.__device_name)
-        self.__thing_shadow_mid = {}
+        self.__thing_shadow_mid = TimeoutRegistry()
         self.__thing_shadow_mid_lock = threading.Lock()
 
         # service topic
@@ -664,7 +666,7 @@ UxeCp6
         self.__thing_topic_services = set()
         self.__thing_topic_services_reply = set()
         self.__thing_services = set()
-        self.__thing_answer_service_mid = {}
+        self.__thing_answer_service_mid = TimeoutRegistry()
         self.__thing_answer_service_mid_lock = threading.Lock()
 
         # thing topic - raw
@@ -672,9 +674,9 @@ UxeCp6
         self.__thing_topic_raw_up_reply = self.__thing_topic_raw_up + "_reply"
         self.__thing_topic_raw_down = "/sys/%s/%s/thing/model/down_raw" % (self.__product_key, self.__device_name)
         self.__thing_topic_raw_down_reply = self.__thing_topic_raw_down + "_reply"
-        self.__thing_raw_up_mid = {}
+        self.__thing_raw_up_mid = TimeoutRegistry()
         self.__thing_raw_up_mid_lock = threading.Lock()
-        self.__thing_raw_down_reply_mid = {}
+        self.__thing_raw_down_reply_mid = TimeoutRegistry()
         self.__thing_raw_down_reply_mid_lock = threading.Lock()
 
         # thing topic - device_info
@@ -688,9 +690,9 @@ UxeCp6
             self.__device_name,
         )
         self.__thing_topic_delete_device_info_reply = self.__thing_topic_delete_device_info_up + "_reply"
-        self.__thing_update_device_info_up_mid = {}
+        self.__thing_update_device_info_up_mid = TimeoutRegistry()
         self.__thing_update_device_info_up_mid_lock = threading.Lock()
-        self.__thing_delete_device_info_up_mid = {}
+        self.__thing_delete_device_info_up_mid = TimeoutRegistry()
         self.__thing_delete_device_info_up_mid_lock = threading.Lock()
 
         # properties
@@ -719,7 +721,7 @@ UxeCp6
         self.__device_info_topic = "/sys/%s/%s/thing/deviceinfo/update" % (self.__product_key, self.__device_name)
         self.__device_info_topic_reply = self.__device_info_topic + "_reply"
         self.__device_info_mid_lock = threading.Lock()
-        self.__device_info_mid = {}
+        self.__device_info_mid = TimeoutRegistry()
 
         # connect_async
         self.__connect_async_req = False
@@ -1690,26 +1692,27 @@ UxeCp6
     def __clean_timeout_message(self) -> None:
         # self.__link_log.debug("__clean_timeout_message enter")
         expire_timestamp = self.__timestamp() - self.__mqtt_request_timeout * 1000
-        with self.__thing_prop_post_mid_lock:
-            self.__clean_timeout_message_item(self.__thing_prop_post_mid, expire_timestamp)
-        with self.__thing_event_post_mid_lock:
-            self.__clean_timeout_message_item(self.__thing_event_post_mid, expire_timestamp)
-        with self.__thing_answer_service_mid_lock:
-            self.__clean_timeout_message_item(self.__thing_answer_service_mid, expire_timestamp)
-        with self.__thing_raw_up_mid_lock:
-            self.__clean_timeout_message_item(self.__thing_raw_up_mid, expire_timestamp)
-        with self.__thing_raw_down_reply_mid_lock:
-            self.__clean_timeout_message_item(self.__thing_raw_down_reply_mid, expire_timestamp)
-        with self.__thing_prop_set_reply_mid_lock:
-            self.__clean_timeout_message_item(self.__thing_prop_set_reply_mid, expire_timestamp)
-        self.__clean_timeout_message_item(self.__device_info_mid, expire_timestamp)
+        for mids, lock in (
+            (self.__thing_prop_post_mid, self.__thing_prop_post_mid_lock),
+            (self.__thing_event_post_mid, self.__thing_event_post_mid_lock),
+            (self.__thing_answer_service_mid, self.__thing_answer_service_mid_lock),
+            (self.__thing_raw_up_mid, self.__thing_raw_up_mid_lock),
+            (self.__thing_raw_down_reply_mid, self.__thing_raw_down_reply_mid_lock),
+            (self.__thing_prop_set_reply_mid, self.__thing_prop_set_reply_mid_lock),
+            (self.__device_info_mid, self.__device_info_mid_lock),
+            (self.__thing_shadow_mid, self.__thing_shadow_mid_lock),
+            (self.__thing_update_device_info_up_mid, self.__thing_update_device_info_up_mid_lock),
+            (self.__thing_delete_device_info_up_mid, self.__thing_delete_device_info_up_mid_lock),
+            (self.__gateway_add_subdev_topo_mid, self.__gateway_add_subdev_topo_mid_lock),
+            (self.__gateway_delete_subdev_topo_mid, self.__gateway_delete_subdev_topo_mid_lock),
+        ):
+            with lock:
+                self.__clean_timeout_message_item(mids, expire_timestamp)
         # self.__link_log.debug("__clean_timeout_message exit")
 
-    def __clean_timeout_message_item(self, mids, expire_time) -> None:
-        for mid in list(mids.keys()):
-            if mids[mid] < expire_time:
-                timestamp = mids.pop(mid)
-                self.__link_log.error("__clean_timeout_message_item pop:%r,timestamp:%r", mid, timestamp)
+    def __clean_timeout_message_item(self, mids: TimeoutRegistry, expire_time) -> None:
+        for mid, timestamp in mids.pop_expired(expire_time):
+            self.__link_log.error("__clean_timeout_message_item pop:%r,timestamp:%r", mid, timestamp)
 
     def __reconnect_wait(self) -> None:
         if self.__mqtt_auto_reconnect_sec == 0:
@@ -1930,10 +1933,8 @@ UxeCp6
     def __clean_thing_timeout_request_id(self) -> None:
         with self.__thing_request_id_lock:
             expire_timestamp = self.__timestamp() - self.__mqtt_request_timeout * 1000
-            for request_id in list(self.__thing_request_id.keys()):
-                if self.__thing_request_id[request_id] < expire_timestamp:
-                    timestamp = self.__thing_request_id.pop(request_id)
-                    self.__link_log.error("__clean_thing_timeout_request_id pop:%r,timestamp:%r", request_id, timestamp)
+            for request_id, timestamp in self.__thing_request_id.pop_expired(expire_timestamp):
+                self.__link_log.error("__clean_thing_timeout_request_id pop:%r,timestamp:%r", request_id, timestamp)
 
     def thing_trigger_event(self, event_tuple):
         if self.__linkkit_state is not LinkKit.LinkKitState.CONNECTED:
@@ -0,0 +1,46 @@
+"""Outstanding-request bookkeeping whose timeouts are found without a full scan."""
+
+import heapq
+from typing import Any
+
+
+class TimeoutRegistry(dict):
+    """Dict of ``key -> timestamp`` that also keeps its entries on a min-heap.
+
+    A drop-in for the plain dicts LinkKit keeps per request type: entries are still
+    added with ``registry[mid] = timestamp`` and removed with ``pop`` when the reply
+    arrives. :meth:`pop_expired` only visits heap records that are due, so the
+    per-iteration cleanup costs O(expired) instead of O(outstanding). Records of
+    entries that were answered or re-registered are discarded lazily when they
+    reach the top of the heap.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._heap: list[tuple[int, int, Any]] = []
+        self._counter = 0  # tie-breaker, so keys never need to be comparable
+
+    def __setitem__(self, key: Any, timestamp: int) -> None:
+        super().__setitem__(key, timestamp)
+        heapq.heappush(self._heap, (timestamp, self._counter, key))
+        self._counter += 1
+        if len(self._heap) > 2 * len(self) + 64:
+            # Mostly answered requests: rebuild from the live entries
+            self._heap = [(ts, i, k) for i, (k, ts) in enumerate(self.items())]
+            heapq.heapify(self._heap)
+            self._counter = len(self._heap)
+
+    def clear(self) -> None:
+        super().clear()
+        self._heap.clear()
+
+    def pop_expired(self, expire_before: int) -> list[tuple[Any, int]]:
+        """Remove and return ``(key, timestamp)`` for every entry older than ``expire_before``."""
+        expired: list[tuple[Any, int]] = []
+        heap = self._heap
+        while heap and heap[0][0] < expire_before:
+            timestamp, _, key = heapq.heappop(heap)
+            if key in self and self[key] == timestamp:
+                del self[key]
+                expired.append((key, timestamp))
+        return expired
@@ -12,6 +12,7 @@ from paho.mqtt.reasoncodes import ReasonCode
 
 from pymammotion import MammotionHTTP
 from pymammotion.http.model.http import DeviceRecord, MQTTConnection, Response, UnauthorizedException
+from pymammotion.mqtt.recorder import MqttRecorder, shared_recorder
 from pymammotion.utility.datatype_converter import DatatypeConverter
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,8 @@ class MammotionMQTT:
         self.on_error: Callable[[str], Awaitable[None]] | None = None
         self.on_disconnected: Callable[[], Awaitable[None]] | None = None
         self.on_message: Callable[[str, bytes, str], Awaitable[None]] | None = None
+        # Opt-in capture of received messages for tools/mqtt_replay.py, shared by all clients
+        self.recorder: MqttRecorder | None = shared_recorder()
         self.loop = asyncio.get_running_loop()
         self.mammotion_http = mammotion_http
         self.mqtt_connection = mqtt_connection
@@ -133,6 +136,8 @@ class MammotionMQTT:
                     payload["device_name"] = device_name
                     message.payload = json.dumps(payload).encode("utf-8")
 
+            if iot_id and self.recorder is not None:
+                self.recorder.record(message.topic, message.payload, iot_id)
             if iot_id:
                 future = asyncio.run_coroutine_threadsafe(
                     self.on_message(message.topic, message.payload, iot_id), self.loop
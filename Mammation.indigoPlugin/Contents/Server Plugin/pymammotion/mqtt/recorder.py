@@ -0,0 +1,191 @@
+"""Capture incoming MQTT traffic to a JSON-lines file for offline replay.
+
+Recording is opt-in: set ``PYMAMMOTION_MQTT_RECORD`` to a file path before the
+MQTT clients are created (or assign an :class:`MqttRecorder` to a client's
+``recorder`` attribute). All clients in the process share one recorder from
+:func:`shared_recorder`, so a capture has a single time origin and one pseudonym
+table; :func:`close_shared_recorder` closes it at shutdown. Each line holds one
+message as received, after sanitizing::
+
+    {"t": 12.345, "topic": "/sys/<pk>/dev-1/app/down/thing/events", "iot_id": "iot-1", "payload": {...}}
+
+``t`` is seconds since recording started. Tokens, passwords and signatures are
+replaced with ``"<redacted>"``; iot ids and device names are replaced with stable
+pseudonyms (``iot-1``, ``dev-1``, ...) so a capture can be shared. Protobuf
+content is kept as is: it is what the replay measures.
+
+``tools/mqtt_replay.py`` at the repository root feeds a capture back through
+``MammotionCloud``.
+"""
+
+from collections.abc import Callable
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORD_ENV = "PYMAMMOTION_MQTT_RECORD"
+REDACTED = "<redacted>"
+
+# Keys whose values are credentials, compared case-insensitively
+SECRET_KEYS = frozenset(
+    key.lower()
+    for key in (
+        "token",
+        "iotToken",
+        "accessToken",
+        "refreshToken",
+        "identityId",
+        "authCode",
+        "password",
+        "secret",
+        "deviceSecret",
+        "sign",
+        "signature",
+    )
+)
+# Keys whose values identify a device, replaced with a pseudonym
+_IOT_ID_KEYS = frozenset(("iotId", "iot_id"))
+_DEVICE_NAME_KEYS = frozenset(("deviceName", "device_name"))
+
+
+class MqttRecorder:
+    """Append sanitized ``(topic, payload, iot_id)`` records to a JSON-lines file.
+
+    :meth:`record` is called on the MQTT client thread; writes are serialized with
+    a lock and flushed per line, so a capture survives the process being killed.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.monotonic) -> None:
+        """Open ``path`` for appending."""
+        self.path = path
+        self._clock = clock
+        self._start = clock()
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")  # closed in close()
+        self._aliases: dict[str, dict[str, str]] = {"iot": {}, "dev": {}}
+        self.recorded = 0
+        self.failed = 0
+
+    @classmethod
+    def from_env(cls) -> "MqttRecorder | None":
+        """Return a recorder for the path in ``PYMAMMOTION_MQTT_RECORD``, or None when unset."""
+        path = os.environ.get(RECORD_ENV)
+        if not path:
+            return None
+        try:
+            recorder = cls(path)
+        except OSError as ex:
+            _LOGGER.warning("MQTT recording to %s disabled: %s", path, ex)
+            return None
+        _LOGGER.warning("Recording MQTT traffic to %s", path)
+        return recorder
+
+    def _alias(self, kind: str, value: str) -> str:
+        aliases = self._aliases[kind]
+        alias = aliases.get(value)
+        if alias is None:
+            alias = aliases[value] = f"{kind}-{len(aliases) + 1}"
+        return alias
+
+    def _sanitize(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            clean = {}
+            for key, item in value.items():
+                if key.lower() in SECRET_KEYS:
+                    clean[key] = REDACTED
+                elif key in _IOT_ID_KEYS and isinstance(item, str):
+                    clean[key] = self._alias("iot", item)
+                elif key in _DEVICE_NAME_KEYS and isinstance(item, str):
+                    clean[key] = self._alias("dev", item)
+                else:
+                    clean[key] = self._sanitize(item)
+            return clean
+        if isinstance(value, list):
+            return [self._sanitize(item) for item in value]
+        return value
+
+    def _sanitize_topic(self, topic: str) -> str:
+        # /sys/{product_key}/{device_name}/...
+        parts = topic.split("/")
+        if len(parts) > 3 and parts[1] == "sys":
+            parts[3] = self._alias("dev", parts[3])
+        return "/".join(parts)
+
+    def record(self, topic: str, payload: str | bytes | dict, iot_id: str) -> None:
+        """Append one received message; never raises into the MQTT thread."""
+        try:
+            if isinstance(payload, bytes | bytearray):
+                payload = payload.decode("utf-8")
+            if isinstance(payload, str):
+                payload = json.loads(payload)
+            with self._lock:
+                line = json.dumps(
+                    {
+                        "t": round(self._clock() - self._start, 6),
+                        "topic": self._sanitize_topic(topic),
+                        "iot_id": self._alias("iot", iot_id),
+                        "payload": self._sanitize(payload),
+                    },
+                    separators=(",", ":"),
+                )
+                self._file.write(line + "\n")
+                self._file.flush()
+                self.recorded += 1
+        except (OSError, ValueError, TypeError) as ex:
+            self.failed += 1
+            _LOGGER.debug("MQTT message on %s not recorded: %s", topic, ex)
+
+    def close(self) -> None:
+        """Close the capture file; later records are counted as failed."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Snapshot of the recorder for diagnostics."""
+        return {
+            "path": self.path,
+            "recorded": self.recorded,
+            "failed": self.failed,
+            "devices": len(self._aliases["iot"]),
+        }
+
+
+_shared: MqttRecorder | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_recorder() -> MqttRecorder | None:
+    """Return the process-wide recorder, creating it from the environment on first use.
+
+    Every MQTT client records through this one instance; separate recorders on
+    the same file would interleave two clocks and two alias tables.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = MqttRecorder.from_env()
+        return _shared
+
+
+def close_shared_recorder() -> None:
+    """Close the process-wide recorder, if one was opened."""
+    global _shared
+    with _shared_lock:
+        recorder, _shared = _shared, None
+    if recorder is not None:
+        recorder.close()
+
+
+def load_capture(path: str) -> list[dict[str, Any]]:
+    """Read a capture written by :class:`MqttRecorder`, oldest message first."""
+    with open(path, encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh if line.strip()]
+    records.sort(key=lambda record: record["t"])
+    return records
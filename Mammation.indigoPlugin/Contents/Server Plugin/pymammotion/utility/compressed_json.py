@@ -0,0 +1,156 @@
+"""Serialize JSON with orjson and serve it compressed, caching the encoded bodies.
+
+Map GeoJSON is mostly coordinate arrays, which gzip and brotli shrink about
+tenfold. ``EncodedBodyCache`` keeps the serialized body and each compressed
+variant per key, so a map that has not changed since the last request is sent
+without serializing or compressing anything. brotli is optional: without the
+package, clients are offered gzip only.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+import gzip
+from typing import Any
+
+import orjson
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Bodies larger than this are compressed in the default executor by EncodedBodyCache.aget;
+# a full-detail map of a large garden takes tens of milliseconds to gzip
+COMPRESS_INLINE_BYTES = 64 * 1024
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON bytes, accepting numpy scalars/arrays and non-string keys."""
+    return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "__float__"):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _brotli() -> Any:
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Return the content codings this process can produce, preferred first."""
+    return ("br", "gzip") if _brotli() is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick the best coding from an ``Accept-Encoding`` header, or None for identity."""
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for coding in supported_encodings():
+        if accepted.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+
+def compress(body: bytes, encoding: str | None) -> bytes:
+    """Compress ``body`` with ``encoding`` ("br", "gzip" or None for identity)."""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "br":
+        return _brotli().compress(body, quality=BROTLI_QUALITY)
+    return body
+
+
+class EncodedBodyCache:
+    """LRU of ``key -> {encoding: body}`` for JSON responses.
+
+    ``key`` must change whenever the document would, e.g. the map revision plus
+    the simplification tolerance. Each encoding is produced on first request and
+    kept alongside the identity body until the key is evicted.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """Initialize an empty cache holding at most ``maxsize`` keys."""
+        self.maxsize = maxsize
+        self._bodies: OrderedDict[Hashable, dict[str | None, bytes]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _entry(self, key: Hashable, build: Callable[[], Any]) -> tuple[dict[str | None, bytes], bool]:
+        """Return the bodies for ``key`` and whether they were just built."""
+        bodies = self._bodies.get(key)
+        if bodies is not None:
+            self._bodies.move_to_end(key)
+            return bodies, False
+        document = build()
+        bodies = {None: document if isinstance(document, bytes) else dumps(document)}
+        self._bodies[key] = bodies
+        while len(self._bodies) > self.maxsize:
+            self._bodies.popitem(last=False)
+        return bodies, True
+
+    def get(self, key: Hashable, encoding: str | None, build: Callable[[], Any]) -> bytes:
+        """Return the body for ``key`` in ``encoding``, building and serializing on a miss.
+
+        ``build`` may return the document or its already-serialized JSON bytes.
+        """
+        bodies, built = self._entry(key, build)
+        if not built and encoding in bodies:
+            self._hits += 1
+            return bodies[encoding]
+        self._misses += 1
+        if encoding not in bodies:
+            bodies[encoding] = compress(bodies[None], encoding)
+        return bodies[encoding]
+
+    async def aget(self, key: Hashable, encoding: str | None, build: Callable[[], Any]) -> bytes:
+        """Like :meth:`get`, but compress bodies over ``COMPRESS_INLINE_BYTES`` off the event loop.
+
+        ``build`` still runs on the loop, since it reads live device state.
+        """
+        bodies, built = self._entry(key, build)
+        if not built and encoding in bodies:
+            self._hits += 1
+            return bodies[encoding]
+        self._misses += 1
+        if encoding not in bodies:
+            identity = bodies[None]
+            if len(identity) > COMPRESS_INLINE_BYTES:
+                loop = asyncio.get_running_loop()
+                bodies[encoding] = await loop.run_in_executor(None, compress, identity, encoding)
+            else:
+                bodies[encoding] = compress(identity, encoding)
+        return bodies[encoding]
+
+    def clear(self) -> None:
+        self._bodies.clear()
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Snapshot of the cache for diagnostics."""
+        return {
+            "entries": len(self._bodies),
+            "bytes": sum(len(body) for bodies in self._bodies.values() for body in bodies.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 LubaProductKey = [
     "a1UBFdq6nNz",
@@ -177,69 +178,11 @@ class DeviceType(Enum):
         Returns:
             DeviceType: The type of device based on the provided information.
 
-        """
+        Results are memoized, so repeated lookups for the same device are a dict hit.
 
-        if not device_name and not product_key:
-            return DeviceType.UNKNOWN
+        """
 
-        try:
-            substring = device_name[:3]
-            substring2 = device_name[:7]
-
-            if DeviceType.RTK.get_name() in substring or DeviceType.contain_rtk_product_key(product_key):
-                return DeviceType.RTK
-            elif DeviceType.LUBA_2.get_name() in substring2 or DeviceType.contain_luba_2_product_key(product_key):
-                return DeviceType.LUBA_2
-            elif DeviceType.LUBA_LD.get_name() in substring2:
-                return DeviceType.LUBA_LD
-            elif DeviceType.LUBA_VP.get_name() in substring2:
-                return DeviceType.LUBA_VP
-            elif DeviceType.LUBA_MN.get_name() in substring2:
-                return DeviceType.LUBA_MN
-            elif DeviceType.YUKA_VP.get_name() in substring2:
-                return DeviceType.YUKA_VP
-            elif DeviceType.YUKA_MINI.get_name() in substring2:
-                return DeviceType.YUKA_MINI
-            elif DeviceType.YUKA_MINI2.get_name() in substring2:
-                return DeviceType.YUKA_MINI2
-            elif DeviceType.LUBA_YUKA.get_name() in substring2:
-                return DeviceType.LUBA_YUKA
-            elif DeviceType.LUBA.get_name() in substring2 or DeviceType.contain_luba_product_key(product_key):
-                return DeviceType.LUBA
-            elif DeviceType.SPINO.get_name() in substring2:
-                return DeviceType.SPINO
-            elif DeviceType.RTK3A1.get_name() in substring2:
-                return DeviceType.RTK3A1
-            elif DeviceType.RTK3A0.get_name() in substring2:
-                return DeviceType.RTK3A0
-            elif DeviceType.RTK3A2.get_name() in substring2:
-                return DeviceType.RTK3A2
-            elif DeviceType.YUKA_MINIV.get_name() in substring2:
-                return DeviceType.YUKA_MINIV
-            elif DeviceType.LUBA_VA.get_name() in substring2:
-                return DeviceType.LUBA_VA
-            elif DeviceType.YUKA_ML.get_name() in substring2:
-                return DeviceType.YUKA_ML
-            elif DeviceType.LUBA_MD.get_name() in substring2:
-                return DeviceType.LUBA_MD
-            elif DeviceType.LUBA_LA.get_name() in substring2:
-                return DeviceType.LUBA_LA
-            elif DeviceType.SWIMMINGPOOL_S1.get_name() in substring2:
-                return DeviceType.SWIMMINGPOOL_S1
-            elif DeviceType.SWIMMINGPOOL_E1.get_name() in substring2:
-                return DeviceType.SWIMMINGPOOL_E1
-            elif DeviceType.YUKA_MN100.get_name() in substring2:
-                return DeviceType.YUKA_MN100
-            elif DeviceType.RTKNB.get_name() in substring2:
-                return DeviceType.RTKNB
-            elif DeviceType.LUBA_MB.get_name() in substring2:
-                return DeviceType.LUBA_MB
-            elif DeviceType.CM900.get_name() in substring2:
-                return DeviceType.CM900
-            else:
-                return DeviceType.UNKNOWN
-        except Exception:
-            return DeviceType.UNKNOWN
+        return _value_of_str(device_name, product_key)
 
     @staticmethod
     def has_4g(device_name: str, product_key: str = ""):
@@ -311,8 +254,8 @@ class DeviceType(Enum):
 
         return (
             device_type.get_value() >= DeviceType.LUBA_2.get_value()
-            and device_type.get_value() != DeviceType.SPINO.get_value()
-            and not DeviceType.is_rtk(device_name, product_key)
+            and device_type is not DeviceType.SPINO
+            and device_type not in _RTK_TYPES
         )
 
     @staticmethod
@@ -327,36 +270,17 @@ class DeviceType(Enum):
 
         """
 
-        return (
-            DeviceType.value_of_str(device_name).get_value() == DeviceType.LUBA_YUKA.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_VP.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINI.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINI2.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINIV.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_ML.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MN100.get_value()
-        )
+        return DeviceType.value_of_str(device_name) in _YUKA_TYPES
 
     @staticmethod
     def is_yuka_mini(device_name: str):
-        return (
-            DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINI.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINI2.get_value()
-        )
+        return DeviceType.value_of_str(device_name) in _YUKA_MINI_TYPES
 
     @staticmethod
     def is_mini_or_x_series(device_name: str):
         """IsNewDeviceType returns if a device is part of the x or mini series."""
 
-        return (
-            DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINI.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINI2.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_MINIV.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.YUKA_VP.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.LUBA_MN.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.LUBA_VP.get_value()
-            or DeviceType.value_of_str(device_name).get_value() == DeviceType.LUBA_LD.get_value()
-        )
+        return DeviceType.value_of_str(device_name) in _MINI_OR_X_TYPES
 
     @staticmethod
     def is_rtk(device_name: str, product_key: str = ""):
@@ -380,13 +304,7 @@ class DeviceType(Enum):
         else:
             device_type = DeviceType.value_of_str(device_name, product_key)
 
-        return (
-            DeviceType.RTK.get_value() == device_type.get_value()
-            or DeviceType.RTK3A0.get_value() == device_type.get_value()
-            or DeviceType.RTK3A1.get_value() == device_type.get_value()
-            or DeviceType.RTK3A2.get_value() == device_type.get_value()
-            or DeviceType.RTKNB.get_value() == device_type.get_value()
-        )
+        return device_type in _RTK_TYPES
 
     @staticmethod
     def contain_rtk_product_key(product_key) -> bool:
@@ -487,3 +405,79 @@ class DeviceType(Enum):
 
     def is_support_video(self):
         return self != DeviceType.LUBA
+
+
+# Name/product-key rules in match priority order (the order of the original if/elif chain).
+# Each entry is (type, how many leading characters of the name to search, product keys or None).
+_NAME_RULES = (
+    (DeviceType.RTK, 3, frozenset(RTKProductKey)),
+    (DeviceType.LUBA_2, 7, frozenset(LubaVProductKey)),
+    (DeviceType.LUBA_LD, 7, None),
+    (DeviceType.LUBA_VP, 7, None),
+    (DeviceType.LUBA_MN, 7, None),
+    (DeviceType.YUKA_VP, 7, None),
+    (DeviceType.YUKA_MINI, 7, None),
+    (DeviceType.YUKA_MINI2, 7, None),
+    (DeviceType.LUBA_YUKA, 7, None),
+    (DeviceType.LUBA, 7, frozenset(LubaProductKey)),
+    (DeviceType.SPINO, 7, None),
+    (DeviceType.RTK3A1, 7, None),
+    (DeviceType.RTK3A0, 7, None),
+    (DeviceType.RTK3A2, 7, None),
+    (DeviceType.YUKA_MINIV, 7, None),
+    (DeviceType.LUBA_VA, 7, None),
+    (DeviceType.YUKA_ML, 7, None),
+    (DeviceType.LUBA_MD, 7, None),
+    (DeviceType.LUBA_LA, 7, None),
+    (DeviceType.SWIMMINGPOOL_S1, 7, None),
+    (DeviceType.SWIMMINGPOOL_E1, 7, None),
+    (DeviceType.YUKA_MN100, 7, None),
+    (DeviceType.RTKNB, 7, None),
+    (DeviceType.LUBA_MB, 7, None),
+    (DeviceType.CM900, 7, None),
+)
+
+_YUKA_TYPES = frozenset(
+    {
+        DeviceType.LUBA_YUKA,
+        DeviceType.YUKA_VP,
+        DeviceType.YUKA_MINI,
+        DeviceType.YUKA_MINI2,
+        DeviceType.YUKA_MINIV,
+        DeviceType.YUKA_ML,
+        DeviceType.YUKA_MN100,
+    }
+)
+
+_YUKA_MINI_TYPES = frozenset({DeviceType.YUKA_MINI, DeviceType.YUKA_MINI2})
+
+_MINI_OR_X_TYPES = frozenset(
+    {
+        DeviceType.YUKA_MINI,
+        DeviceType.YUKA_MINI2,
+        DeviceType.YUKA_MINIV,
+        DeviceType.YUKA_VP,
+        DeviceType.LUBA_MN,
+        DeviceType.LUBA_VP,
+        DeviceType.LUBA_LD,
+    }
+)
+
+_RTK_TYPES = frozenset({DeviceType.RTK, DeviceType.RTK3A0, DeviceType.RTK3A1, DeviceType.RTK3A2, DeviceType.RTKNB})
+
+
+@lru_cache(maxsize=512)
+def _value_of_str(device_name: str, product_key: str) -> DeviceType:
+    """Resolve a device name and product key against _NAME_RULES."""
+    if not device_name and not product_key:
+        return DeviceType.UNKNOWN
+
+    try:
+        for device_type, window, product_keys in _NAME_RULES:
+            if device_type.get_name() in device_name[:window]:
+                return device_type
+            if product_keys is not None and product_key and product_key in product_keys:
+                return device_type
+    except Exception:
+        return DeviceType.UNKNOWN
+    return DeviceType.UNKNOWN
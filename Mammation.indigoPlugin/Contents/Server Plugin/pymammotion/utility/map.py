@@ -1,8 +1,5 @@
 import math
 
-import numpy as np
-from numpy.typing import NDArray
-
 from pymammotion.data.model.location import LocationPoint
 
 
@@ -37,8 +34,8 @@ class CoordinateConverter:
             self.semi_minor_axis**2
         )
 
-        # Rotation matrix for coordinate transformation
-        self.rotation_matrix: NDArray[np.float64] = np.zeros((3, 3), dtype=np.float64)
+        # Rotation matrix for coordinate transformation (plain lists: only scalar access, no numpy needed)
+        self.rotation_matrix: list[list[float]] = [[0.0] * 3 for _ in range(3)]
 
         # ECEF origin coordinates
         self.x0: float = 0.0
@@ -77,17 +74,17 @@ class CoordinateConverter:
         self.z0 = self.eccentricity_ratio_squared * N * sin_lat
 
         # Build rotation matrix (ECEF to ENU)
-        self.rotation_matrix[0, 0] = -sin_lon
-        self.rotation_matrix[0, 1] = cos_lon
-        self.rotation_matrix[0, 2] = 0.0
+        self.rotation_matrix[0][0] = -sin_lon
+        self.rotation_matrix[0][1] = cos_lon
+        self.rotation_matrix[0][2] = 0.0
 
-        self.rotation_matrix[1, 0] = -cos_lon * sin_lat
-        self.rotation_matrix[1, 1] = -sin_lon * sin_lat
-        self.rotation_matrix[1, 2] = cos_lat
+        self.rotation_matrix[1][0] = -cos_lon * sin_lat
+        self.rotation_matrix[1][1] = -sin_lon * sin_lat
+        self.rotation_matrix[1][2] = cos_lat
 
-        self.rotation_matrix[2, 0] = cos_lon * cos_lat
-        self.rotation_matrix[2, 1] = sin_lon * cos_lat
-        self.rotation_matrix[2, 2] = sin_lat
+        self.rotation_matrix[2][0] = cos_lon * cos_lat
+        self.rotation_matrix[2][1] = sin_lon * cos_lat
+        self.rotation_matrix[2][2] = sin_lat
 
     def enu_to_lla(self, east: float, north: float) -> LocationPoint:
         """Convert ENU (East-North-Up) coordinates to LLA (Latitude-Longitude-Altitude).
@@ -102,9 +99,9 @@ class CoordinateConverter:
         """
         # Transform ENU to ECEF (Earth-Centered, Earth-Fixed) coordinates
         # using rotation matrix and origin offset
-        ecef_x = self.rotation_matrix[0, 0] * north + self.rotation_matrix[1, 0] * east + self.x0
-        ecef_y = self.rotation_matrix[0, 1] * north + self.rotation_matrix[1, 1] * east + self.y0
-        ecef_z = self.rotation_matrix[0, 2] * north + self.rotation_matrix[1, 2] * east + self.z0
+        ecef_x = self.rotation_matrix[0][0] * north + self.rotation_matrix[1][0] * east + self.x0
+        ecef_y = self.rotation_matrix[0][1] * north + self.rotation_matrix[1][1] * east + self.y0
+        ecef_z = self.rotation_matrix[0][2] * north + self.rotation_matrix[1][2] * east + self.z0
 
         # Calculate horizontal distance from Earth's axis
         horizontal_distance = math.hypot(ecef_x, ecef_y)
@@ -163,8 +160,8 @@ class CoordinateConverter:
         dz = ecef_z - self.z0
 
         # Rotate to ENU frame
-        east = self.rotation_matrix[0, 0] * dx + self.rotation_matrix[0, 1] * dy + self.rotation_matrix[0, 2] * dz
-        north = self.rotation_matrix[1, 0] * dx + self.rotation_matrix[1, 1] * dy + self.rotation_matrix[1, 2] * dz
+        east = self.rotation_matrix[0][0] * dx + self.rotation_matrix[0][1] * dy + self.rotation_matrix[0][2] * dz
+        north = self.rotation_matrix[1][0] * dx + self.rotation_matrix[1][1] * dy + self.rotation_matrix[1][2] * dz
 
         # Apply yaw rotation (inverse)
         rotated_east = math.cos(-self.yaw) * east - math.sin(-self.yaw) * north
@@ -0,0 +1,315 @@
+"""In-process counters, gauges and histograms rendered in the Prometheus text format.
+
+Metrics are created once at import time on :data:`REGISTRY` and updated inline
+on the hot path, so an update is a dict lookup and an addition::
+
+    MQTT_MESSAGES = REGISTRY.counter("pymammotion_mqtt_messages_total", "MQTT messages received", ("iot_id",))
+    MQTT_MESSAGES.labels(iot_id).inc()
+
+Values that already live elsewhere (a queue length, a ``state`` property) are
+read when the registry is rendered, via :meth:`Registry.gauge_function`, instead
+of being mirrored on every change. Updates are not locked: they happen on the
+event loop, and a lost increment from another thread only skews a diagnostic.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+import functools
+import inspect
+import math
+import time
+from typing import Any
+
+# Seconds: from a fast in-memory dispatch up to a slow cloud round trip
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def format_value(value: float) -> str:
+    """Format a sample value; booleans become 0/1."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def format_labels(names: Iterable[str], values: Iterable[Any]) -> str:
+    """Return ``{a="x",b="y"}`` (or an empty string) with values escaped."""
+    pairs = []
+    for name, value in zip(names, values):
+        text = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{text}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_family(
+    name: str, kind: str, documentation: str, samples: Iterable[tuple[dict[str, Any], float]]
+) -> list[str]:
+    """Return the text lines of one metric family given ``(labels, value)`` samples."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{format_labels(labels.keys(), labels.values())} {format_value(value)}")
+    return lines
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramValue:
+    __slots__ = ("_upper", "counts", "sum", "count")
+
+    def __init__(self, upper: tuple[float, ...]) -> None:
+        self._upper = upper
+        self.counts = [0] * len(upper)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._upper, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()  # exported as 0 before the first update
+
+    def _new_child(self) -> Any:
+        return _Value()
+
+    def labels(self, *values: Any) -> Any:
+        """Return the child for these label values, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def remove(self, *values: Any) -> None:
+        """Drop one label combination, e.g. for a device that went away."""
+        self._children.pop(values, None)
+
+    def render(self) -> list[str]:
+        return format_family(
+            self.name,
+            self.kind,
+            self.documentation,
+            ((dict(zip(self.labelnames, values)), child.value) for values, child in self._children.items()),
+        )
+
+
+class Counter(_Metric):
+    """A monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """A value that goes up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self.labels().dec(amount)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative ``le`` buckets, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize with sorted bucket upper bounds; ``+Inf`` is added."""
+        self.buckets = (*sorted(buckets), math.inf)
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record one observation on the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for values, child in self._children.items():
+            cumulative = 0
+            for upper, count in zip(self.buckets, child.counts):
+                cumulative += count
+                label_text = format_labels((*self.labelnames, "le"), (*values, format_value(upper)))
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{label_text} {format_value(child.sum)}")
+            lines.append(f"{self.name}_count{label_text} {child.count}")
+        return lines
+
+
+class _FunctionGauge:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        function: Callable[[], float | Iterable[tuple[tuple[Any, ...], float]]],
+        labelnames: tuple[str, ...],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.function = function
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> list[str]:
+        result = self.function()
+        samples = [((), result)] if not self.labelnames else result
+        return format_family(
+            self.name,
+            "gauge",
+            self.documentation,
+            ((dict(zip(self.labelnames, values)), value) for values, value in samples),
+        )
+
+
+class Registry:
+    """A named set of metrics. Creating a metric twice returns the existing one."""
+
+    def __init__(self) -> None:
+        """Initialize empty."""
+        self._metrics: dict[str, Any] = {}
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, *args, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"{name} is already registered as a {type(metric).__name__}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def gauge_function(
+        self,
+        name: str,
+        documentation: str,
+        function: Callable[[], float | Iterable[tuple[tuple[Any, ...], float]]],
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        """Register a gauge read from ``function`` at render time.
+
+        Without label names ``function`` returns the value; with them it returns
+        ``(label_values, value)`` pairs. Registering the same name again replaces
+        the function.
+        """
+        self._metrics[name] = _FunctionGauge(name, documentation, function, labelnames)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def timed(histogram: Histogram, outcomes: Counter | None = None) -> Callable:
+    """Decorate a function or coroutine function to observe its duration.
+
+    With ``outcomes`` (a counter with one label) each call is also counted as
+    ``"ok"`` or by the name of the exception it raised.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as ex:
+                    if outcomes is not None:
+                        outcomes.labels(type(ex).__name__).inc()
+                    raise
+                finally:
+                    histogram.observe(time.perf_counter() - start)
+                if outcomes is not None:
+                    outcomes.labels("ok").inc()
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as ex:
+                if outcomes is not None:
+                    outcomes.labels(type(ex).__name__).inc()
+                raise
+            finally:
+                histogram.observe(time.perf_counter() - start)
+            if outcomes is not None:
+                outcomes.labels("ok").inc()
+            return result
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,132 @@
+"""Decide when a periodic poll is still worth sending to a device."""
+
+import asyncio
+from collections.abc import Callable
+import time
+from typing import Any
+
+# Push topics recorded by MowerStateManager
+REPORT_DATA = "toapp_report_data"
+RAPID_STATE = "system_tard_state_tunnel"
+STATUS = "status"
+PROPERTIES = "properties"
+
+
+class PollScheduler:
+    """Track fresh data per topic for one device and skip redundant polls.
+
+    Every message pushed by the device is recorded with :meth:`record_push`. A poll
+    for a topic is only due when neither a push nor a previous poll for that topic
+    arrived within its interval. While the device is offline or asleep the interval
+    is stretched exponentially on each poll that goes unanswered, and snaps back
+    the moment anything is heard from the device again; a loop sleeping in
+    :meth:`sleep` is woken when that happens.
+    """
+
+    def __init__(self, max_backoff: int = 5, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize with no history, so every topic is due immediately."""
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._pushed_at: dict[str, float] = {}
+        self._polled_at: dict[str, float] = {}
+        self._last_heard = 0.0
+        self._available = True
+        self._backoff = 0
+        self.polls_sent = 0
+        self.polls_skipped = 0
+        self._wake: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None = None
+
+    def record_push(self, topic: str) -> None:
+        """Record that fresh data for ``topic`` just arrived from the device."""
+        now = self._clock()
+        self._pushed_at[topic] = now
+        self._last_heard = now
+        self._reset_backoff()
+
+    def set_available(self, available: bool) -> None:
+        """Mark the device online/awake or offline/asleep."""
+        self._available = available
+        if available:
+            self._reset_backoff()
+
+    def _reset_backoff(self) -> None:
+        if self._backoff and self._wake is not None:
+            # Pushes can be recorded from MQTT threads
+            loop, woken = self._wake
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(woken.set)
+        self._backoff = 0
+
+    def interval(self, base: float) -> float:
+        """Return ``base`` stretched by the current back-off."""
+        return base * (2**self._backoff)
+
+    async def sleep(self, base: float) -> None:
+        """Sleep for ``interval(base)``, returning early if the back-off resets meanwhile.
+
+        A backed-off interval can reach ``base * 2**max_backoff``; without the early
+        return a device that comes back would not be polled again until it ran out.
+        """
+        if not self._backoff:
+            await asyncio.sleep(base)
+            return
+        woken = asyncio.Event()
+        self._wake = (asyncio.get_running_loop(), woken)
+        try:
+            await asyncio.wait_for(woken.wait(), self.interval(base))
+        except TimeoutError:
+            pass
+        finally:
+            self._wake = None
+
+    def last_push(self, *topics: str) -> float | None:
+        """Return the age in seconds of the freshest push among ``topics``."""
+        pushed_at = self.pushed_at(*topics)
+        return None if pushed_at is None else self._clock() - pushed_at
+
+    def pushed_at(self, *topics: str) -> float | None:
+        """Return the clock time of the freshest push among ``topics``."""
+        stamps = [self._pushed_at[topic] for topic in topics if topic in self._pushed_at]
+        return max(stamps) if stamps else None
+
+    def should_poll(self, poll: str, base: float, *covered_by: str) -> bool:
+        """Return True if ``poll`` is due.
+
+        Args:
+            poll: Name of the poll, e.g. the command key.
+            base: Normal interval between polls in seconds.
+            covered_by: Push topics whose arrival makes the poll unnecessary.
+
+        """
+        interval = self.interval(base)
+        now = self._clock()
+        age = self.last_push(*covered_by) if covered_by else None
+        if age is not None and age < interval:
+            self.polls_skipped += 1
+            return False
+        polled_at = self._polled_at.get(poll)
+        if polled_at is not None and now - polled_at < interval:
+            return False
+        return True
+
+    def record_poll(self, poll: str) -> None:
+        """Record that ``poll`` was sent, backing off if the device has gone quiet."""
+        now = self._clock()
+        previous = self._polled_at.get(poll)
+        self._polled_at[poll] = now
+        self.polls_sent += 1
+        unanswered = previous is not None and self._last_heard < previous
+        if (not self._available or unanswered) and self._backoff < self.max_backoff:
+            self._backoff += 1
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Snapshot of the scheduler for diagnostics."""
+        now = self._clock()
+        return {
+            "available": self._available,
+            "backoff": self._backoff,
+            "polls_sent": self.polls_sent,
+            "polls_skipped": self.polls_skipped,
+            "push_age": {topic: round(now - at, 1) for topic, at in self._pushed_at.items()},
+        }
@@ -0,0 +1,162 @@
+"""Choose which reports a mower streams via ``request_iot_sys``, and how often."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from pymammotion.proto import RptAct, RptInfoType
+from pymammotion.utility.constant.device_constant import WorkMode
+
+
+@dataclass(frozen=True)
+class ReportProfile:
+    """One ``request_iot_sys`` configuration."""
+
+    name: str
+    rpt_info_type: tuple[RptInfoType, ...]
+    period: int  # ms between reports
+    no_change_period: int  # ms between reports while nothing changes
+
+    def command_kwargs(self) -> dict[str, Any]:
+        """Return the keyword arguments for ``send_command(..., "request_iot_sys", ...)``."""
+        return {
+            "rpt_act": RptAct.RPT_START,
+            "rpt_info_type": list(self.rpt_info_type),
+            "timeout": 10000,
+            "period": self.period,
+            "no_change_period": self.no_change_period,
+            "count": 0,
+        }
+
+
+# Working: everything the app shows, as often as the app asks for it
+ACTIVE = ReportProfile(
+    "active",
+    (
+        RptInfoType.RIT_DEV_STA,
+        RptInfoType.RIT_DEV_LOCAL,
+        RptInfoType.RIT_WORK,
+        RptInfoType.RIT_MAINTAIN,
+        RptInfoType.RIT_BASESTATION_INFO,
+        RptInfoType.RIT_VIO,
+    ),
+    period=3000,
+    no_change_period=4000,
+)
+# Parked off the dock: status, position and RTK base
+IDLE = ReportProfile(
+    "idle",
+    (RptInfoType.RIT_DEV_STA, RptInfoType.RIT_DEV_LOCAL, RptInfoType.RIT_BASESTATION_INFO),
+    period=30000,
+    no_change_period=60000,
+)
+# On the dock: status (battery, charge state) and maintenance counters
+CHARGING = ReportProfile(
+    "charging",
+    (RptInfoType.RIT_DEV_STA, RptInfoType.RIT_MAINTAIN),
+    period=30000,
+    no_change_period=120000,
+)
+
+# Commands that set the mower moving; the stream switches to ACTIVE as soon as one is sent
+WORK_COMMANDS = frozenset({"start_job", "resume_execute_task", "single_schedule", "leave_dock", "return_to_dock"})
+
+_CHARGING_MODES = (WorkMode.MODE_CHARGING, WorkMode.MODE_CHARGING_PAUSE)
+_IDLE_MODES = (WorkMode.MODE_NOT_ACTIVE, WorkMode.MODE_ONLINE, WorkMode.MODE_READY)
+# Offline, updating, locked, ...: the device is not streaming normally, leave it alone
+_UNMANAGED_MODES = (
+    WorkMode.MODE_OFFLINE,
+    WorkMode.MODE_DISABLE,
+    WorkMode.MODE_INITIALIZATION,
+    WorkMode.MODE_UPDATING,
+    WorkMode.MODE_LOCK,
+    WorkMode.MODE_UPDATE_SUCCESS,
+    WorkMode.MODE_OTA_UPGRADE_FAIL,
+)
+
+
+def profile_for(sys_status: int | None, charge_state: int | None = 0) -> ReportProfile | None:
+    """Return the profile suited to a ``report_data.dev`` status, or None to keep the current one."""
+    if sys_status is None or sys_status in _UNMANAGED_MODES:
+        return None
+    if sys_status in _CHARGING_MODES or (sys_status in _IDLE_MODES and charge_state):
+        return CHARGING
+    if sys_status in _IDLE_MODES:
+        return IDLE
+    return ACTIVE  # working, returning, paused, mapping, manual, location error, ...
+
+
+class ReportCadence:
+    """Track which profile a device is streaming and decide when to switch.
+
+    Switching to :data:`ACTIVE` happens on the first status that asks for it, or
+    as soon as a command that starts the mower is sent (:meth:`command_sent`), so
+    a task that starts gets full reporting immediately. Slowing down waits until
+    the calmer status has held for ``idle_hold`` seconds, so a short stop between
+    zones or a brief dock does not flap the stream.
+    """
+
+    def __init__(self, idle_hold: float = 120.0, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize with nothing requested yet."""
+        self.idle_hold = idle_hold
+        self._clock = clock
+        self.current: ReportProfile | None = None
+        self._wanted: ReportProfile | None = None
+        self._wanted_since = 0.0
+        self.suspended = False
+        self.switches = 0
+
+    def due(self, sys_status: int | None, charge_state: int | None = 0) -> ReportProfile | None:
+        """Return the profile to request now, or None if the current one still fits."""
+        target = profile_for(sys_status, charge_state)
+        if target is None or self.suspended:
+            return None
+        now = self._clock()
+        if target is not self._wanted:
+            self._wanted, self._wanted_since = target, now
+        if target is self.current:
+            return None
+        if self.current is None or target is ACTIVE or now - self._wanted_since >= self.idle_hold:
+            return target
+        return None
+
+    def command_sent(self, key: str) -> ReportProfile | None:
+        """Return :data:`ACTIVE` if command ``key`` sets the mower moving and it is not streamed yet.
+
+        Waiting for a status report that says the mower is working would leave the
+        first seconds of the task, or longer on a slow idle period, without position
+        updates. A status report that still shows the old state does not undo the
+        switch, since slowing down waits for ``idle_hold``.
+        """
+        if key not in WORK_COMMANDS or self.suspended:
+            return None
+        self._wanted, self._wanted_since = ACTIVE, self._clock()
+        return None if self.current is ACTIVE else ACTIVE
+
+    def record_sent(self, profile: ReportProfile) -> None:
+        """Record that ``profile`` was requested from the device."""
+        if profile is not self.current:
+            self.switches += 1
+        self.current = profile
+        self.suspended = False
+
+    def invalidate(self) -> None:
+        """Forget the current profile, e.g. after a reconnect reset the device's report config."""
+        self.current = None
+
+    def suspend(self) -> None:
+        """Stop switching profiles after reporting was stopped on purpose, until the next :meth:`record_sent`."""
+        self.current = None
+        self.suspended = True
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Snapshot of the cadence for diagnostics."""
+        return {
+            "profile": self.current.name if self.current else None,
+            "suspended": self.suspended,
+            "wanted": self._wanted.name if self._wanted else None,
+            "wanted_for": round(self._clock() - self._wanted_since, 1) if self._wanted else None,
+            "switches": self.switches,
+        }
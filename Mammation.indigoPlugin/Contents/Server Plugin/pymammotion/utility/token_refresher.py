@@ -0,0 +1,129 @@
+"""Refresh access tokens ahead of expiry, once per expiry, shared by every caller."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from logging import getLogger
+import time
+from typing import Any
+
+from pymammotion.utility.metrics import REGISTRY
+
+logger = getLogger(__name__)
+
+TOKEN_REFRESHES = REGISTRY.counter(
+    "pymammotion_token_refreshes_total", "Token refreshes by token and result", ("token", "result")
+)
+
+
+class TokenRefresher:
+    """Keep one credential fresh in the background with a single-flight refresh.
+
+    A token issued at ``issued_at()`` and expiring at ``expires_at()`` is due for
+    refresh once ``fraction`` of its lifetime has passed, or ``margin`` seconds
+    before expiry if that comes first. :meth:`start` runs a background task that
+    sleeps until then and refreshes, so commands normally never see a stale token.
+    :meth:`ensure_fresh` is the inline fallback (e.g. after the host slept): it
+    only refreshes when due, and all concurrent callers await the same refresh
+    instead of each starting their own.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        refresh: Callable[[], Awaitable[Any]],
+        issued_at: Callable[[], float],
+        expires_at: Callable[[], float],
+        *,
+        fraction: float = 0.8,
+        margin: float = 300.0,
+        retry_delay: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize without starting the background task."""
+        self.name = name
+        self.fraction = fraction
+        self.margin = margin
+        self.retry_delay = retry_delay
+        self._refresh = refresh
+        self._issued_at = issued_at
+        self._expires_at = expires_at
+        self._clock = clock
+        self._inflight: asyncio.Future | None = None
+        self._task: asyncio.Task | None = None
+        self._refreshes = 0
+        self._failures = 0
+        self._joined = 0
+
+    def due_at(self) -> float:
+        """Return the wall-clock time at which the token should be refreshed."""
+        issued, expires = self._issued_at(), self._expires_at()
+        return min(issued + (expires - issued) * self.fraction, expires - self.margin)
+
+    def is_due(self) -> bool:
+        return self._clock() >= self.due_at()
+
+    async def ensure_fresh(self) -> None:
+        """Refresh now if the token is due, joining a refresh that is already running."""
+        if self._inflight is not None or self.is_due():
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """Run the refresh, or wait for the one already in flight. Errors reach every waiter."""
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh())
+            self._inflight.add_done_callback(self._finished)
+        else:
+            self._joined += 1
+        await asyncio.shield(self._inflight)
+
+    def _finished(self, future: asyncio.Future) -> None:
+        self._inflight = None
+        if future.cancelled() or future.exception() is not None:
+            self._failures += 1
+            TOKEN_REFRESHES.labels(self.name, "failed").inc()
+        else:
+            self._refreshes += 1
+            TOKEN_REFRESHES.labels(self.name, "ok").inc()
+
+    def start(self) -> None:
+        """Start (or keep) the background refresh task on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=f"token-refresh-{self.name}")
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            delay = self.due_at() - self._clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue  # the token may have been refreshed inline meanwhile
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                logger.debug("%s background token refresh failed: %s", self.name, ex)
+                await asyncio.sleep(self.retry_delay)
+                continue
+            if self.is_due():
+                # Refresh returned without renewing the token (e.g. an error response)
+                logger.debug("%s token refresh did not renew the token, retrying later", self.name)
+                await asyncio.sleep(self.retry_delay)
+            else:
+                logger.debug("%s token refreshed ahead of expiry", self.name)
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Snapshot of the refresher for diagnostics."""
+        return {
+            "due_in": round(self.due_at() - self._clock(), 1),
+            "running": self._task is not None and not self._task.done(),
+            "in_flight": self._inflight is not None,
+            "refreshes": self._refreshes,
+            "failures": self._failures,
+            "joined": self._joined,
+        }
@@ -0,0 +1,124 @@
+# Supervised task scheduling for the plugin's asyncio loop.
+#
+# Every background job is submitted under a (dev_id, purpose) key:
+#   - a job whose key is already waiting to start is coalesced into it
+#   - a job whose key is already running is remembered once and re-run when the
+#     current run finishes, so the latest state is always picked up
+#   - either way the most recently submitted factory is the one that runs
+#   - at most `per_device_limit` jobs run at the same time for one device
+#   - the supervisor holds a strong reference to every task until it finishes
+# Passing purpose=None opts out of de-duplication and of the device limit: one-off
+# user commands (start, pause, dock) must not queue behind background refreshes.
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
+
+
+class TaskSupervisor:
+    def __init__(self, loop, logger=None, per_device_limit=2):
+        self._loop = loop
+        self.logger = logger or logging.getLogger("Plugin.TaskSupervisor")
+        self.per_device_limit = per_device_limit
+        self._tasks = {}  # (dev_id, purpose) -> asyncio.Task
+        self._started = set()  # keys whose task holds a device slot
+        self._rerun = set()  # keys to run again once the current run finishes
+        self._factories = {}  # key -> latest factory, taken when the next run starts
+        self._limits = {}  # dev_id -> asyncio.Semaphore
+        self._unique = itertools.count()
+        self.submitted = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.completed = 0
+        self.last_failure = None  # (key, repr(exception), wall time)
+
+    def submit(self, dev_id, purpose, factory):
+        """
+        Schedule factory() on the loop under (dev_id, purpose). Safe from any thread.
+        factory is only called if the job actually runs, so coalesced jobs never
+        create a coroutine that is left un-awaited.
+        """
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._submit, dev_id, purpose, factory)
+
+    def submit_coro(self, dev_id, coro):
+        """Schedule an already-created coroutine; never de-duplicated."""
+        self.submit(dev_id, None, lambda: coro)
+
+    def _submit(self, dev_id, purpose, factory):
+        self.submitted += 1
+        key = (dev_id, purpose if purpose is not None else ("once", next(self._unique)))
+        # The latest submission wins, whether it starts a task, joins a waiting one or
+        # becomes the rerun of a running one
+        self._factories[key] = factory
+        if key in self._tasks:
+            if key not in self._started or key in self._rerun:
+                self.coalesced += 1
+                return
+            self._rerun.add(key)
+            return
+        task = self._loop.create_task(self._run(key, limited=purpose is not None))
+        self._tasks[key] = task
+
+    async def _run(self, key, limited=True):
+        limit = None
+        if limited:
+            dev_id = key[0]
+            limit = self._limits.get(dev_id)
+            if limit is None:
+                limit = self._limits[dev_id] = asyncio.Semaphore(self.per_device_limit)
+        try:
+            while True:
+                async with limit or contextlib.nullcontext():
+                    factory = self._factories.pop(key)
+                    self._started.add(key)
+                    try:
+                        await factory()
+                        self.completed += 1
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as ex:
+                        self.failed += 1
+                        self.last_failure = (key, repr(ex), time.time())
+                        self.logger.debug(f"Supervised task {key} failed: {ex}")
+                    finally:
+                        self._started.discard(key)
+                if key not in self._rerun:
+                    break
+                self._rerun.discard(key)
+        finally:
+            self._rerun.discard(key)
+            if self._tasks.get(key) is asyncio.current_task():
+                self._factories.pop(key, None)
+                del self._tasks[key]
+
+    def cancel_device(self, dev_id):
+        """Cancel every job of one device (call on the loop)."""
+        for key, task in list(self._tasks.items()):
+            if key[0] == dev_id:
+                task.cancel()
+        self._limits.pop(dev_id, None)
+
+    async def cancel_all(self, timeout=1.0):
+        """Cancel every job and wait briefly for them to unwind (call on the loop)."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+    @property
+    def state(self):
+        """Counters for diagnostics / metrics."""
+        return {
+            "running": len(self._started),
+            "waiting": len(self._tasks) - len(self._started),
+            "rerun_pending": len(self._rerun),
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
@@ -0,0 +1,148 @@
+# Bounded accumulator for multi-frame cover_path_upload transactions.
+#
+# The mower sends a mowing path as `total_frame` cover_path_upload frames sharing one
+# transaction_id. Frames are collected per (dev_id, transaction_id) until all have
+# arrived; a connection drop mid-transfer means the rest never come. So:
+#   - each frame keeps only its path points, as a flat array of x, y doubles
+#   - an incomplete transaction is evicted `ttl` seconds after its last frame
+#   - per device at most `max_transactions` transactions and `max_points` points are
+#     kept; the least recently updated transaction goes first
+# `state` reports pending and evicted transactions for diagnostics.
+
+import threading
+import time
+from array import array
+
+TRANSACTION_TTL_SEC = 1800.0  # incomplete transaction dropped 30 min after its last frame
+MAX_TRANSACTIONS_PER_DEVICE = 4
+MAX_POINTS_PER_DEVICE = 200000  # ~3 MB of coordinates
+
+
+class _Transaction:
+    __slots__ = ("total", "area", "data_hash", "frames", "points", "started", "updated")
+
+    def __init__(self, total, area, data_hash, now):
+        self.total = total
+        self.area = area
+        self.data_hash = data_hash
+        self.frames = {}  # current_frame -> (array('d', [x0, y0, x1, y1, ...]), time, valid_paths)
+        self.points = 0
+        self.started = now
+        self.updated = now
+
+    @property
+    def complete(self):
+        return len(self.frames) >= self.total
+
+
+class WaypointFrames:
+    def __init__(self, ttl=TRANSACTION_TTL_SEC, max_transactions=MAX_TRANSACTIONS_PER_DEVICE,
+                 max_points=MAX_POINTS_PER_DEVICE, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_transactions = max_transactions
+        self.max_points = max_points
+        self._clock = clock
+        self._lock = threading.Lock()  # frames arrive on MQTT threads, readers run on the loop
+        self._devices = {}  # dev_id -> {transaction_id: _Transaction}
+        self.completed = 0
+        self.evicted_expired = 0
+        self.evicted_capacity = 0
+
+    def add(self, dev_id, cover_path):
+        """
+        Store one cover_path_upload frame. Returns True once every frame of its
+        transaction has arrived (the transaction stays until pop()).
+        """
+        transaction_id = cover_path.transaction_id
+        xy = array("d")
+        for packet in getattr(cover_path, "path_packets", None) or []:
+            for couple in packet.data_couple:
+                xy.append(couple.x)
+                xy.append(couple.y)
+        now = self._clock()
+        with self._lock:
+            transactions = self._devices.setdefault(dev_id, {})
+            self._expire(transactions, now)
+            trans = transactions.get(transaction_id)
+            if trans is None:
+                trans = transactions[transaction_id] = _Transaction(
+                    cover_path.total_frame, getattr(cover_path, "area", None),
+                    getattr(cover_path, "data_hash", None), now,
+                )
+            previous = trans.frames.get(cover_path.current_frame)
+            if previous is not None:
+                trans.points -= len(previous[0]) // 2  # re-sent frame replaces the old copy
+            trans.frames[cover_path.current_frame] = (
+                xy, getattr(cover_path, "time", None), getattr(cover_path, "vaild_path_num", 0)
+            )
+            trans.points += len(xy) // 2
+            trans.updated = now
+            self._enforce_caps(transactions, keep=transaction_id)
+            return transaction_id in transactions and trans.complete
+
+    def _expire(self, transactions, now):
+        for transaction_id, trans in list(transactions.items()):
+            if not trans.complete and now - trans.updated > self.ttl:
+                del transactions[transaction_id]
+                self.evicted_expired += 1
+
+    def _enforce_caps(self, transactions, keep):
+        if transactions[keep].points > self.max_points:
+            # Could never fit: drop it rather than everything older
+            del transactions[keep]
+            self.evicted_capacity += 1
+        # Oldest first, never the transaction being filled
+        by_age = sorted((tid for tid in transactions if tid != keep), key=lambda tid: transactions[tid].updated)
+        points = sum(trans.points for trans in transactions.values())
+        for transaction_id in by_age:
+            if len(transactions) <= self.max_transactions and points <= self.max_points:
+                break
+            points -= transactions.pop(transaction_id).points
+            self.evicted_capacity += 1
+
+    def pop(self, dev_id, transaction_id):
+        """Remove a transaction and return its point count (0 if unknown)."""
+        with self._lock:
+            trans = self._devices.get(dev_id, {}).pop(transaction_id, None)
+            if trans is None:
+                return 0
+            if trans.complete:
+                self.completed += 1
+            return trans.points
+
+    def transactions(self, dev_id):
+        """
+        Snapshot of one device's pending transactions (after dropping expired ones):
+        [(transaction_id, frames_received, total_frame, [(x, y), ...] in frame order)].
+        """
+        with self._lock:
+            transactions = self._devices.get(dev_id)
+            if not transactions:
+                return []
+            self._expire(transactions, self._clock())
+            snapshot = []
+            for transaction_id, trans in transactions.items():
+                points = []
+                for frame in sorted(trans.frames):
+                    xy = trans.frames[frame][0]
+                    points.extend(zip(xy[0::2], xy[1::2]))
+                snapshot.append((transaction_id, len(trans.frames), trans.total, points))
+            return snapshot
+
+    def clear_device(self, dev_id):
+        with self._lock:
+            self._devices.pop(dev_id, None)
+
+    @property
+    def state(self):
+        """Counters for diagnostics / metrics."""
+        with self._lock:
+            pending = [trans for transactions in self._devices.values() for trans in transactions.values()]
+            return {
+                "pending_transactions": len(pending),
+                "pending_points": sum(trans.points for trans in pending),
+                "pending_bytes": sum(trans.points * 16 for trans in pending),
+                "completed": self.completed,
+                "evicted_expired": self.evicted_expired,
+                "evicted_capacity": self.evicted_capacity,
+            }
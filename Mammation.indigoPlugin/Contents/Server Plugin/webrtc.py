@@ -7,6 +7,12 @@
 #   POST /webrtc/move         -> one-shot movement  {dir: up|down|left|right, speed: float}
 #   POST /webrtc/move_hold    -> start continuous move (optional)
 #   POST /webrtc/move_release -> stop continuous move (optional)
+#   GET  /webrtc/control      -> WebSocket joystick channel  {x: -1..1, y: -1..1}
+#   GET  /map/{dev_id}/live   -> Server-Sent Events: mower position/heading/zone deltas
+#   GET  /map/{dev_id}/geojson, /map/{dev_id}/mowpath  -> map GeoJSON (?zoom=<level> or
+#                                ?tolerance=<metres> for simplified geometry)
+#   GET  /map/{dev_id}/mowpath?since=<cursor>  -> only cover-path segments added after "cursor"
+#   GET  /map/{dev_id}/geojson?mower=only  -> just the mower point (the base map carries none)
 
 try:
     import indigo
@@ -19,6 +25,7 @@ import asyncio
 import json
 import indigo
 import logging
+import time
 
 #logger = logging.getLogger("Plugin.MammationWEBRTC")
 
@@ -320,8 +327,19 @@ def start_webrtc_http(plugin):
                   }}
                 }}
 
-                function loadStaticMap() {{
-                  return fetch(`/map/${{devId}}/geojson`)
+                // Geometry is requested simplified to about one pixel at the current zoom,
+                // clamped to the range where the tolerance still changes, and refetched
+                // (without re-fitting the view) when the zoom level changes.
+                const MIN_REQUEST_ZOOM = 10;
+                const MAX_REQUEST_ZOOM = 22;
+                let fetchedZoom = null;
+                function requestZoom() {{
+                  return Math.min(MAX_REQUEST_ZOOM, Math.max(MIN_REQUEST_ZOOM, Math.round(map.getZoom())));
+                }}
+
+                function loadStaticMap(fit = true) {{
+                  fetchedZoom = requestZoom();
+                  return fetch(`/map/${{devId}}/geojson?zoom=${{fetchedZoom}}`)
                     .then(r => r.json())
                     .then(data => {{
                       if (!data || data.ok === false) {{
@@ -402,14 +420,15 @@ def start_webrtc_http(plugin):
                       // Update mower position from this data
                       updateMowerPosition(data);
 
-                      // Fit map with very tight padding (0.05 instead of 0.1)
-                      if (areaBounds.isValid() && hasValidAreas) {{
+                      // Fit map with very tight padding (0.05 instead of 0.1); a refetch for a
+                      // new zoom level keeps the user's view
+                      if (fit && areaBounds.isValid() && hasValidAreas) {{
                         // Use minimal padding for tightest fit
                         map.fitBounds(areaBounds.pad(0.05), {{ 
                           maxZoom: 21,  // Allow closer zoom
                           animate: false 
                         }});
-                      }} else if (allBounds.isValid()) {{
+                      }} else if (fit && allBounds.isValid()) {{
                         // Fallback to all bounds if no valid areas
                         map.fitBounds(allBounds.pad(0.05), {{ 
                           maxZoom: 21,
@@ -424,8 +443,8 @@ def start_webrtc_http(plugin):
                     }});
                 }}
 
-                function loadMowPath() {{
-                  return fetch(`/map/${{devId}}/mowpath`)
+                function loadMowPath(fit = true) {{
+                  return fetch(`/map/${{devId}}/mowpath?zoom=${{requestZoom()}}`)
                     .then(r => r.json())
                     .then(data => {{
                       if (!data || data.ok === false) {{
@@ -451,7 +470,7 @@ def start_webrtc_http(plugin):
                       pathLayers.addLayer(layer);
 
                       // Re-fit after adding paths with tight padding
-                      if (areaBounds && areaBounds.isValid()) {{
+                      if (fit && areaBounds && areaBounds.isValid()) {{
                         map.fitBounds(areaBounds.pad(0.05), {{ 
                           maxZoom: 21,
                           animate: true,
@@ -468,7 +487,7 @@ def start_webrtc_http(plugin):
 
                 function refreshMowerOnly() {{
                   // Quick update of just mower position
-                  fetch(`/map/${{devId}}/geojson`)
+                  fetch(`/map/${{devId}}/geojson?mower=only`)
                     .then(r => r.json())
                     .then(data => {{
                       if (data && data.features) {{
@@ -497,17 +516,65 @@ def start_webrtc_http(plugin):
                   }}
                 }}
 
-                // Initial load
+                // Initial load; the static map has no mower point, so place it once here
+                // (SSE then keeps it moving)
                 Promise.all([
                   loadStaticMap(),
                   loadMowPath()
                 ]).then(() => {{
+                  refreshMowerOnly();
                   console.log('Map loaded');
                 }});
 
                 // Periodic updates
-                // Update mower position every 5 seconds
-                setInterval(refreshMowerOnly, 5000);
+                // Live mower position pushed over Server-Sent Events; poll every 5 seconds as fallback
+                let livePos = {{}};
+                let pollTimer = null;
+                function applyLive(delta) {{
+                  Object.assign(livePos, delta);
+                  if (livePos.lat === undefined || livePos.lon === undefined) return;
+                  updateMowerPosition({{features: [{{
+                    type: 'Feature',
+                    properties: {{type_name: 'mower', source: livePos.source}},
+                    geometry: {{type: 'Point', coordinates: [livePos.lon, livePos.lat]}}
+                  }}]}});
+                  if (!mowerMarker) return;
+                  // Heading, work zone and edge distance ride along with the position
+                  const lines = [
+                    `<b>${{mowerMarker.options.title}}</b>`,
+                    `Position: ${{livePos.lat.toFixed(6)}}, ${{livePos.lon.toFixed(6)}}`
+                  ];
+                  if (livePos.heading != null) lines.push(`Heading: ${{livePos.heading}}&deg;`);
+                  if (livePos.zone) lines.push(`Zone: ${{livePos.zone}}`);
+                  if (livePos.located_zone != null) lines.push(`In area: ${{livePos.located_zone}}`);
+                  if (livePos.boundary_m != null) lines.push(`Edge: ${{livePos.boundary_m}} m`);
+                  mowerMarker.setPopupContent(lines.join('<br>'));
+                }}
+                if (window.EventSource) {{
+                  const live = new EventSource(`/map/${{devId}}/live`);
+                  live.onmessage = (e) => {{
+                    try {{ applyLive(JSON.parse(e.data)); }} catch (err) {{ console.error('Live update failed', err); }}
+                  }};
+                  live.onerror = () => {{
+                    if (live.readyState === EventSource.CLOSED && !pollTimer) {{
+                      pollTimer = setInterval(refreshMowerOnly, 5000);
+                    }}
+                  }};
+                }} else {{
+                  pollTimer = setInterval(refreshMowerOnly, 5000);
+                }}
+
+                // Coarser or finer geometry once the zoom level settles on a new value
+                let zoomTimer = null;
+                map.on('zoomend', () => {{
+                  clearTimeout(zoomTimer);
+                  zoomTimer = setTimeout(() => {{
+                    if (requestZoom() !== fetchedZoom) {{
+                      loadStaticMap(false);
+                      loadMowPath(false);
+                    }}
+                  }}, 250);
+                }});
 
                 // Full refresh of paths every 30 seconds
                 setInterval(loadMowPath, 30000);
@@ -688,6 +755,7 @@ def start_webrtc_http(plugin):
         Promise.all([
           addGeoJson(`/map/${{devId}}/geojson`, true),
           addGeoJson(`/map/${{devId}}/mowpath`, false),
+          addGeoJson(`/map/${{devId}}/geojson?mower=only`, false),
         ]);
       </script>
         </body>
@@ -696,9 +764,137 @@ def start_webrtc_http(plugin):
 
                 return web.Response(text=html, content_type="text/html")
 
+            def _mower_position(mowing_device):
+                """
+                Best available mower position as {"lat", "lon", "source"} in degrees, or None.
+                Sources in priority order: report_data.local, vision_info, work.path_pos,
+                nav.cover_path_upload (all metres from the RTK base), then location.device (GPS).
+                """
+                import math
+
+                location = getattr(mowing_device, "location", None)
+                rtk = getattr(location, "RTK", None)
+                rtk_lat_rad = getattr(rtk, "latitude", None)
+                rtk_lon_rad = getattr(rtk, "longitude", None)
+                if rtk_lat_rad is None or rtk_lon_rad is None:
+                    return None
+
+                pos_x = None
+                pos_y = None
+                report_data = getattr(mowing_device, "report_data", None)
+                if report_data:
+                    # Priority 1: report_data.local (most accurate when available)
+                    local_status = getattr(report_data, "local", None)
+                    if local_status:
+                        pos_x = getattr(local_status, "pos_x", None)
+                        pos_y = getattr(local_status, "pos_y", None)
+                        if pos_x is None or pos_y is None:
+                            pos_x = pos_y = None
+
+                    # Priority 2: report_data.vision_info
+                    if pos_x is None:
+                        vision_info = getattr(report_data, "vision_info", None)
+                        if vision_info:
+                            vx = getattr(vision_info, "x", None)
+                            vy = getattr(vision_info, "y", None)
+                            if vx is not None and vy is not None:
+                                pos_x = float(vx)
+                                pos_y = float(vy)
+
+                    # Priority 3: work.path_pos (in mm, needs scaling)
+                    if pos_x is None:
+                        work = getattr(report_data, "work", None)
+                        if work:
+                            wpx = getattr(work, "path_pos_x", None)
+                            wpy = getattr(work, "path_pos_y", None)
+                            if wpx is not None and wpy is not None:
+                                pos_x = float(wpx) / 1000.0
+                                pos_y = float(wpy) / 1000.0
+
+                    # Priority 4: raw_data.nav.cover_path_upload (current mowing path)
+                    if pos_x is None:
+                        raw_data = getattr(mowing_device, "raw_data", None)
+                        nav = getattr(raw_data, "nav", None) if raw_data else None
+                        cover_path = getattr(nav, "cover_path_upload", None) if nav else None
+                        for packet in (getattr(cover_path, "path_packets", []) if cover_path else []):
+                            data_couples = getattr(packet, "data_couple", [])
+                            if data_couples:
+                                pos_x = getattr(data_couples[0], "x", None)
+                                pos_y = getattr(data_couples[0], "y", None)
+                                if pos_x is not None and pos_y is not None:
+                                    break
+                                pos_x = pos_y = None
+
+                if pos_x is not None and pos_y is not None:
+                    # Convert X/Y (meters from RTK base) to lat/lon offsets
+                    # X is East/West, Y is North/South
+                    rtk_lat = rtk_lat_rad * 180.0 / math.pi
+                    rtk_lon = rtk_lon_rad * 180.0 / math.pi
+                    return {
+                        "lat": rtk_lat + pos_y / 111111.0,  # ~111km per degree latitude
+                        "lon": rtk_lon + pos_x / (111111.0 * math.cos(math.radians(rtk_lat))),
+                        "source": "device",
+                    }
+
+                # Fallback: location.device (degrees, from CoordinateConverter.enu_to_lla)
+                return _device_location(mowing_device)
+
+            def _device_location(mowing_device):
+                """
+                location.device as {"lat", "lon", "source"} in degrees, or None until a fix arrives.
+                Updated by every rapid state as well as every report, so it is the freshest position.
+                """
+                dev_loc = getattr(getattr(mowing_device, "location", None), "device", None)
+                lat = getattr(dev_loc, "latitude", None)
+                lon = getattr(dev_loc, "longitude", None)
+                if lat is None or lon is None or (lat == 0 and lon == 0):
+                    return None
+                return {"lat": lat, "lon": lon, "source": "gps"}
+
+            # Simplified waypoint paths: {(dev_id, transaction_id, frames, points, tolerance): feature}
+            _simplified_paths = {}
+
+            # Serialized (orjson) and gzip/brotli-compressed map bodies, per map revision and tolerance
+            from pymammotion.utility.compressed_json import EncodedBodyCache, dumps, negotiate_encoding
+
+            _map_bodies = EncodedBodyCache(maxsize=16)
+            plugin._map_body_cache = _map_bodies
+
+            # Right after start-up the RTK base / dock position may not be in yet, so /geojson
+            # waits for them -- but only within MAP_STARTUP_GRACE of the server starting and
+            # only until a device has had them once; otherwise it answers 503 straight away
+            MAP_STARTUP_GRACE = 120.0
+            MAP_LOCATION_WAIT = 5.0
+            _map_started = time.monotonic()
+            _map_located = set()  # dev_ids whose RTK base and dock have been seen
+
+            async def _json_body_response(request: web.Request, key, build) -> web.Response:
+                """Serve the cached body for key in the best encoding the client accepts."""
+                encoding = negotiate_encoding(request.headers.get("Accept-Encoding"))
+                body = await _map_bodies.aget(key, encoding, build)
+                headers = {"Vary": "Accept-Encoding"}
+                if encoding:
+                    headers["Content-Encoding"] = encoding
+                return web.Response(body=body, content_type="application/json", headers=headers)
+
+            def _request_tolerance(request: web.Request, rtk) -> float:
+                """Simplification tolerance in metres from ?tolerance=<m> or ?zoom=<level>; 0 = full detail."""
+                try:
+                    if "tolerance" in request.query:
+                        return max(0.0, float(request.query["tolerance"]))
+                    if "zoom" in request.query:
+                        import math
+                        from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
+                        lat = math.degrees(getattr(rtk, "latitude", 0.0) or 0.0)
+                        return GeojsonGenerator.tolerance_for_zoom(float(request.query["zoom"]), lat)
+                except Exception:
+                    pass
+                return 0.0
+
             async def map_geojson(request: web.Request) -> web.Response:
                 """
-                Full map GeoJSON using PyMammotion with proper mower position.
+                Full map GeoJSON using PyMammotion; the mower point is served by ?mower=only and /live.
                 """
                 try:
                     dev_id = int(request.match_info["dev_id"])
@@ -718,6 +914,11 @@ def start_webrtc_http(plugin):
                     return _json_error("device not ready", 404)
 
                 try:
+                    sm = plugin._state_manager(dev_id)
+                    if sm is not None and dev_id not in _map_located:
+                        grace = MAP_STARTUP_GRACE - (time.monotonic() - _map_started)
+                        if grace > 0 and await sm.wait_rtk_and_dock(timeout=min(MAP_LOCATION_WAIT, grace)):
+                            _map_located.add(dev_id)
                     location = getattr(mowing_device, "location", None)
                     rtk = getattr(location, "RTK", None)
                     dock = getattr(location, "dock", None)
@@ -730,98 +931,18 @@ def start_webrtc_http(plugin):
                         state_mgr = MowerStateManager(mowing_device)
                         setattr(mowing_device, "state_manager", state_mgr)
 
-                    # Base geojson (areas, paths, RTK, dock)
-                    geo = state_mgr.generate_geojson(rtk, dock)
-
-                    # --- Add mower position using multiple data sources ---
-                    try:
-                        import math
-
-                        # Get RTK reference point (in radians)
-                        rtk_lat_rad = getattr(rtk, "latitude", None)
-                        rtk_lon_rad = getattr(rtk, "longitude", None)
-
-                        if rtk_lat_rad is None or rtk_lon_rad is None:
-                            plugin.logger.debug("map_geojson: RTK reference not available")
-                            return web.json_response(geo)
-
-                        # Convert RTK to degrees
-                        rtk_lat = rtk_lat_rad * 180.0 / math.pi
-                        rtk_lon = rtk_lon_rad * 180.0 / math.pi
-
-                        # Try multiple sources for mower position
-                        pos_x = None
-                        pos_y = None
-
-                        # Priority 1: report_data.local (most accurate when available)
-                        report_data = getattr(mowing_device, "report_data", None)
-                        if report_data:
-                            local_status = getattr(report_data, "local", None)
-                            if local_status:
-                                pos_x = getattr(local_status, "pos_x", None)
-                                pos_y = getattr(local_status, "pos_y", None)
-                                if pos_x is not None and pos_y is not None:
-                                    plugin.logger.debug(
-                                        f"map_geojson: using report_data.local position x={pos_x}, y={pos_y}")
-
-                            # Priority 2: report_data.vision_info
-                            if pos_x is None:
-                                vision_info = getattr(report_data, "vision_info", None)
-                                if vision_info:
-                                    vx = getattr(vision_info, "x", None)
-                                    vy = getattr(vision_info, "y", None)
-                                    if vx is not None and vy is not None:
-                                        pos_x = float(vx)
-                                        pos_y = float(vy)
-                                        plugin.logger.debug(
-                                            f"map_geojson: using vision_info position x={pos_x}, y={pos_y}")
-
-                            # Priority 3: work.path_pos (in mm, needs scaling)
-                            if pos_x is None:
-                                work = getattr(report_data, "work", None)
-                                if work:
-                                    wpx = getattr(work, "path_pos_x", None)
-                                    wpy = getattr(work, "path_pos_y", None)
-                                    if wpx is not None and wpy is not None:
-                                        pos_x = float(wpx) / 1000.0
-                                        pos_y = float(wpy) / 1000.0
-                                        plugin.logger.debug(
-                                            f"map_geojson: using work.path_pos position x={pos_x}, y={pos_y}")
-
-                            # Priority 4: raw_data.nav.cover_path_upload (current mowing path)
-                            if pos_x is None:
-                                raw_data = getattr(mowing_device, "raw_data", None)
-                                if raw_data:
-                                    nav = getattr(raw_data, "nav", None)
-                                    if nav:
-                                        cover_path = getattr(nav, "cover_path_upload", None)
-                                        if cover_path:
-                                            path_packets = getattr(cover_path, "path_packets", [])
-                                            if path_packets:
-                                                # Get the first point of the current path
-                                                for packet in path_packets:
-                                                    data_couples = getattr(packet, "data_couple", [])
-                                                    if data_couples:
-                                                        couple = data_couples[0]  # Take first point
-                                                        pos_x = getattr(couple, "x", None)
-                                                        pos_y = getattr(couple, "y", None)
-                                                        if pos_x is not None and pos_y is not None:
-                                                            plugin.logger.debug(
-                                                                f"map_geojson: using cover_path_upload position x={pos_x}, y={pos_y}")
-                                                            break
-
-                        # If we have position data, convert to lat/lon
-                        if pos_x is not None and pos_y is not None:
-                            # Convert X/Y (meters from RTK base) to lat/lon offsets
-                            # X is East/West, Y is North/South
-                            lat_offset = pos_y / 111111.0  # ~111km per degree latitude
-                            lon_offset = pos_x / (111111.0 * math.cos(math.radians(rtk_lat)))
-
-                            mower_lat = rtk_lat + lat_offset
-                            mower_lon = rtk_lon + lon_offset
-
-                            # Add mower feature
-                            mower_feature = {
+                    # ?mower=only: just the mower point, small and never cached. The map page
+                    # gets the position from /live and only falls back to this when SSE fails.
+                    if request.query.get("mower") == "only":
+                        try:
+                            # Same source as /live, so the marker does not jump between the two
+                            pos = _device_location(mowing_device) or _mower_position(mowing_device)
+                        except Exception as ex_mower:
+                            plugin.logger.debug(f"map_geojson: mower position failed: {ex_mower}")
+                            pos = None
+                        features = []
+                        if pos:
+                            features.append({
                                 "type": "Feature",
                                 "properties": {
                                     "type_name": "mower",
@@ -831,54 +952,29 @@ def start_webrtc_http(plugin):
                                     "opacity": 1.0,
                                     "fillOpacity": 0.9,
                                     "radius": 6,
-                                    "source": "device"  # Mark as device-sourced position
+                                    "source": pos["source"],  # "device" (RTK-relative) or "gps"
                                 },
                                 "geometry": {
                                     "type": "Point",
-                                    "coordinates": [mower_lon, mower_lat]  # GeoJSON is [lon, lat]
-                                }
-                            }
-                            geo.setdefault("features", []).append(mower_feature)
-                            plugin.logger.debug(
-                                f"map_geojson: added mower at lon={mower_lon:.6f}, lat={mower_lat:.6f} (from x={pos_x}, y={pos_y})")
+                                    "coordinates": [pos["lon"], pos["lat"]],  # GeoJSON is [lon, lat]
+                                },
+                            })
                         else:
-                            # Fallback: try location.device if available
-                            dev_loc = getattr(location, "device", None)
-                            if dev_loc:
-                                lat_r = getattr(dev_loc, "latitude", None)
-                                lon_r = getattr(dev_loc, "longitude", None)
-                                if lat_r is not None and lon_r is not None:
-                                    # Convert radians to degrees
-                                    lat_deg = lat_r * 180.0 / math.pi
-                                    lon_deg = lon_r * 180.0 / math.pi
-
-                                    mower_feature = {
-                                        "type": "Feature",
-                                        "properties": {
-                                            "type_name": "mower",
-                                            "title": mower_name or "Mower",
-                                            "color": "#ff0000",
-                                            "weight": 2,
-                                            "opacity": 1.0,
-                                            "fillOpacity": 0.9,
-                                            "radius": 6,
-                                            "source": "gps"
-                                        },
-                                        "geometry": {
-                                            "type": "Point",
-                                            "coordinates": [lon_deg, lat_deg]
-                                        }
-                                    }
-                                    geo.setdefault("features", []).append(mower_feature)
-                                    plugin.logger.debug(
-                                        f"map_geojson: added mower from GPS at lon={lon_deg:.6f}, lat={lat_deg:.6f}")
-                            else:
-                                plugin.logger.debug("map_geojson: no mower position available")
-
-                    except Exception as ex_mower:
-                        plugin.logger.debug(f"map_geojson: mower point generation failed: {ex_mower}")
-
-                    return web.json_response(geo)
+                            plugin.logger.debug("map_geojson: no mower position available")
+                        return web.json_response({"type": "FeatureCollection", "features": features})
+
+                    # Base map (areas, paths, RTK, dock) without the mower, so the body is
+                    # serialized and compressed once per map revision and tolerance rather
+                    # than every time the mower moves
+                    tolerance = _request_tolerance(request, rtk)
+                    key = (
+                        "geojson", dev_id, mowing_device.map.revision,
+                        rtk.latitude, rtk.longitude, dock.latitude, dock.longitude, dock.rotation,
+                        round(tolerance, 2),
+                    )
+                    return await _json_body_response(
+                        request, key, lambda: state_mgr.cached_geojson(rtk, dock, tolerance)
+                    )
 
                 except Exception as ex:
                     plugin.logger.error(f"map_geojson failed for dev_id={dev_id}: {ex}")
@@ -939,37 +1035,37 @@ def start_webrtc_http(plugin):
                         state_mgr = MowerStateManager(mowing_device)
                         setattr(mowing_device, "state_manager", state_mgr)
 
+                    # ?since=<cursor>: only the cover-path segments added after the cursor
+                    track = state_mgr.sync_mow_path(rtk)
+                    if "since" in request.query:
+                        features, reset = track.since(request.query["since"])
+                        delta = {
+                            "type": "FeatureCollection",
+                            "features": features,
+                            "cursor": track.cursor,
+                            "reset": reset,
+                            "complete": track.complete,
+                            "zones": track.zone_progress(),
+                        }
+                        return web.Response(body=dumps(delta), content_type="application/json")
+
+                    tolerance = round(_request_tolerance(request, rtk), 2)
                     try:
-                        std_geo = state_mgr.generate_mowing_geojson(rtk)
+                        std_geo = state_mgr.cached_mowing_geojson(rtk, tolerance)
                         if std_geo and "features" in std_geo:
                             geojson["features"].extend(std_geo["features"])
                     except Exception as ex:
                         plugin.logger.debug(f"generate_mowing_geojson failed: {ex}")
 
-                    # Check if plugin has accumulated waypoint frames
-                    if hasattr(plugin, "_waypoint_frames"):
-                        waypoint_data = plugin._waypoint_frames.get(dev_id, {})
-                        for transaction_id, transaction_data in waypoint_data.items():
-                            frames_dict = transaction_data.get("frames", {})
-                            if frames_dict:
-                                all_points = []
-                                # Process frames in order
-                                for frame_num in sorted(frames_dict.keys()):
-                                    frame_data = frames_dict[frame_num]
-                                    for packet in frame_data.get("path_packets", []):
-                                        data_couples = getattr(packet, "data_couple", []) if hasattr(packet,
-                                                                                                     "data_couple") else packet.get(
-                                            "data_couple", [])
-                                        for couple in data_couples:
-                                            x = getattr(couple, "x", None) if hasattr(couple, "x") else couple.get("x")
-                                            y = getattr(couple, "y", None) if hasattr(couple, "y") else couple.get("y")
-                                            if x is not None and y is not None:
-                                                # Convert to lat/lon
-                                                lat_offset = y / 111111.0
-                                                lon_offset = x / (111111.0 * math.cos(math.radians(rtk_lat)))
-                                                lon = rtk_lon + lon_offset
-                                                lat = rtk_lat + lat_offset
-                                                all_points.append([lon, lat])
+                    # Partial waypoint transactions the plugin is still accumulating
+                    waypoints = getattr(plugin, "_waypoint_frames", None)
+                    if waypoints is not None:
+                        for transaction_id, frame_count, total_frames, xy in waypoints.transactions(dev_id):
+                            if frame_count:
+                                cos_lat = math.cos(math.radians(rtk_lat))
+                                all_points = [
+                                    [rtk_lon + x / (111111.0 * cos_lat), rtk_lat + y / 111111.0] for x, y in xy
+                                ]
 
                                 if len(all_points) > 1:
                                     feature = {
@@ -983,10 +1079,23 @@ def start_webrtc_http(plugin):
                                             "color": "#00ffff",
                                             "weight": 2,
                                             "opacity": 0.8,
-                                            "title": f"Complete Path ({len(frames_dict)} frames)",
+                                            "title": f"Complete Path ({frame_count} frames)",
                                             "transaction_id": transaction_id
                                         }
                                     }
+                                    if tolerance > 0:
+                                        key = (dev_id, transaction_id, frame_count, len(all_points), tolerance)
+                                        simplified = _simplified_paths.get(key)
+                                        if simplified is None:
+                                            from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
+                                            if len(_simplified_paths) >= 64:
+                                                _simplified_paths.clear()
+                                            simplified = GeojsonGenerator.simplify_geojson(
+                                                {"type": "FeatureCollection", "features": [feature]}, tolerance
+                                            )["features"][0]
+                                            _simplified_paths[key] = simplified
+                                        feature = simplified
                                     geojson["features"].append(feature)
 
                     # Add current frame from raw_data.nav.cover_path_upload
@@ -1035,7 +1144,14 @@ def start_webrtc_http(plugin):
                                             geojson["features"].append(feature)
 
                     plugin.logger.debug(f"map_mowpath: returning {len(geojson['features'])} features")
-                    return web.json_response(geojson)
+                    geojson["cursor"] = track.cursor
+                    # Live frames make the revision alone too coarse: key on the serialized body, so
+                    # an unchanged path is only compressed once
+                    import hashlib
+
+                    body = dumps(geojson)
+                    key = ("mowpath", dev_id, hashlib.blake2b(body, digest_size=16).digest())
+                    return await _json_body_response(request, key, lambda: body)
 
                 except Exception as ex:
                     plugin.logger.error(f"map_mowpath failed for dev_id={dev_id}: {ex}")
@@ -1126,6 +1242,109 @@ def start_webrtc_http(plugin):
                     plugin.logger.error(f"map_mowpath failed for dev_id={dev_id}: {ex}")
                     return _json_error(str(ex), 500)
 
+            # --- Live mower position (Server-Sent Events) ---
+            # Pushes only the fields that changed (lat/lon/source, heading, zone, edge distance) when
+            # the state manager reports a move, coalesced to at most one event per client interval.
+            # The position comes from location.device, which rapid state updates between reports;
+            # report_data.local only moves at report cadence.
+            LIVE_DEFAULT_INTERVAL = 1.0
+            LIVE_MIN_INTERVAL = 0.5
+            LIVE_KEEPALIVE = 15.0
+
+            def _live_snapshot(mowing_device, state_mgr=None) -> dict:
+                pos = _device_location(mowing_device) or _mower_position(mowing_device) or {}
+                location = getattr(mowing_device, "location", None)
+                snap = {key: (round(val, 7) if key in ("lat", "lon") else val) for key, val in pos.items()}
+                snap["heading"] = getattr(location, "orientation", None)
+                snap["zone"] = getattr(location, "work_zone", None)
+                if state_mgr is not None:
+                    try:
+                        located, edge = state_mgr.locate_mower()
+                        snap["located_zone"] = located
+                        snap["boundary_m"] = None if edge is None else round(edge, 1)
+                    except Exception as ex:
+                        plugin.logger.debug(f"map_live: zone lookup failed: {ex}")
+                return snap
+
+            async def map_live(request: web.Request) -> web.StreamResponse:
+                try:
+                    dev_id = int(request.match_info["dev_id"])
+                except Exception:
+                    return _json_error("invalid dev_id", 400)
+                try:
+                    interval = max(LIVE_MIN_INTERVAL, float(request.query.get("interval", LIVE_DEFAULT_INTERVAL)))
+                except Exception:
+                    interval = LIVE_DEFAULT_INTERVAL
+
+                dev, mgr, mower_name, mowing_device = await _get_device_and_mgr(dev_id)
+                if not dev or not mgr or not mower_name or not mowing_device:
+                    return _json_error("device not ready", 404)
+                device = mgr.get_device_by_name(mower_name)
+                state_mgr = getattr(device, "state_manager", None)
+                if state_mgr is None or not hasattr(state_mgr, "add_position_listener"):
+                    return _json_error("live position not available", 503)
+
+                resp = web.StreamResponse(
+                    headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+                )
+                await resp.prepare(request)
+                listener = state_mgr.add_position_listener()
+                last = {}
+                try:
+                    while True:
+                        listener.clear()
+                        snap = _live_snapshot(mgr.mower(mower_name), state_mgr)
+                        delta = {key: val for key, val in snap.items() if last.get(key, ...) != val}
+                        if delta:
+                            await resp.write(f"data: {json.dumps(delta)}\n\n".encode())
+                            last.update(delta)
+                        try:
+                            await asyncio.wait_for(listener.wait(), timeout=LIVE_KEEPALIVE)
+                        except asyncio.TimeoutError:
+                            await resp.write(b": keepalive\n\n")
+                            continue
+                        # Coalesce everything that arrives within this client's interval
+                        await asyncio.sleep(interval)
+                except ConnectionResetError:
+                    pass
+                finally:
+                    state_mgr.remove_position_listener(listener)
+                return resp
+
+            async def map_track(request: web.Request) -> web.Response:
+                """
+                Where the mower has been, from the position history kept in memory, as a LineString.
+                ?since=<epoch s> or ?hours=<n>; defaults to since local midnight.
+                """
+                try:
+                    dev_id = int(request.match_info["dev_id"])
+                except Exception:
+                    return _json_error("invalid dev_id", 400)
+                try:
+                    if "since" in request.query:
+                        since = float(request.query["since"])
+                    elif "hours" in request.query:
+                        since = time.time() - float(request.query["hours"]) * 3600
+                    else:
+                        now = time.localtime()
+                        since = time.mktime((now.tm_year, now.tm_mon, now.tm_mday, 0, 0, 0, 0, 0, -1))
+                except ValueError:
+                    return _json_error("invalid since/hours", 400)
+
+                dev, mgr, mower_name, mowing_device = await _get_device_and_mgr(dev_id)
+                if not dev or not mgr or not mower_name or not mowing_device:
+                    return _json_error("device not ready", 404)
+                state_mgr = getattr(mgr.get_device_by_name(mower_name), "state_manager", None)
+                history = getattr(state_mgr, "position_history", None)
+                if history is None:
+                    return _json_error("position history not available", 503)
+                rtk = getattr(getattr(mowing_device, "location", None), "RTK", None)
+                if not rtk or getattr(rtk, "latitude", None) is None or getattr(rtk, "longitude", None) is None:
+                    return _json_error("RTK reference not available", 503)
+
+                geojson = history.geojson(rtk.latitude, rtk.longitude, since=since)
+                return web.Response(body=dumps(geojson), content_type="application/json")
+
             ### end of mapping
 
             # Movement dispatcher (optional – wire to your existing move handlers)
@@ -1174,24 +1393,64 @@ def start_webrtc_http(plugin):
                     return _json_error("no tokens (start first)", 404)
                 return web.json_response({"ok": True, **plugin._webrtc_tokens})
 
-            async def start_stream(request):
-                # Choose first enabled/configured device for this plugin
-                dev = None
-                for d in indigo.devices.iter("self"):
-                    if d.enabled and d.configured:
-                        dev = d
-                        break
-                if dev is None:
-                    return _json_error("no enabled/configured device found")
+            # --- Stream session cache ---
+            # {dev_id: {"tokens": {...}, "valid_until": epoch_s}}. Agora tokens stay valid across
+            # stop/start, so a cached bundle lets start_stream skip the re-login and both
+            # subscription round trips; only the join command has to be sent each time.
+            STREAM_TOKEN_TTL = 600.0     # used when the subscription does not report an expiry
+            STREAM_EXPIRY_MARGIN = 60.0  # treat tokens as stale this long before they expire
+            STREAM_JOIN_ACK_TIMEOUT = 3.0  # wait this long for the mower to acknowledge the join
+            STREAM_JOIN_DELAY = 1.2  # the old fixed post-join delay, when acks cannot be observed
+            _stream_cache = {}
+            _stream_warming = {}  # {dev_id: asyncio.Task} – single in-flight prewarm per device
+
+            def _stream_bundle(raw: dict) -> dict:
+                # Normalize keys (HA: appid/channelName/token/uid)
+                expire = raw.get("expire") or raw.get("expire_ts") or raw.get("expireTime") or 0
+                try:
+                    expire = int(expire or 0)
+                except Exception:
+                    expire = 0
+                return {
+                    "app_id": str(raw.get("app_id") or raw.get("appId") or raw.get("appid") or ""),
+                    "channel": str(raw.get("channel") or raw.get("channelName") or raw.get("ch") or ""),
+                    "token": str(raw.get("token") or raw.get("accessToken") or raw.get("agoraToken") or ""),
+                    "uid": str(raw.get("uid") or raw.get("userId") or raw.get("uidStr") or ""),
+                    "expire": expire,
+                }
+
+            def _bundle_complete(bundle: dict) -> bool:
+                return bool(bundle.get("app_id") and bundle.get("channel") and bundle.get("token"))
 
+            def _cached_stream_bundle(dev_id: int):
+                entry = _stream_cache.get(dev_id)
+                if entry and time.time() < entry["valid_until"]:
+                    return entry["tokens"]
+                _stream_cache.pop(dev_id, None)
+                return None
+
+            async def _fetch_stream_bundle(dev_id: int, device) -> dict:
+                stream_resp = await device.mammotion_http.get_stream_subscription(device.iot_id)
+                raw = stream_resp.data.to_dict() if getattr(stream_resp, "data", None) else {}
+                bundle = _stream_bundle(raw)
+                if _bundle_complete(bundle):
+                    now = time.time()
+                    valid_until = now + STREAM_TOKEN_TTL
+                    if bundle["expire"] > now:
+                        valid_until = min(valid_until, bundle["expire"] - STREAM_EXPIRY_MARGIN)
+                    _stream_cache[dev_id] = {"tokens": bundle, "valid_until": valid_until}
+                return bundle
+
+            def _stream_target(dev):
+                """Return (device, mower_name, account_id, error) for streaming from an Indigo device."""
                 mgr = getattr(plugin, "_mgr", {}).get(dev.id) if hasattr(plugin, "_mgr") else None
                 mower_name = getattr(plugin, "_mower_name", {}).get(dev.id) if hasattr(plugin, "_mower_name") else None
                 if not mgr or not mower_name:
-                    return _json_error("manager/mower not ready (wait for Connected)")
+                    return None, None, None, "manager/mower not ready (wait for Connected)"
 
                 device = mgr.get_device_by_name(mower_name)
                 if not device:
-                    return _json_error("internal: device wrapper missing")
+                    return None, None, None, "internal: device wrapper missing"
 
                 # Ensure userAccount (identity)
                 account_id = plugin._user_account_id.get(dev.id)
@@ -1206,19 +1465,75 @@ def start_webrtc_http(plugin):
                     except Exception:
                         pass
                 if account_id is None:
-                    return _json_error("userAccount not available yet")
+                    return None, None, None, "userAccount not available yet"
+                return device, mower_name, account_id, None
+
+            async def _warm_stream_session(dev) -> None:
+                """Refresh the cloud session and cache a token bundle before Play is pressed."""
+                if _cached_stream_bundle(dev.id):
+                    return
+                device, _, _, err = _stream_target(dev)
+                if err:
+                    plugin.logger.debug(f"Stream prewarm skipped for '{dev.name}': {err}")
+                    return
                 # Preflight: brief re-login to avoid 29003 on idle sessions (debounced inside plugin)
                 try:
                     await plugin._cloud_relogin_once(dev.id, min_interval=5.0)
                 except Exception:
                     pass
+                try:
+                    await _fetch_stream_bundle(dev.id, device)
+                except Exception as ex:
+                    plugin.logger.debug(f"Stream prewarm for '{dev.name}' failed: {ex}")
+
+            def _schedule_stream_warm(dev):
+                task = _stream_warming.get(dev.id)
+                if task is None or task.done():
+                    task = asyncio.create_task(_warm_stream_session(dev))
+                    _stream_warming[dev.id] = task
+                return task
+
+            async def _await_join_ack(dev, device, acks_seen) -> str | None:
+                """Wait for the mower's set_video_ack to the join; return an error message if it refused.
 
-                # Pre-refresh (parity with HA; ignored result)
+                Replaces the fixed post-join sleep. Without an ack in STREAM_JOIN_ACK_TIMEOUT (older
+                firmware, or the ack was lost) the stream is started anyway, as it used to be.
+                """
+                state_mgr = getattr(device, "state_manager", None)
+                if state_mgr is None or acks_seen is None:
+                    await asyncio.sleep(STREAM_JOIN_DELAY)
+                    return None
+                error = await state_mgr.wait_video_ack(acks_seen, timeout=STREAM_JOIN_ACK_TIMEOUT)
+                if error is None:
+                    plugin.logger.debug(f"No video join ack from '{dev.name}' in {STREAM_JOIN_ACK_TIMEOUT}s; continuing")
+                elif error.value != 0:
+                    return f"mower refused to start video: {error.name}"
+                return None
+
+            async def start_stream(request):
+                # Choose first enabled/configured device for this plugin
+                dev = None
+                for d in indigo.devices.iter("self"):
+                    if d.enabled and d.configured:
+                        dev = d
+                        break
+                if dev is None:
+                    return _json_error("no enabled/configured device found")
+
+                device, mower_name, account_id, err = _stream_target(dev)
+                if err:
+                    return _json_error(err)
+
+                # Reuse a prewarm already in flight (from opening the player page), or start one:
+                # it covers the re-login preflight and the pre-join subscription fetch.
                 try:
-                    _ = await device.mammotion_http.get_stream_subscription(device.iot_id)
+                    await _schedule_stream_warm(dev)
                 except Exception:
                     pass
 
+                # Acks counted before the join, so one that arrives before we start waiting still counts
+                acks_seen = getattr(getattr(device, "state_manager", None), "video_acks", None)
+
                 # Join (with one retry on 29003)
                 try:
                     from pymammotion.mammotion.commands.mammotion_command import MammotionCommand
@@ -1233,6 +1548,8 @@ def start_webrtc_http(plugin):
                         auth_err = False
 
                     if auth_err:
+                        # Tokens fetched under the rejected session are suspect
+                        _stream_cache.pop(dev.id, None)
                         try:
                             # Immediate re-login and short wait, then retry once
                             await plugin._cloud_relogin_once(dev.id, min_interval=0.0)
@@ -1247,36 +1564,28 @@ def start_webrtc_http(plugin):
                     else:
                         return _json_error(f"join failed: {ex}")
 
-                # Small delay, then fetch fresh subscription
-                try:
-                    await asyncio.sleep(1.2)
-                except Exception:
-                    pass
+                # The cloud accepted the join; wait for the mower itself to acknowledge it
+                refused = await _await_join_ack(dev, device, acks_seen)
+                if refused:
+                    return _json_error(refused)
 
+                # Fetch the subscription after the join, as before prewarming existed: nothing
+                # guarantees a token issued before the join is still honoured. The prewarmed
+                # bundle is only a fallback when this fetch fails or comes back incomplete.
+                cached = _cached_stream_bundle(dev.id)
                 try:
-                    stream_resp = await device.mammotion_http.get_stream_subscription(device.iot_id)
-                    raw = stream_resp.data.to_dict() if getattr(stream_resp, "data", None) else {}
+                    bundle = await _fetch_stream_bundle(dev.id, device)
                 except Exception as ex:
-                    return _json_error(f"token fetch failed: {ex}")
-
-                # Normalize keys (HA: appid/channelName/token/uid)
-                app_id  = raw.get("app_id") or raw.get("appId") or raw.get("appid") or ""
-                channel = raw.get("channel") or raw.get("channelName") or raw.get("ch") or ""
-                token   = raw.get("token") or raw.get("accessToken") or raw.get("agoraToken") or ""
-                uid     = raw.get("uid") or raw.get("userId") or raw.get("uidStr") or ""
-                expire  = raw.get("expire") or raw.get("expire_ts") or raw.get("expireTime") or 0
-                try:
-                    expire = int(expire or 0)
-                except Exception:
-                    expire = 0
-
-                plugin._webrtc_tokens = {
-                    "app_id": str(app_id),
-                    "channel": str(channel),
-                    "token": str(token),
-                    "uid": str(uid),
-                    "expire": expire,
-                }
+                    if cached is None:
+                        return _json_error(f"token fetch failed: {ex}")
+                    plugin.logger.debug(f"Stream token fetch failed, using the prewarmed bundle: {ex}")
+                    bundle = cached
+                if not _bundle_complete(bundle) and cached is not None:
+                    bundle = cached
+
+                app_id, channel, token = bundle["app_id"], bundle["channel"], bundle["token"]
+                uid, expire = bundle["uid"], bundle["expire"]
+                plugin._webrtc_tokens = dict(bundle)
                 plugin._webrtc_active_dev_id = dev.id
 
                 # Mirror states (human readable; safe)
@@ -1301,6 +1610,8 @@ def start_webrtc_http(plugin):
             async def stop_stream(request):
                 dev_id = plugin._webrtc_active_dev_id
                 if dev_id:
+                    # Tokens of a channel we left are not reused for the next join
+                    _stream_cache.pop(dev_id, None)
                     try:
                         dev = indigo.devices.get(dev_id)
                         mgr = getattr(plugin, "_mgr", {}).get(dev_id) if hasattr(plugin, "_mgr") else None
@@ -1355,9 +1666,153 @@ def start_webrtc_http(plugin):
                 return web.json_response({"ok": True})
 
             async def move_release(request):
-                # Implement a stop-all movement command here if your API requires it.
+                # Explicit stop so a released button never leaves the mower creeping
+                dev_id = plugin._webrtc_active_dev_id
+                if dev_id is None:
+                    return web.json_response({"ok": True})
+                try:
+                    await plugin._send_command(dev_id, "send_movement", linear_speed=0, angular_speed=0)
+                except Exception as ex:
+                    return _json_error(f"stop failed: {ex}", 500)
                 return web.json_response({"ok": True})
 
+            # --- Joystick control channel (WebSocket) ---
+            # The browser streams {"x": -1..1, "y": -1..1} vectors (x = turn right, y = forward).
+            # Only the latest vector is kept. Movement commands share the account's command queue
+            # and invoke rate limit with everything else, so a new speed pair is sent when it
+            # changes (at most every CONTROL_INTERVAL) and an unchanged one is only repeated as a
+            # keep-alive at the limiter's sustained rate. A single stop is sent when the stick
+            # returns to zero, goes stale, or the socket closes.
+            from pymammotion.aliyun.cloud_gateway import INVOKE_RATE
+
+            CONTROL_INTERVAL = 0.2                 # minimum gap between movement commands
+            CONTROL_KEEPALIVE = 1.0 / INVOKE_RATE  # repeat an unchanged vector this often
+            CONTROL_STALE = 1.0      # treat the stick as released if the client goes quiet this long
+            CONTROL_DEADBAND = 0.09
+
+            def _joystick_speeds(x: float, y: float) -> tuple:
+                """Map a stick vector to (linear_speed, angular_speed) the way JoystickControl does."""
+                from pymammotion.utility.movement import get_percent, transform_both_speeds
+
+                linear_angle = linear_percent = angular_angle = angular_percent = 0.0
+                if abs(y) > CONTROL_DEADBAND:
+                    linear_angle = 90.0 if y > 0 else 270.0
+                    linear_percent = get_percent(abs(y) * 100)
+                if abs(x) > CONTROL_DEADBAND:
+                    angular_angle = 0.0 if x > 0 else 180.0
+                    angular_percent = get_percent(abs(x) * 100)
+                if linear_percent == 0.0 and angular_percent == 0.0:
+                    return 0, 0
+                speeds = transform_both_speeds(linear_angle, angular_angle, linear_percent, angular_percent)
+                return speeds if speeds else (0, 0)
+
+            async def control_ws(request):
+                ws = web.WebSocketResponse(heartbeat=10.0)
+                await ws.prepare(request)
+
+                dev = _pick_dev()
+                mgr = getattr(plugin, "_mgr", {}).get(dev.id) if dev else None
+                mower_name = getattr(plugin, "_mower_name", {}).get(dev.id) if dev else None
+                if not mgr or not mower_name:
+                    await ws.send_json({"ok": False, "error": "manager/mower not ready"})
+                    await ws.close()
+                    return ws
+
+                latest = {"x": 0.0, "y": 0.0, "at": 0.0}
+                wake = asyncio.Event()
+                closing = False
+
+                async def _move(linear_speed, angular_speed):
+                    try:
+                        await mgr.send_command_with_args(
+                            mower_name, "send_movement", linear_speed=linear_speed, angular_speed=angular_speed
+                        )
+                    except Exception as ex:
+                        plugin.logger.debug(f"Joystick: send_movement failed for '{dev.name}': {ex}")
+                        is_auth = getattr(plugin, "_is_auth_error", None)
+                        if is_auth and is_auth(ex):
+                            asyncio.create_task(plugin._cloud_relogin_once(dev.id))
+
+                async def _stop_now():
+                    # Published directly rather than queued, so the stop does not wait behind
+                    # polls already in the command queue; falls back to the queue without a cloud link
+                    try:
+                        account_id = plugin._user_account_id.get(dev.id)
+                        device = mgr.get_device_by_name(mower_name)
+                        if account_id and device and getattr(device, "cloud_client", None):
+                            from pymammotion.mammotion.commands.mammotion_command import MammotionCommand
+                            cmd = MammotionCommand(mower_name, int(account_id)).send_movement(linear_speed=0, angular_speed=0)
+                            await device.cloud_client.send_cloud_command(device.iot_id, cmd)
+                            return
+                    except Exception as ex:
+                        plugin.logger.debug(f"Joystick: direct stop failed for '{dev.name}': {ex}")
+                    await _move(0, 0)
+
+                async def _drive():
+                    sent = (0, 0)
+                    last_send = 0.0
+                    while not closing:
+                        if sent == (0, 0):
+                            await wake.wait()
+                        else:
+                            # Wake early for a new vector, otherwise repeat the current one as a keep-alive
+                            try:
+                                await asyncio.wait_for(
+                                    wake.wait(), timeout=max(0.0, last_send + CONTROL_KEEPALIVE - time.monotonic())
+                                )
+                            except asyncio.TimeoutError:
+                                pass
+                        wake.clear()
+                        if closing:
+                            break
+                        stale = time.monotonic() - latest["at"] > CONTROL_STALE
+                        speeds = (0, 0) if stale else tuple(_joystick_speeds(latest["x"], latest["y"]))
+                        now = time.monotonic()
+                        if speeds == (0, 0):
+                            if sent != (0, 0):
+                                await _move(0, 0)
+                                sent, last_send = (0, 0), now
+                            continue
+                        if speeds == sent and now - last_send < CONTROL_KEEPALIVE:
+                            continue
+                        if now - last_send < CONTROL_INTERVAL:
+                            # Coalesce rapid stick changes: the latest vector goes out once the gap has passed
+                            await asyncio.sleep(last_send + CONTROL_INTERVAL - now)
+                            wake.set()
+                            continue
+                        await _move(*speeds)
+                        sent, last_send = speeds, time.monotonic()
+
+                async def _release():
+                    nonlocal closing
+                    # Let the driver finish any send in flight instead of cancelling it mid-queue,
+                    # then stop: nothing of ours is left queued behind the stop
+                    closing = True
+                    wake.set()
+                    await driver
+                    await _stop_now()
+
+                driver = asyncio.create_task(_drive())
+                plugin.logger.debug(f"Joystick channel opened for '{dev.name}'")
+                try:
+                    async for msg in ws:
+                        if msg.type != web.WSMsgType.TEXT:
+                            continue
+                        try:
+                            data = json.loads(msg.data)
+                            x = max(-1.0, min(1.0, float(data.get("x") or 0.0)))
+                            y = max(-1.0, min(1.0, float(data.get("y") or 0.0)))
+                        except Exception:
+                            continue
+                        latest.update(x=x, y=y, at=time.monotonic())
+                        wake.set()
+                finally:
+                    # Channel released or dropped: always leave the mower stopped, even if this
+                    # handler is cancelled while waiting
+                    await asyncio.shield(_release())
+                    plugin.logger.debug(f"Joystick channel closed for '{dev.name}'")
+                return ws
+
             def _pick_dev():
                 """
                 Choose the active Indigo Mammotion device:
@@ -1411,7 +1866,13 @@ def start_webrtc_http(plugin):
                         try:
                             plugin.logger.debug(f"Dock: pre-step {cmd} for '{dev.name}'")
                             await plugin._send_command(dev.id, cmd)
-                            await asyncio.sleep(0.25)
+                            # Dock right away unless the mower is still reporting WORKING
+                            sm = plugin._state_manager(dev.id)
+                            if sm is not None:
+                                from pymammotion.utility.constant.device_constant import WorkMode
+                                await sm.wait_until(
+                                    lambda d: d.report_data.dev.sys_status != WorkMode.MODE_WORKING, timeout=0.25
+                                )
                             break
                         except Exception as ex:
                             pre_cmd_errors.append(str(ex))
@@ -1428,6 +1889,13 @@ def start_webrtc_http(plugin):
                     return web.json_response({"ok": False, "error": str(ex)}, status=500)
 
             async def player(request):
+                    # Prewarm the stream session while the page and the Agora SDK load
+                    try:
+                        warm_dev = _pick_dev()
+                        if warm_dev:
+                            _schedule_stream_warm(warm_dev)
+                    except Exception as ex:
+                        plugin.logger.debug(f"Stream prewarm not scheduled: {ex}")
                     html = '''<!doctype html>
             <html>
             <head>
@@ -1767,13 +2235,59 @@ def start_webrtc_http(plugin):
               }
             }
 
-            let continuousMap={}; // dir -> interval id
+            let continuousMap={}; // dir -> safety timeout id (HTTP fallback: interval id)
+            let controlWs=null;    // WebSocket joystick channel (/webrtc/control)
+            let controlTimer=null; // keep-alive resend of the held vector
+
+            function openControl(){
+              if(controlWs && controlWs.readyState<=1) return controlWs;
+              try{
+                controlWs=new WebSocket((location.protocol==='https:'?'wss://':'ws://')+location.host+'/webrtc/control');
+                controlWs.onopen=()=>sendVector();
+                controlWs.onclose=()=>{controlWs=null;};
+              }catch(e){
+                controlWs=null;
+              }
+              return controlWs;
+            }
+
+            function controlReady(){
+              return controlWs && controlWs.readyState===1;
+            }
+
+            function heldVector(){
+              let x=0,y=0;
+              Object.keys(continuousMap).forEach(dir=>{
+                if(dir==='up') y+=movementSpeed;
+                if(dir==='down') y-=movementSpeed;
+                if(dir==='right') x+=movementSpeed;
+                if(dir==='left') x-=movementSpeed;
+              });
+              return {x:x,y:y};
+            }
+
+            function sendVector(){
+              if(controlReady()) controlWs.send(JSON.stringify(heldVector()));
+            }
+
+            function syncControlTimer(){
+              const held=Object.keys(continuousMap).length>0;
+              if(held && !controlTimer){
+                controlTimer=setInterval(sendVector,200);
+              }else if(!held && controlTimer){
+                clearInterval(controlTimer);
+                controlTimer=null;
+              }
+            }
 
             function stopContinuousAll(){
               Object.keys(continuousMap).forEach(dir=>{
                 clearInterval(continuousMap[dir]);
+                clearTimeout(continuousMap[dir]);
                 delete continuousMap[dir];
               });
+              syncControlTimer();
+              sendVector();
               fetch('/webrtc/move_release',{method:'POST'});
             }
 
@@ -1789,6 +2303,14 @@ def start_webrtc_http(plugin):
 
             function startContinuous(dir, speed){
               if(continuousMap[dir]) return;
+              openControl();
+              if(controlReady() || (controlWs && controlWs.readyState===0)){
+                // Stream over the control channel; safety auto-stop after 10s
+                continuousMap[dir]=setTimeout(()=>endContinuous(dir),10000);
+                syncControlTimer();
+                sendVector();
+                return;
+              }
               fetch('/webrtc/move_hold',{
                 method:'POST',
                 headers:{'Content-Type':'application/json'},
@@ -1802,8 +2324,14 @@ def start_webrtc_http(plugin):
             function endContinuous(dir){
               if(continuousMap[dir]){
                 clearInterval(continuousMap[dir]);
+                clearTimeout(continuousMap[dir]);
                 delete continuousMap[dir];
-                fetch('/webrtc/move_release',{method:'POST'});
+                syncControlTimer();
+                if(controlReady()){
+                  sendVector();
+                }else{
+                  fetch('/webrtc/move_release',{method:'POST'});
+                }
               }
             }
 
@@ -1886,6 +2414,13 @@ def start_webrtc_http(plugin):
                     from aiohttp import web
                     return web.Response(text=html, content_type="text/html")
 
+            async def metrics(request: web.Request) -> web.Response:
+                """Prometheus text: library counters plus the plugin's state snapshots."""
+                import plugin_metrics
+
+                text = plugin_metrics.render(plugin)
+                return web.Response(body=text.encode("utf-8"), headers={"Content-Type": plugin_metrics.CONTENT_TYPE})
+
             app = web.Application()
             app.router.add_post("/webrtc/start", start_stream)
             app.router.add_post("/webrtc/stop", stop_stream)
@@ -1894,10 +2429,14 @@ def start_webrtc_http(plugin):
             app.router.add_post("/webrtc/move", move_once)
             app.router.add_post("/webrtc/move_hold", move_hold)
             app.router.add_post("/webrtc/move_release", move_release)
+            app.router.add_get("/webrtc/control", control_ws)
             app.router.add_post("/webrtc/dock", dock_now)  # NEW
             app.router.add_get("/map/{dev_id}", map_page)
             app.router.add_get("/map/{dev_id}/geojson", map_geojson)
             app.router.add_get("/map/{dev_id}/mowpath", map_mowpath)
+            app.router.add_get("/map/{dev_id}/live", map_live)
+            app.router.add_get("/map/{dev_id}/track", map_track)
+            app.router.add_get("/metrics", metrics)
 
             runner = web.AppRunner(app)
             await runner.setup()
@@ -0,0 +1,167 @@
+"""Check that ``encode_luba_msg`` produces the bytes betterproto2 would.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/command_encoding_check.py
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/command_encoding_check.py --verbose
+
+Two sweeps, each comparing against ``LubaMsg(...).SerializeToString()``:
+
+``commands``
+    Every parameterless ``MammotionCommand`` method plus the common
+    parameterised polls, for several device types and user accounts
+    (including 0 and negative), with ``seqs`` run past its 255 wrap-around.
+    Each command is sent twice, so payloads served from ``static_payload``
+    are covered on the cached path too. Every output is decoded and
+    re-serialized by betterproto2; the bytes must be identical.
+``envelope``
+    ``encode_luba_msg`` called directly for each sub-message field (net, sys,
+    nav, driver) with the payloads the command sweep produced, plus an empty
+    one and one longer than 127 bytes (two-byte length prefix), over seqs
+    either side of the varint and wrap-around boundaries, the same accounts,
+    both receivers and zero and current timestamps.
+
+Exits with status 1 if any payload differs.
+"""
+
+import argparse
+import inspect
+
+import betterproto2
+
+from pymammotion.mammotion.commands.abstract_message import AbstractMessage
+from pymammotion.mammotion.commands.encoder import DRIVER, NAV, NET, SYS, encode_luba_msg
+from pymammotion.mammotion.commands.mammotion_command import MammotionCommand
+from pymammotion.proto import DevNet, LubaMsg, MctlDriver, MctlNav, MctlSys, MsgAttr, MsgDevice, RptAct, RptInfoType
+
+DEVICE_NAMES = ("Luba-VSLKJX3B", "Luba-8UVEWL7Y", "Yuka-MN6LCKR2", "Luba-LD1QZXWV")
+USER_ACCOUNTS = (0, 1, 123456789, 2**31 - 1, -1, -123456)
+SEQS = (0, 1, 127, 128, 200, 255)
+TIMESTAMPS = (0, 1, 1_700_000_000_000)
+
+# encoder field number -> (LubaMsg oneof attribute, sub-message class)
+SUB_FIELDS = {NET: ("net", DevNet), SYS: ("sys", MctlSys), NAV: ("nav", MctlNav), DRIVER: ("driver", MctlDriver)}
+
+# Parameterised commands the plugin and library send routinely: (method, args)
+PARAMETERISED = (
+    ("request_iot_sys", (RptAct.RPT_START, [RptInfoType.RIT_DEV_STA, RptInfoType.RIT_RTK], 10000, 1000, 2000, 1)),
+    ("request_iot_sys", (RptAct.RPT_STOP, None, 0, 0, 0, 0)),
+    ("allpowerfull_rw", (6, 1, 1)),
+    ("allpowerfull_rw_adapter_x3", (7, 0, 0)),
+    ("read_write_device", (6, 1, 1)),
+    ("read_plan", (2, 0)),
+    ("read_plan_unable_time", (1,)),
+    ("get_all_boundary_hash_list", (3,)),
+    ("get_hash_response", (2, 1)),
+    ("synchronize_hash_data", (1234567890123456789,)),
+    ("get_area_name_list", ("iot-1",)),
+    ("get_line_info", (987654321,)),
+    ("get_line_info_list", ([1, 2, 3], 7)),
+    ("get_line_info_list", (list(range(1_000_000_000, 1_000_000_040)), 7)),
+    ("request_job_history", (5,)),
+    ("set_blade_height", (60,)),
+    ("set_blade_control", (1,)),
+    ("set_speed", (0.5,)),
+    ("set_cutter_mode", (1,)),
+    ("send_movement", (100, -50)),
+    ("traverse_mode", (1,)),
+    ("turning_mode", (0,)),
+    ("set_data_synchronization", (2,)),
+    ("send_todev_ble_sync", (3,)),
+)
+
+
+def _parameterless() -> list[str]:
+    names = []
+    for name, member in inspect.getmembers(MammotionCommand, inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        params = list(inspect.signature(member).parameters.values())[1:]
+        if all(param.default is not param.empty for param in params):
+            names.append(name)
+    return names
+
+
+def _command_sweep(verbose: bool) -> tuple[int, list[str], dict[int, set[bytes]]]:
+    """Round-trip every command through betterproto2; return payloads seen per sub-field."""
+    checked, failures = 0, []
+    payloads: dict[int, set[bytes]] = {field: set() for field in SUB_FIELDS}
+    fields_by_attribute = {attribute: field for field, (attribute, _) in SUB_FIELDS.items()}
+    calls = [(name, ()) for name in _parameterless()] + list(PARAMETERISED)
+    skipped: set[str] = set()
+    for device_name in DEVICE_NAMES:
+        for account in USER_ACCOUNTS:
+            command = MammotionCommand(device_name, account)
+            AbstractMessage.seqs.set(250)  # wrap past 255 within every device/account run
+            for name, args in calls:
+                for _ in range(2):
+                    try:
+                        out = getattr(command, name)(*args)
+                    except Exception as ex:
+                        skipped.add(f"{name}: {type(ex).__name__}")
+                        break
+                    if not isinstance(out, bytes):
+                        break  # accessors such as get_device_name
+                    checked += 1
+                    message = LubaMsg.parse(out)
+                    if message.SerializeToString() != out:
+                        failures.append(f"{name}{args} on {device_name}/{account}: {out.hex()}")
+                    attribute = betterproto2.which_one_of(message, "LubaSubMsg")[0]
+                    if attribute in fields_by_attribute:
+                        payloads[fields_by_attribute[attribute]].add(bytes(getattr(message, attribute)))
+    if verbose and skipped:
+        print(f"  skipped: {', '.join(sorted(skipped))}")
+    return checked, failures, payloads
+
+
+def _envelope_sweep(payloads: dict[int, set[bytes]]) -> tuple[int, list[str]]:
+    checked, failures = 0, []
+    for sub_field, (attribute, message_class) in SUB_FIELDS.items():
+        samples = sorted(payloads[sub_field], key=len)
+        samples = {b"", *samples[:2], *samples[-2:]}  # empty, shortest and longest real payloads
+        for payload in samples:
+            sub_message = message_class.parse(payload)
+            for rcver in (MsgDevice.DEV_MAINCTL, MsgDevice.DEV_NAVIGATION):
+                for seqs in SEQS:
+                    for account in USER_ACCOUNTS:
+                        for timestamp in TIMESTAMPS:
+                            envelope = {
+                                "msgtype": 0xF0 if sub_field == NAV else 0xF1,
+                                "sender": MsgDevice.DEV_MOBILEAPP,
+                                "rcver": rcver,
+                                "msgattr": MsgAttr.REQ,
+                                "seqs": seqs,
+                                "version": 1,
+                                "subtype": account,
+                                "timestamp": timestamp,
+                            }
+                            ours = encode_luba_msg(**envelope, sub_field=sub_field, payload=payload)
+                            theirs = LubaMsg(**envelope, **{attribute: sub_message}).SerializeToString()
+                            checked += 1
+                            if ours != theirs:
+                                failures.append(f"{attribute} {envelope} payload {payload.hex()}: {ours.hex()}")
+    return checked, failures
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run both sweeps and exit non-zero on any difference."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbose", action="store_true", help="list commands that could not be built")
+    args = parser.parse_args(argv)
+
+    checked, failures, payloads = _command_sweep(args.verbose)
+    longest = max(len(payload) for sample in payloads.values() for payload in sample)
+    print(f"commands: {checked} payloads, {len(failures)} differ")
+    envelope_checked, envelope_failures = _envelope_sweep(payloads)
+    print(f"envelope: {envelope_checked} payloads (sub-messages up to {longest} bytes), "
+          f"{len(envelope_failures)} differ")
+    failures += envelope_failures
+    for failure in failures[:20]:
+        print(f"FAIL {failure}")
+    if failures:
+        raise SystemExit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
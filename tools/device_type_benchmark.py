@@ -0,0 +1,226 @@
+"""Measure device-type classification: lookups per second through ``DeviceType``.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/device_type_benchmark.py
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/device_type_benchmark.py --calls 500000
+
+Each scenario classifies a rotating set of real-looking device names and
+product keys. ``legacy`` is the previous implementation (the if/elif chain,
+re-run by every helper, several times by ``is_yuka``); ``rules`` is the
+current rule table with the cache bypassed; ``cached`` is ``DeviceType`` as
+shipped. Before timing, every helper is checked to give the same answer as
+the legacy one for every name; a mismatch exits with status 1.
+"""
+
+import argparse
+from collections.abc import Callable
+import time
+
+from pymammotion.utility.device_type import (
+    DeviceType,
+    LubaProductKey,
+    LubaVProductKey,
+    RTKProductKey,
+    _RTK_TYPES,
+    _YUKA_TYPES,
+    _value_of_str,
+)
+
+
+def _legacy_value_of_str(device_name: str, product_key: str = "") -> DeviceType:
+    """The previous ``DeviceType.value_of_str``, kept here as the baseline."""
+    if not device_name and not product_key:
+        return DeviceType.UNKNOWN
+
+    try:
+        substring = device_name[:3]
+        substring2 = device_name[:7]
+
+        if DeviceType.RTK.get_name() in substring or product_key in RTKProductKey:
+            return DeviceType.RTK
+        elif DeviceType.LUBA_2.get_name() in substring2 or product_key in LubaVProductKey:
+            return DeviceType.LUBA_2
+        elif DeviceType.LUBA_LD.get_name() in substring2:
+            return DeviceType.LUBA_LD
+        elif DeviceType.LUBA_VP.get_name() in substring2:
+            return DeviceType.LUBA_VP
+        elif DeviceType.LUBA_MN.get_name() in substring2:
+            return DeviceType.LUBA_MN
+        elif DeviceType.YUKA_VP.get_name() in substring2:
+            return DeviceType.YUKA_VP
+        elif DeviceType.YUKA_MINI.get_name() in substring2:
+            return DeviceType.YUKA_MINI
+        elif DeviceType.YUKA_MINI2.get_name() in substring2:
+            return DeviceType.YUKA_MINI2
+        elif DeviceType.LUBA_YUKA.get_name() in substring2:
+            return DeviceType.LUBA_YUKA
+        elif DeviceType.LUBA.get_name() in substring2 or product_key in LubaProductKey:
+            return DeviceType.LUBA
+        elif DeviceType.SPINO.get_name() in substring2:
+            return DeviceType.SPINO
+        elif DeviceType.RTK3A1.get_name() in substring2:
+            return DeviceType.RTK3A1
+        elif DeviceType.RTK3A0.get_name() in substring2:
+            return DeviceType.RTK3A0
+        elif DeviceType.RTK3A2.get_name() in substring2:
+            return DeviceType.RTK3A2
+        elif DeviceType.YUKA_MINIV.get_name() in substring2:
+            return DeviceType.YUKA_MINIV
+        elif DeviceType.LUBA_VA.get_name() in substring2:
+            return DeviceType.LUBA_VA
+        elif DeviceType.YUKA_ML.get_name() in substring2:
+            return DeviceType.YUKA_ML
+        elif DeviceType.LUBA_MD.get_name() in substring2:
+            return DeviceType.LUBA_MD
+        elif DeviceType.LUBA_LA.get_name() in substring2:
+            return DeviceType.LUBA_LA
+        elif DeviceType.SWIMMINGPOOL_S1.get_name() in substring2:
+            return DeviceType.SWIMMINGPOOL_S1
+        elif DeviceType.SWIMMINGPOOL_E1.get_name() in substring2:
+            return DeviceType.SWIMMINGPOOL_E1
+        elif DeviceType.YUKA_MN100.get_name() in substring2:
+            return DeviceType.YUKA_MN100
+        elif DeviceType.RTKNB.get_name() in substring2:
+            return DeviceType.RTKNB
+        elif DeviceType.LUBA_MB.get_name() in substring2:
+            return DeviceType.LUBA_MB
+        elif DeviceType.CM900.get_name() in substring2:
+            return DeviceType.CM900
+        else:
+            return DeviceType.UNKNOWN
+    except Exception:
+        return DeviceType.UNKNOWN
+
+
+def _legacy_is_rtk(device_name: str, product_key: str = "") -> bool:
+    device_type = _legacy_value_of_str(device_name, product_key)
+    return (
+        DeviceType.RTK.get_value() == device_type.get_value()
+        or DeviceType.RTK3A0.get_value() == device_type.get_value()
+        or DeviceType.RTK3A1.get_value() == device_type.get_value()
+        or DeviceType.RTK3A2.get_value() == device_type.get_value()
+        or DeviceType.RTKNB.get_value() == device_type.get_value()
+    )
+
+
+def _legacy_is_luba_pro(device_name: str, product_key: str = "") -> bool:
+    device_type = _legacy_value_of_str(device_name, product_key)
+    return (
+        device_type.get_value() >= DeviceType.LUBA_2.get_value()
+        and device_type.get_value() != DeviceType.SPINO.get_value()
+        and not _legacy_is_rtk(device_name, product_key)
+    )
+
+
+# The types the old is_yuka compared against, in its order
+_YUKA_ORDER = (
+    DeviceType.LUBA_YUKA,
+    DeviceType.YUKA_VP,
+    DeviceType.YUKA_MINI,
+    DeviceType.YUKA_MINI2,
+    DeviceType.YUKA_MINIV,
+    DeviceType.YUKA_ML,
+    DeviceType.YUKA_MN100,
+)
+
+
+def _legacy_is_yuka(device_name: str) -> bool:
+    # The old helper re-resolved the name once per compared type, stopping at the first match
+    return any(_legacy_value_of_str(device_name).get_value() == t.get_value() for t in _YUKA_ORDER)
+
+
+# (device name, product key) as they arrive in MQTT topics and device lists
+DEVICES = (
+    ("Luba-VSLKJX3B", "a1iMygIwxFC"),
+    ("Luba-VA5ECAUH", "a1Ce85210Be"),
+    ("Luba-MNGZ3CNH", ""),
+    ("Luba-LD1QZXWV", ""),
+    ("Luba-8UVEWL7Y", "a1UBFdq6nNz"),
+    ("Yuka-MN6LCKR2", "a1BqmEWMRbX"),
+    ("Yuka-YMQ4SN8E", ""),
+    ("Yuka-VPT3KYY6", ""),
+    ("Yuka-MLYW7BS4", ""),
+    ("Yuka-RN4KJ8MQ", ""),
+    ("RTK3A1XRTKTE", ""),
+    ("RTKNB5Q7ZLQ2", "a1NfZqdSREf"),
+    ("RTK9W4HHQ2C", "a1qXkZ5P39W"),
+    ("Spino-8PTXT1", ""),
+    ("CM900UBXC3QA", "zkRuTK9KsXG"),
+    ("", "a1UBFdq6nNz"),
+    ("unknown", ""),
+)
+
+# scenario -> (legacy, rules, cached); each takes one (name, product key) pair
+_uncached = _value_of_str.__wrapped__
+SCENARIOS: dict[str, tuple[Callable, Callable, Callable]] = {
+    "value_of_str": (
+        lambda n, k: _legacy_value_of_str(n, k),
+        lambda n, k: _uncached(n, k),
+        lambda n, k: DeviceType.value_of_str(n, k),
+    ),
+    "is_luba_pro": (
+        lambda n, k: _legacy_is_luba_pro(n, k),
+        lambda n, k: (t := _uncached(n, k)).get_value() >= 2 and t is not DeviceType.SPINO and t not in _RTK_TYPES,
+        lambda n, k: DeviceType.is_luba_pro(n, k),
+    ),
+    "is_yuka": (
+        lambda n, k: _legacy_is_yuka(n),
+        lambda n, k: _uncached(n, "") in _YUKA_TYPES,
+        lambda n, k: DeviceType.is_yuka(n),
+    ),
+    # What one command + one state refresh used to cost per message
+    "per message": (
+        lambda n, k: (_legacy_is_luba_pro(n, k), _legacy_is_yuka(n), _legacy_is_rtk(n, k)),
+        lambda n, k: (
+            (t := _uncached(n, k)).get_value() >= 2 and t is not DeviceType.SPINO and t not in _RTK_TYPES,
+            _uncached(n, "") in _YUKA_TYPES,
+            t in _RTK_TYPES,
+        ),
+        lambda n, k: (DeviceType.is_luba_pro(n, k), DeviceType.is_yuka(n), DeviceType.is_rtk(n, k)),
+    ),
+}
+
+
+def _check() -> list[str]:
+    mismatches = []
+    for name, key in DEVICES:
+        for scenario, implementations in SCENARIOS.items():
+            results = [implementation(name, key) for implementation in implementations]
+            if len(set(results)) != 1:
+                mismatches.append(f"{scenario}({name!r}, {key!r}): legacy/rules/cached = {results}")
+    return mismatches
+
+
+def _rate(function: Callable, calls: int) -> float:
+    devices = DEVICES * (calls // len(DEVICES) + 1)
+    start = time.perf_counter()
+    for name, key in devices[:calls]:
+        function(name, key)
+    return calls / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Check legacy/current agreement, then print lookups/s per scenario."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    mismatches = _check()
+    for mismatch in mismatches:
+        print(f"MISMATCH {mismatch}")
+    if mismatches:
+        raise SystemExit(1)
+
+    print(f"{len(DEVICES)} devices, {args.calls} calls per scenario, calls/s")
+    print(f"  {'scenario':<14} {'legacy':>12} {'rules':>12} {'cached':>12} {'speed-up':>9}")
+    for scenario, (legacy, rules, cached) in SCENARIOS.items():
+        legacy_rate, rules_rate, cached_rate = (_rate(f, args.calls) for f in (legacy, rules, cached))
+        print(
+            f"  {scenario:<14} {legacy_rate:12,.0f} {rules_rate:12,.0f} {cached_rate:12,.0f} "
+            f"{cached_rate / legacy_rate:8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
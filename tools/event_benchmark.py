@@ -0,0 +1,111 @@
+"""Measure event dispatch: events per second through ``DataEvent.data_event``.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/event_benchmark.py
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/event_benchmark.py --events 500000
+
+Each scenario subscribes bound methods, the way the state manager and the
+plugin do, and fires one notification-sized tuple per event. ``legacy`` is the
+previous ``Event`` (rebuild the handler list and ``gather`` on every fire); it
+cannot dispatch to synchronous handlers, so those rows show n/a.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import time
+from types import MethodType
+from typing import Any
+import weakref
+
+from pymammotion.event.event import DataEvent
+
+
+class _LegacyEvent:
+    """The previous ``Event`` implementation, kept here as the baseline."""
+
+    def __init__(self) -> None:
+        self.handlers: list[weakref.ReferenceType] = []
+
+    def __iadd__(self, handler: Callable) -> "_LegacyEvent":
+        self.handlers.append(weakref.WeakMethod(handler) if isinstance(handler, MethodType) else weakref.ref(handler))
+        return self
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        live_handlers = []
+        for ref in self.handlers:
+            func = ref()
+            if func is not None:
+                live_handlers.append(func(*args, **kwargs))
+        await asyncio.gather(*live_handlers)
+        self.handlers = [ref for ref in self.handlers if ref() is not None]
+
+
+class _LegacyDataEvent:
+    def __init__(self) -> None:
+        self.on_data_event = _LegacyEvent()
+
+    async def data_event(self, data: Any) -> None:
+        if data:
+            await self.on_data_event(data)
+        else:
+            await self.on_data_event()
+
+    def add_subscribers(self, obj_method: Callable) -> None:
+        self.on_data_event += obj_method
+
+
+class _Subscriber:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def on_sync(self, res: Any) -> None:
+        self.count += 1
+
+    async def on_async(self, res: Any) -> None:
+        self.count += 1
+
+
+SCENARIOS = {
+    "1 sync": ("on_sync",),
+    "1 async": ("on_async",),
+    "3 async": ("on_async", "on_async", "on_async"),
+    "1 sync + 2 async": ("on_sync", "on_async", "on_async"),
+}
+
+
+async def _rate(event: Any, handlers: tuple[str, ...], events: int) -> float | None:
+    if isinstance(event, _LegacyDataEvent) and "on_sync" in handlers:
+        return None  # gather() rejects the None a sync handler returns
+    subscribers = [_Subscriber() for _ in handlers]
+    for subscriber, name in zip(subscribers, handlers):
+        event.add_subscribers(getattr(subscriber, name))
+    res = ("sys", object())
+    start = time.perf_counter()
+    for _ in range(events):
+        await event.data_event(res)
+    return events / (time.perf_counter() - start)
+
+
+async def _run(events: int) -> None:
+    print(f"{events} events per scenario, events/s")
+    print(f"  {'handlers':<18} {'legacy':>12} {'current':>12} {'speed-up':>9}")
+    for label, handlers in SCENARIOS.items():
+        legacy = await _rate(_LegacyDataEvent(), handlers, events)
+        current = await _rate(DataEvent(), handlers, events)
+        legacy_text = f"{legacy:12,.0f}" if legacy else f"{'n/a':>12}"
+        ratio = f"{current / legacy:8.1f}x" if legacy else f"{'':>9}"
+        print(f"  {label:<18} {legacy_text} {current:12,.0f} {ratio}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print events/s for the legacy and current dispatch per handler mix."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args(argv)
+    asyncio.run(_run(args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Measure GeoJSON response encoding: serialization time and compressed size.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/geojson_benchmark.py
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/geojson_benchmark.py --areas 60 --vertices 2000 --paths 400 --runs 9
+
+The fixture is a synthetic map shaped like ``GeojsonGenerator`` output (area and
+obstacle polygons plus mowing-path line strings, with full-precision lon/lat),
+so the numbers reflect the coordinate-heavy documents the map endpoints serve.
+The report compares stdlib ``json`` against ``orjson``, the gzip/brotli sizes and
+compression times, and the cost of a cached response.
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import time
+from typing import Any
+
+from pymammotion.utility.compressed_json import EncodedBodyCache, compress, dumps, supported_encodings
+
+RTK_LAT = 52.3702
+RTK_LON = 4.8952
+
+
+def _lonlat(x: float, y: float) -> list[float]:
+    return [RTK_LON + x / (111111.0 * math.cos(math.radians(RTK_LAT))), RTK_LAT + y / 111111.0]
+
+
+def fixture_map(areas: int, vertices: int, paths: int, seed: int = 1) -> dict[str, Any]:
+    """Return a FeatureCollection with ``areas`` polygons and ``paths`` line strings."""
+    rng = random.Random(seed)
+    features: list[dict[str, Any]] = []
+    for index in range(areas):
+        cx, cy, radius = rng.uniform(-200, 200), rng.uniform(-200, 200), rng.uniform(5, 40)
+        ring = [
+            _lonlat(
+                cx + radius * (1 + 0.1 * rng.random()) * math.cos(2 * math.pi * i / vertices),
+                cy + radius * (1 + 0.1 * rng.random()) * math.sin(2 * math.pi * i / vertices),
+            )
+            for i in range(vertices)
+        ]
+        ring.append(ring[0])
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [ring]},
+                "properties": {"type_name": "area", "hash": rng.getrandbits(63), "title": f"area {index}"},
+            }
+        )
+    for _ in range(paths):
+        x, y = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        line = []
+        for _ in range(vertices // 4):
+            x, y = x + rng.uniform(-0.3, 0.3), y + rng.uniform(-0.3, 0.3)
+            line.append(_lonlat(x, y))
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": line},
+                "properties": {"type_name": "path", "color": "#00ff00"},
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _median_ms(func: Any, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print size and timing for each way of encoding the fixture map."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--areas", type=int, default=40)
+    parser.add_argument("--vertices", type=int, default=1500, help="vertices per area (paths get a quarter)")
+    parser.add_argument("--paths", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=5, help="repetitions per measurement (median is reported)")
+    args = parser.parse_args(argv)
+
+    geo = fixture_map(args.areas, args.vertices, args.paths)
+    stdlib_body = json.dumps(geo).encode()
+    body = dumps(geo)
+    print(f"fixture: {len(geo['features'])} features, {len(body) / 1e6:.2f} MB as JSON")
+    stdlib_ms = _median_ms(lambda: json.dumps(geo).encode(), args.runs)
+    print(f"  json.dumps     {stdlib_ms:8.1f} ms  {len(stdlib_body):>10} B")
+    print(f"  orjson         {_median_ms(lambda: dumps(geo), args.runs):8.1f} ms  {len(body):>10} B")
+    for encoding in supported_encodings():
+        encoded = compress(body, encoding)
+        ms = _median_ms(lambda encoding=encoding: compress(body, encoding), args.runs)
+        print(f"  {encoding:<14} {ms:8.1f} ms  {len(encoded):>10} B  ({len(body) / len(encoded):.1f}:1)")
+
+    cache = EncodedBodyCache()
+    encoding = supported_encodings()[0]
+    cache.get("map", encoding, lambda: geo)
+    hit_ms = _median_ms(lambda: cache.get("map", encoding, lambda: geo), max(args.runs, 100))
+    print(f"  cached {encoding:<7} {hit_ms * 1000:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
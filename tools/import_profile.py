@@ -0,0 +1,74 @@
+"""Measure how long importing pymammotion takes, using ``python -X importtime``.
+
+Run from the repository root::
+
+    python tools/import_profile.py
+    python tools/import_profile.py pymammotion.mammotion.devices.mammotion --runs 7 --top 15
+
+Each run imports the target in a fresh interpreter so nothing is served from
+``sys.modules``. The report shows the median total import time, the slowest
+modules by self time, and whether the optional subsystems (LinkKit, BLE, WebRTC,
+shapely, numpy) were loaded at all.
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+DEFAULT_TARGET = "pymammotion.mammotion.devices.mammotion"
+
+# Top-level packages that should only load when their feature is used
+OPTIONAL_SUBSYSTEMS = {
+    "LinkKit": "linkkit",
+    "BLE": "bleak",
+    "WebRTC": "pymammotion.agora",
+    "shapely": "shapely",
+    "numpy": "numpy",
+}
+
+
+def import_times(module: str, cwd: Path) -> dict[str, tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter and return ``{name: (self_us, cumulative_us)}``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header row
+        times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print an import-time report for the requested modules."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=[DEFAULT_TARGET])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module (median is reported)")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args(argv)
+
+    cwd = Path(__file__).resolve().parents[1] / "Mammation.indigoPlugin" / "Contents" / "Server Plugin"
+    for module in args.modules:
+        runs = [import_times(module, cwd) for _ in range(args.runs)]
+        totals = [run[module][1] for run in runs]
+        last = runs[-1]
+        print(f"{module}: median {statistics.median(totals) / 1000:.1f} ms over {args.runs} runs")
+        for name, (self_us, _) in sorted(last.items(), key=lambda item: item[1][0], reverse=True)[: args.top]:
+            print(f"  {self_us / 1000:8.1f} ms  {name.strip()}")
+        for label, package in OPTIONAL_SUBSYSTEMS.items():
+            loaded = any(name == package or name.startswith(package + ".") for name in map(str.strip, last))
+            print(f"  {label:<8} {'loaded' if loaded else 'not loaded'}")
+
+
+if __name__ == "__main__":
+    main()
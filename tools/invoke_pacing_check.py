@@ -0,0 +1,161 @@
+"""Check that ``send_cloud_command`` never invokes faster than the account's token bucket.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/invoke_pacing_check.py
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/invoke_pacing_check.py --commands 500 --gateway-rate 1.0
+
+The real ``CloudIOTGateway.send_cloud_command`` runs against a fake API gateway
+client on an event loop with a virtual clock: whenever nothing is ready the
+clock jumps to the next timer, so a simulated minute of pacing takes
+milliseconds. ``invoke_limiter`` is given the loop's clock, so the bucket and
+the fake gateway see the same time.
+
+Two scenarios, each with every command submitted at once:
+
+``open``
+    The gateway accepts everything. No window of length ``w`` may hold more
+    than ``INVOKE_BURST + INVOKE_RATE * w`` requests.
+``throttling``
+    The gateway allows only ``--gateway-rate`` requests/s and answers 429
+    above it. The bucket must still respect its own limit, and once it has
+    adapted (second half of the run) almost no request may be rejected.
+
+Exits with status 1 if a check fails.
+"""
+
+import argparse
+import asyncio
+from types import SimpleNamespace
+import time
+
+from pymammotion.aliyun.cloud_gateway import INVOKE_BURST, INVOKE_RATE, CloudIOTGateway, TooManyRequestsException
+from pymammotion.aliyun.rate_limiter import TokenBucket
+
+# Fraction of requests in the second half of the throttling run allowed to see a 429
+SETTLED_429_FRACTION = 0.1
+
+
+class _VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock jumps to the next timer whenever nothing is ready.
+
+    Each jump is at least a microsecond: the bucket can sleep for the rounding
+    error of its token count, and adding that to the clock would not move it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._now = 0.0
+
+    def time(self) -> float:
+        return self._now
+
+    def _run_once(self) -> None:
+        if not self._ready and self._scheduled:
+            self._now = max(self._now + 1e-6, self._scheduled[0].when())
+        super()._run_once()
+
+
+class _FakeGatewayClient:
+    """Stands in for the API gateway ``Client``; records when each invoke arrived."""
+
+    def __init__(self, clock, rate: float | None, burst: float) -> None:
+        self._clock = clock
+        self._limit = TokenBucket(rate, burst, clock=clock) if rate else None
+        self.sent: list[tuple[float, int]] = []  # (time, status)
+
+    async def async_do_request(self, pathname, protocol, method, headers, body, runtime) -> SimpleNamespace:
+        status = 200 if self._limit is None or self._limit.try_acquire() else 429
+        self.sent.append((self._clock(), status))
+        return SimpleNamespace(
+            status_code=status,
+            status_message="OK" if status == 200 else "Too Many Requests",
+            headers={},
+            body=b'{"code": 200, "data": {}}',
+        )
+
+
+def _gateway(loop: asyncio.AbstractEventLoop, client: _FakeGatewayClient) -> CloudIOTGateway:
+    session = SimpleNamespace(
+        token_issued_at=int(time.time()), data=SimpleNamespace(iotToken="token", iotTokenExpire=86400)
+    )
+    gateway = CloudIOTGateway(None, session_by_authcode_response=session)
+    gateway.invoke_limiter = TokenBucket(INVOKE_RATE, INVOKE_BURST, clock=loop.time)
+    gateway._api_gateway_client = lambda: client
+    return gateway
+
+
+def _worst_excess(times: list[float], rate: float, burst: float) -> float:
+    """Largest ``count - (burst + rate * window)`` over every window of requests; <= 0 passes."""
+    worst = float("-inf")
+    for first in range(len(times)):
+        for last in range(first, len(times)):
+            worst = max(worst, (last - first + 1) - (burst + rate * (times[last] - times[first])))
+    return worst
+
+
+async def _run_commands(gateway: CloudIOTGateway, commands: int) -> dict[str, int]:
+    results = await asyncio.gather(
+        *(gateway.send_cloud_command(f"iot-{index % 3}", b"\x08\x01") for index in range(commands)),
+        return_exceptions=True,
+    )
+    outcome: dict[str, int] = {}
+    for result in results:
+        key = "ok" if isinstance(result, str) else type(result).__name__
+        outcome[key] = outcome.get(key, 0) + 1
+    return outcome
+
+
+def _scenario(name: str, commands: int, gateway_rate: float | None) -> list[str]:
+    loop = _VirtualClockLoop()
+    try:
+        client = _FakeGatewayClient(loop.time, gateway_rate, burst=2)
+        gateway = _gateway(loop, client)
+        outcome = loop.run_until_complete(_run_commands(gateway, commands))
+    finally:
+        loop.close()
+
+    times = [sent_at for sent_at, _ in client.sent]
+    rejected = sum(1 for _, status in client.sent if status == 429)
+    excess = _worst_excess(times, INVOKE_RATE, INVOKE_BURST)
+    span = times[-1] - times[0] if times else 0.0
+    print(
+        f"  {name:<11} {len(times):5d} requests in {span:7.1f}s "
+        f"({len(times) / span if span else 0:.2f}/s), 429s {rejected}, "
+        f"outcome {outcome}, final rate {gateway.invoke_limiter.rate:.2f}/s"
+    )
+
+    failures = []
+    if excess > 1e-6:
+        failures.append(f"{name}: a window exceeded burst + rate * window by {excess:.2f} requests")
+    if gateway_rate is None and (rejected or outcome.get("ok") != commands):
+        failures.append(f"{name}: expected every command to succeed, got {outcome}")
+    if gateway_rate is not None:
+        settled = client.sent[len(client.sent) // 2 :]
+        settled_rejected = sum(1 for _, status in settled if status == 429)
+        if settled and settled_rejected / len(settled) > SETTLED_429_FRACTION:
+            failures.append(f"{name}: {settled_rejected}/{len(settled)} late requests still rejected with 429")
+        if outcome.get(TooManyRequestsException.__name__, 0) > commands * SETTLED_429_FRACTION:
+            failures.append(f"{name}: too many commands gave up after {outcome}")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run both scenarios and exit non-zero if pacing was violated."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--gateway-rate", type=float, default=1.0, help="requests/s the throttling gateway allows")
+    args = parser.parse_args(argv)
+
+    print(f"bucket: {INVOKE_RATE}/s, burst {INVOKE_BURST}; {args.commands} commands submitted at once")
+    failures = _scenario("open", args.commands, None)
+    failures += _scenario("throttling", args.commands, args.gateway_rate)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        raise SystemExit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Measure asyncio loop lag while a background thread logs debug lines at a high rate.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/log_handler_benchmark.py
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/log_handler_benchmark.py --sink-ms 0.3 --rate 2000 --seconds 3
+
+No Indigo is needed: the Event Log is simulated with a fixed cost per call. The
+same load runs with debug off, with the Event Log written synchronously on the
+logging thread, through ``IndigoLogHandler``'s queue, and through the queue with
+``DebugRateLimitFilter``.
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import threading
+import time
+
+from indigo_log_handler import DebugRateLimitFilter, IndigoLogHandler
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the four configurations and print loop lag for each."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sink-ms", type=float, default=0.3, help="simulated cost of one indigo.server.log call")
+    parser.add_argument("--rate", type=int, default=2000, help="debug lines per second from the MQTT-like thread")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    def sink(message, type, isError, level):
+        time.sleep(args.sink_ms / 1000.0)
+
+    class SyncHandler(IndigoLogHandler):
+        # The previous behaviour: talk to Indigo on the logging thread
+        def emit(self, record):
+            self.write(record)
+
+    def run(label, handler, debug_on, rate_limit):
+        logger = logging.getLogger(f"bench.{label}")
+        logger.propagate = False
+        logger.handlers[:] = [handler]
+        logger.setLevel(logging.DEBUG if debug_on else logging.INFO)
+        if rate_limit:
+            handler.addFilter(DebugRateLimitFilter())
+        stop = threading.Event()
+
+        def mqtt_thread():
+            period = 1.0 / args.rate
+            n = 0
+            while not stop.is_set():
+                logger.debug(f"[SM-NOTIFY] topic=nav, payload_type=LubaMsg n={n}")
+                n += 1
+                time.sleep(period)
+
+        async def measure():
+            lags = []
+            end = time.monotonic() + args.seconds
+            while time.monotonic() < end:
+                t0 = time.perf_counter()
+                await asyncio.sleep(0.001)
+                logger.debug("loop tick")  # the loop thread logs too
+                lags.append((time.perf_counter() - t0 - 0.001) * 1000)
+            return lags
+
+        worker = threading.Thread(target=mqtt_thread, daemon=True)
+        worker.start()
+        lags = asyncio.run(measure())
+        stop.set()
+        worker.join()
+        handler.close()
+        lags.sort()
+        print(
+            f"  {label:<28} loop lag median {statistics.median(lags):6.2f} ms  "
+            f"p99 {lags[int(len(lags) * 0.99)]:6.2f} ms  max {lags[-1]:7.2f} ms"
+        )
+
+    print(f"sink {args.sink_ms} ms/call, {args.rate} debug lines/s, {args.seconds}s per run")
+    run("debug off", IndigoLogHandler("bench", server_log=sink), False, False)
+    run("debug on, synchronous", SyncHandler("bench", server_log=sink), True, False)
+    run("debug on, queued", IndigoLogHandler("bench", server_log=sink), True, False)
+    run("debug on, queued + limited", IndigoLogHandler("bench", server_log=sink), True, True)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""Replay captured MQTT traffic through ``MammotionCloud`` and measure ingest throughput.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/mqtt_replay.py capture.jsonl
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/mqtt_replay.py capture.jsonl --pace wall --speed 10
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/mqtt_replay.py --synthesize 20000 --devices 3 --save synthetic.jsonl
+
+A capture comes from :class:`pymammotion.mqtt.recorder.MqttRecorder` (set
+``PYMAMMOTION_MQTT_RECORD``); ``--synthesize`` builds one from report messages
+instead. No broker is involved: each record is handed to the same coroutine the
+MQTT client calls, so the path measured is ``_on_mqtt_message`` ->
+``_parse_mqtt_response`` -> ``_parse_message_for_device`` ->
+``MowerStateManager.notification`` -> notification subscribers. A synchronous
+subscriber that reads the updated report stands in for the plugin's, which only
+schedules ``_refresh_states`` (that needs Indigo and is not replayed).
+
+``--pace max`` feeds records back to back; ``--pace wall`` keeps the recorded
+spacing (divided by ``--speed``) and also reports how late records started.
+Allocations are measured in a second pass under ``tracemalloc``, so they do not
+distort the timings.
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import json
+import random
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from pymammotion.aliyun.model.dev_by_account_response import Device
+from pymammotion.data.model.device import MowingDevice
+from pymammotion.data.mower_state_manager import MowerStateManager
+from pymammotion.mammotion.devices.mammotion_cloud import MammotionCloud
+from pymammotion.mammotion.devices.mammotion_mower_cloud import MammotionMowerCloudDevice
+from pymammotion.mqtt.recorder import load_capture
+from pymammotion.proto import LubaMsg, MctlSys, ReportInfoData, RptDevLocation, RptDevStatus, RptWork
+
+APP_TOPIC = "/sys/app-pk/app-dn/app/down/thing/events"
+PRODUCT_KEY = "a1replay"
+
+
+class _ReplayTransport:
+    """Stands in for ``AliyunMQTT``: always connected, sends nothing."""
+
+    def __init__(self) -> None:
+        self.is_connected = True
+        self.is_ready = True
+        self.on_connected = None
+        self.on_disconnected = None
+        self.on_message = None
+        self.on_ready = None
+        self.sent = 0
+
+    def connect_async(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    async def send_cloud_command(self, iot_id: str, command: bytes) -> str:
+        self.sent += 1
+        return ""
+
+
+def _cloud_client() -> Any:
+    # MammotionBaseCloudDevice only reads the account id from the login response
+    return SimpleNamespace(
+        mammotion_http=SimpleNamespace(
+            response=SimpleNamespace(data=SimpleNamespace(userInformation=SimpleNamespace(userAccount="0")))
+        )
+    )
+
+
+def _cloud_device(iot_id: str, device_name: str) -> Device:
+    return Device.from_dict(
+        {
+            "gmtModified": 0,
+            "nodeType": "DEVICE",
+            "deviceName": device_name,
+            "productName": "Luba",
+            "status": 1,
+            "identityId": "",
+            "netType": "NET_WIFI",
+            "categoryKey": "LawnMower",
+            "productKey": PRODUCT_KEY,
+            "isEdgeGateway": False,
+            "categoryName": "LawnMower",
+            "identityAlias": "",
+            "iotId": iot_id,
+            "bindTime": 0,
+            "owned": 1,
+            "thingType": "DEVICE",
+        }
+    )
+
+
+def _protobuf_event(iot_id: str, device_name: str, msg: LubaMsg, stamp: int) -> dict[str, Any]:
+    """Return a ``thing.events`` payload carrying ``msg``, shaped like the cloud sends it."""
+    return {
+        "method": "thing.events",
+        "id": str(stamp),
+        "params": {
+            "groupIdList": [],
+            "groupId": "",
+            "categoryKey": "LawnMower",
+            "batchId": "",
+            "gmtCreate": stamp,
+            "productKey": PRODUCT_KEY,
+            "type": "info",
+            "deviceName": device_name,
+            "iotId": iot_id,
+            "checkLevel": 0,
+            "namespace": "",
+            "tenantId": "",
+            "name": "device_protobuf_msg_event",
+            "thingType": "DEVICE",
+            "time": stamp,
+            "tenantInstanceId": "",
+            "value": {"content": base64.b64encode(bytes(msg)).decode("ascii")},
+            "identifier": "device_protobuf_msg_event",
+        },
+        "version": "1.0",
+    }
+
+
+def synthesize(count: int, devices: int, interval: float = 1.0, seed: int = 1) -> list[dict[str, Any]]:
+    """Return ``count`` capture records: ``toapp_report_data`` from ``devices`` mowers at work.
+
+    Every mower reports every ``interval`` seconds with a moving position,
+    draining battery and rising progress, like ``request_iot_sys`` with the
+    active report profile.
+    """
+    rng = random.Random(seed)
+    records = []
+    for index in range(count):
+        device = index % devices
+        step = index // devices
+        iot_id, device_name = f"iot-{device + 1}", f"dev-{device + 1}"
+        report = ReportInfoData(
+            dev=RptDevStatus(sys_status=13, charge_state=0, battery_val=max(5, 100 - step // 60)),
+            locations=[
+                RptDevLocation(
+                    real_pos_x=int(rng.uniform(-200, 200) * 10000),
+                    real_pos_y=int(rng.uniform(-200, 200) * 10000),
+                    real_toward=rng.randrange(-180000, 180000),
+                    pos_type=5,
+                    zone_hash=1000 + (step // 300),
+                )
+            ],
+            work=RptWork(plan=1, path_hash=2000, progress=min(100, step // 30), area=(step // 300) % 8),
+        )
+        msg = LubaMsg(sys=MctlSys(toapp_report_data=report), timestamp=1700000000000 + index)
+        t = step * interval + device * interval / devices
+        records.append(
+            {
+                "t": t,
+                "topic": APP_TOPIC,
+                "iot_id": iot_id,
+                "payload": _protobuf_event(iot_id, device_name, msg, 1700000000000 + index),
+            }
+        )
+    return records
+
+
+class _Subscriber:
+    """Reads what the plugin's refresh would read after each notification."""
+
+    def __init__(self, state_manager: MowerStateManager) -> None:
+        self._state_manager = state_manager
+        self.count = 0
+        self.battery = 0
+
+    def on_notification(self, res: tuple[str, Any]) -> None:
+        device = self._state_manager.get_device()
+        self.count += 1
+        self.battery = device.report_data.dev.battery_val
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def replay(records: list[dict[str, Any]], pace: str = "max", speed: float = 1.0) -> dict[str, Any]:
+    """Feed ``records`` through a fresh ``MammotionCloud`` and return timings and counters."""
+    transport = _ReplayTransport()
+    cloud = MammotionCloud(transport, _cloud_client())
+    devices: dict[str, MammotionMowerCloudDevice] = {}
+    subscribers: list[_Subscriber] = []
+    for record in records:
+        iot_id = record["iot_id"]
+        if iot_id in devices:
+            continue
+        params = record["payload"].get("params", {})
+        state_manager = MowerStateManager(MowingDevice())
+        subscriber = _Subscriber(state_manager)
+        state_manager.cloud_on_notification_callback.add_subscribers(subscriber.on_notification)
+        subscribers.append(subscriber)
+        devices[iot_id] = MammotionMowerCloudDevice(
+            cloud, _cloud_device(iot_id, params.get("deviceName", iot_id)), state_manager
+        )
+
+    # Encode up front: the client hands MammotionCloud raw bytes
+    messages = [
+        (record["t"], record["topic"], json.dumps(record["payload"]).encode("utf-8"), record["iot_id"])
+        for record in records
+    ]
+    latencies: list[float] = []
+    lags: list[float] = []
+    errors = 0
+    first_t = messages[0][0] if messages else 0.0
+    gc_before = gc.get_stats()[0]["collections"]
+    start = time.perf_counter()
+    for t, topic, payload, iot_id in messages:
+        if pace == "wall":
+            due = start + (t - first_t) / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            lags.append(max(0.0, time.perf_counter() - due))
+        began = time.perf_counter()
+        try:
+            await cloud._on_mqtt_message(topic, payload, iot_id)
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    lags.sort()
+    return {
+        "messages": len(messages),
+        "devices": len(devices),
+        "elapsed": elapsed,
+        "busy": sum(latencies),
+        "latencies": latencies,
+        "lags": lags,
+        "errors": errors,
+        "notified": sum(subscriber.count for subscriber in subscribers),
+        "gc_gen0": gc.get_stats()[0]["collections"] - gc_before,
+        "commands_sent": transport.sent,
+    }
+
+
+async def measure_allocations(records: list[dict[str, Any]]) -> tuple[int, int]:
+    """Replay at max pace under tracemalloc; return (peak, retained) bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = await replay(records)
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+        return peak - baseline, current - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def _print_report(result: dict[str, Any], pace: str, allocations: tuple[int, int] | None) -> None:
+    count = result["messages"]
+    latencies = result["latencies"]
+    print(f"{count} messages from {result['devices']} device(s), pace {pace}")
+    if not count:
+        return
+    print(f"  wall time          {result['elapsed']:10.3f} s")
+    print(f"  throughput         {count / result['elapsed']:10,.0f} msgs/s")
+    print(f"  ingest capacity    {count / result['busy']:10,.0f} msgs/s (time spent in the pipeline only)")
+    print(
+        f"  latency ms         p50 {_percentile(latencies, 0.50) * 1000:7.3f}  "
+        f"p95 {_percentile(latencies, 0.95) * 1000:7.3f}  "
+        f"p99 {_percentile(latencies, 0.99) * 1000:7.3f}  max {latencies[-1] * 1000:7.3f}"
+    )
+    if result["lags"]:
+        lags = result["lags"]
+        print(
+            f"  start lag ms       p50 {_percentile(lags, 0.50) * 1000:7.3f}  "
+            f"p99 {_percentile(lags, 0.99) * 1000:7.3f}  max {lags[-1] * 1000:7.3f}"
+        )
+    print(f"  notifications      {result['notified']:10d}   errors {result['errors']}")
+    print(f"  gen0 collections   {result['gc_gen0']:10d}   ({result['gc_gen0'] * 1000 / count:.1f} per 1k msgs)")
+    if allocations is not None:
+        peak, retained = allocations
+        print(
+            f"  traced memory      peak {peak / 1024:,.0f} KiB ({peak / count:,.0f} B/msg), "
+            f"retained {retained / 1024:,.0f} KiB"
+        )
+
+
+def _save(records: list[dict[str, Any]], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Replay a capture (or a synthetic one) and print throughput, latency and allocations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", nargs="?", help="JSON-lines file written by MqttRecorder")
+    parser.add_argument("--synthesize", type=int, metavar="N", help="replay N synthetic report messages instead")
+    parser.add_argument("--devices", type=int, default=1, help="mowers in the synthetic capture")
+    parser.add_argument("--save", metavar="PATH", help="also write the synthetic capture to PATH")
+    parser.add_argument("--pace", choices=("max", "wall"), default="max")
+    parser.add_argument("--speed", type=float, default=1.0, help="wall pace: replay this many times faster")
+    parser.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args(argv)
+
+    if args.synthesize:
+        records = synthesize(args.synthesize, max(1, args.devices))
+        if args.save:
+            _save(records, args.save)
+    elif args.capture:
+        records = load_capture(args.capture)
+    else:
+        parser.error("give a capture file or --synthesize N")
+
+    async def run() -> None:
+        result = await replay(records, args.pace, args.speed)
+        allocations = None if args.no_alloc else await measure_allocations(records)
+        _print_report(result, args.pace, allocations)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Check ``TimeoutRegistry`` against the full-scan cleanup it replaced.
+
+Run from the repository root with the plugin's ``Server Plugin`` directory on the path::
+
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/timeout_registry_check.py
+    PYTHONPATH="Mammation.indigoPlugin/Contents/Server Plugin" python tools/timeout_registry_check.py --ops 200000 --seed 7
+
+A fake millisecond clock drives LinkKit's usage pattern: register a mid,
+re-register one (paho reuses mids once they wrap), ack it with ``pop``, let
+time pass, expire everything older than the timeout, occasionally ``clear``.
+A plain dict cleaned by the old full scan runs alongside as the reference.
+After every operation:
+
+* the registry holds exactly the reference entries;
+* ``pop_expired`` returns exactly what the scan removed, oldest first, and
+  never an acked or re-registered entry at its stale timestamp;
+* every live entry has a heap record at its current timestamp and the heap
+  is a valid min-heap;
+* right after each registration the heap is within the compaction bound
+  (acks leave stale records behind until the next registration or expiry).
+
+A few scripted cases pin the ordering rules first. Exits with status 1 on any
+difference.
+"""
+
+import argparse
+import random
+
+from pymammotion.mqtt.linkkit.timeout_registry import TimeoutRegistry
+
+# LinkKit's default request timeout in ms, and the mid space paho wraps around
+TIMEOUT_MS = 10_000
+MID_SPACE = 512
+
+
+def _scan_expire(reference: dict, expire_before: int) -> list[tuple[int, int]]:
+    """The previous cleanup: visit every outstanding entry."""
+    expired = [(key, timestamp) for key, timestamp in reference.items() if timestamp < expire_before]
+    for key, _ in expired:
+        del reference[key]
+    return expired
+
+
+def _heap_problems(registry: TimeoutRegistry, registered: bool) -> list[str]:
+    heap = registry._heap
+    problems = []
+    for index in range(1, len(heap)):
+        if heap[(index - 1) // 2] > heap[index]:
+            problems.append(f"heap order broken at {index}")
+            break
+    records = {(key, timestamp) for timestamp, _, key in heap}
+    missing = [(key, timestamp) for key, timestamp in registry.items() if (key, timestamp) not in records]
+    if missing:
+        problems.append(f"live entries without a heap record: {missing[:5]}")
+    if registered and len(heap) > 2 * len(registry) + 64:
+        problems.append(f"heap holds {len(heap)} records for {len(registry)} entries")
+    return problems
+
+
+def _scripted() -> list[str]:
+    failures = []
+    registry = TimeoutRegistry()
+    registry["a"], registry["b"], registry["c"] = 1, 2, 3
+    registry.pop("b")
+    registry["a"] = 5  # re-registered: its record at 1 is stale
+    if (got := registry.pop_expired(4)) != [("c", 3)]:
+        failures.append(f"ack/re-register: expected [('c', 3)], got {got}")
+    if (got := registry.pop_expired(6)) != [("a", 5)]:
+        failures.append(f"re-registered entry: expected [('a', 5)], got {got}")
+
+    registry = TimeoutRegistry()
+    for key, timestamp in (("x", 30), ("y", 10), ("z", 20), ("w", 10)):
+        registry[key] = timestamp
+    if (got := registry.pop_expired(30)) != [("y", 10), ("w", 10), ("z", 20)]:
+        failures.append(f"order: expected oldest first, ties by insertion, got {got}")
+    if (got := registry.pop_expired(30)) or dict(registry) != {"x": 30}:
+        failures.append(f"boundary: entry at expire_before must stay, got {got} / {dict(registry)}")
+
+    registry = TimeoutRegistry()
+    registry["k"] = 1
+    registry.clear()
+    registry["k"] = 9
+    if (got := registry.pop_expired(5)) or registry.pop_expired(10) != [("k", 9)]:
+        failures.append(f"clear: stale record survived, got {got}")
+    return failures
+
+
+def _fuzz(ops: int, seed: int) -> tuple[list[str], dict[str, int]]:
+    rng = random.Random(seed)
+    registry, reference = TimeoutRegistry(), {}
+    now = 0
+    counts = {"register": 0, "re-register": 0, "ack": 0, "expired": 0, "clear": 0, "compactions": 0}
+    for op in range(ops):
+        roll = rng.random()
+        if roll < 0.45:
+            key = rng.randrange(MID_SPACE)
+            counts["re-register" if key in reference else "register"] += 1
+            heap_before = len(registry._heap)
+            registry[key] = reference[key] = now
+            if len(registry._heap) <= heap_before:
+                counts["compactions"] += 1
+        elif roll < 0.85 and reference:
+            key = rng.choice(list(reference)) if rng.random() < 0.9 else rng.randrange(MID_SPACE)
+            if key in reference:
+                counts["ack"] += 1
+                if registry.pop(key) != reference.pop(key):
+                    return [f"op {op}: pop({key}) returned a different timestamp"], counts
+        elif roll < 0.9995:
+            now += rng.choice((0, 1, 5, 50, 500, 3_000))
+            heap_before = len(registry._heap)
+            expired = registry.pop_expired(now - TIMEOUT_MS)
+            expected = _scan_expire(reference, now - TIMEOUT_MS)
+            counts["expired"] += len(expired)
+            if sorted(expired) != sorted(expected):
+                return [f"op {op} t={now}: pop_expired gave {expired[:5]}, scan gave {expected[:5]}"], counts
+            if any(earlier[1] > later[1] for earlier, later in zip(expired, expired[1:])):
+                return [f"op {op} t={now}: pop_expired not oldest first: {expired[:5]}"], counts
+            if len(registry._heap) > heap_before:
+                return [f"op {op}: pop_expired grew the heap"], counts
+        else:
+            counts["clear"] += 1
+            registry.clear()
+            reference.clear()
+        if dict(registry) != reference:
+            return [f"op {op} t={now}: registry and reference differ"], counts
+        if problems := _heap_problems(registry, roll < 0.45):
+            return [f"op {op} t={now}: {problem}" for problem in problems], counts
+    return [], counts
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the scripted cases and the fuzz run; exit non-zero on any difference."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    failures = _scripted()
+    fuzz_failures, counts = _fuzz(args.ops, args.seed)
+    failures += fuzz_failures
+    print(f"{args.ops} operations, seed {args.seed}: " + ", ".join(f"{k} {v}" for k, v in counts.items()))
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        raise SystemExit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()